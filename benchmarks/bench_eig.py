@@ -0,0 +1,45 @@
+"""
+Eigen solver benchmark
+
+Compare `Matrix.top_k_eig()`, which only uses matrix-vector products, with the full QR-algorithm decomposition of `Matrix.eig()` when k is much smaller than n, on symmetric positive semi-definite matrices like the covariance matrices of PCA.
+
+Usage:
+    python benchmarks/bench_eig.py [k]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+import lalgpy as lp
+
+
+def covariance(n: int, rng) -> lp.Matrix:
+    """
+    A random n×n covariance matrix with a decaying spectrum
+    """
+    X = rng.standard_normal((2*n, n))*np.linspace(1.0, 0.01, n)
+    return lp.Matrix.from_buffer(np.ascontiguousarray(X.T @ X/(2*n)))
+
+
+def timed(function) -> tuple[float, object]:
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+
+def main(k: int) -> None:
+    rng = np.random.default_rng(0)
+    print(f"{'n':>6} {'eig()':>10} {'top_k_eig()':>12} {'speedup':>8} {'max error':>10}")
+    for n in (100, 250, 500, 1000, 2000):
+        A = covariance(n, rng)
+        # Separate copies, so neither run reuses the decomposition cached by the other
+        full_time, (full, _) = timed(lambda: lp.Matrix.from_buffer(np.asarray(A).copy()).eig())
+        top_time, (top, _) = timed(lambda: lp.Matrix.from_buffer(np.asarray(A).copy()).top_k_eig(k))
+        error = np.abs(np.subtract(top, full[:k])).max()/abs(full[0])
+        print(f"{n:>6} {full_time:>9.4f}s {top_time:>11.4f}s {full_time/top_time:>7.1f}x {error:>10.1e}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
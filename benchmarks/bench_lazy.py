@@ -0,0 +1,50 @@
+"""
+Lazy evaluation benchmark
+
+Compare eager operators with `lalgpy.lazy()` on an elementwise chain `(a + b)*2 - c` over list-backed vectors, which fuses into one pass, and on a product chain `A*B*v`, which is reordered into two matrix-vector products.
+
+Usage:
+    python benchmarks/bench_lazy.py [n]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+import lalgpy as lp
+
+
+def timed(function, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def lazily(build):
+    with lp.lazy():
+        expression = build()
+    return expression.eval()
+
+
+def main(n: int) -> None:
+    rng = np.random.default_rng(0)
+    a, b, c = (lp.Vector(*rng.random(n*100).tolist()) for _ in range(3))
+    A, B = (lp.Matrix.from_numpy(rng.random((n, n))) for _ in range(2))
+    v = lp.Vector(*rng.random(n).tolist())
+    cases = {
+        f"(a + b)*2 - c, {n*100} components": lambda: (a + b)*2 - c,
+        f"A*B*v, {n}x{n}": lambda: A*B*v,
+    }
+    print(f"{'expression':<36} {'eager':>10} {'lazy':>10} {'speedup':>8}")
+    for name, build in cases.items():
+        eager = timed(build)
+        lazy = timed(lambda: lazily(build))
+        print(f"{name:<36} {eager:>9.4f}s {lazy:>9.4f}s {eager/lazy:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
@@ -0,0 +1,58 @@
+"""
+Matrix multiplication benchmark
+
+Compare the original triple loop of `Matrix.__mul__` with the blocked pure Python kernel and with the numpy `@` path that `Matrix.__mul__` now dispatches to.
+
+Usage:
+    python benchmarks/bench_matmul.py [sizes...]
+"""
+
+import random
+import sys
+import time
+
+import lalgpy as lp
+from lalgpy.matrices import _blocked_matmul
+
+
+def naive_matmul(A: list[list], B: list[list]) -> list[list]:
+    """
+    The Matrix×Matrix loop as it was before the blocked engine
+    """
+    Arows, Acols = len(A), len(A[0])
+    Bcols = len(B[0])
+    result = [[0]*Bcols for _ in range(Arows)]
+    for j in range(Arows):
+        for i in range(Bcols):
+            result[j][i] = sum([A[j][k]*B[k][i]
+                                for k in range(Acols)])
+    return result
+
+
+def best_of(func, *args, repeat: int = 3) -> float:
+    """
+    Best wall time of `repeat` calls, in seconds
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main(sizes: list[int]) -> None:
+    print(f"{'n':>6} {'naive (s)':>12} {'blocked (s)':>12} {'Matrix * (s)':>13} {'speedup':>9}")
+    for n in sizes:
+        A = [[random.random() for _ in range(n)] for _ in range(n)]
+        B = [[random.random() for _ in range(n)] for _ in range(n)]
+        m1, m2 = lp.Matrix(*A), lp.Matrix(*B)
+        repeat = 1 if n >= 256 else 3
+        naive = best_of(naive_matmul, A, B, repeat=repeat)
+        blocked = best_of(_blocked_matmul, A, B, repeat=repeat)
+        dispatched = best_of(m1.__mul__, m2, repeat=repeat)
+        print(f"{n:>6} {naive:>12.4f} {blocked:>12.4f} {dispatched:>13.4f} {naive/dispatched:>8.0f}x")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [16, 64, 128, 256])
@@ -0,0 +1,68 @@
+"""
+Memory benchmark
+
+Measure with `tracemalloc` how much memory many live `Vector` and `Matrix` objects take, against the layouts they had before: a per-instance `__dict__` holding a list of components, and a list of row lists for matrices.
+
+Usage:
+    python benchmarks/bench_memory.py [count]
+"""
+
+import random
+import sys
+import tracemalloc
+
+import lalgpy as lp
+
+
+class DictVector:
+    """
+    The old `Vector` layout, one list of components in a per-instance `__dict__`
+    """
+    def __init__(self, *args: int | float) -> None:
+        self.__components = [*args]
+
+
+class DictMatrix:
+    """
+    The old `Matrix` layout, a list of row lists in a per-instance `__dict__`
+    """
+    def __init__(self, *args: list[int | float]) -> None:
+        self.__components = [*args]
+
+
+def traced_size(build) -> int:
+    """
+    Bytes still allocated after calling `build()`, while its result is alive
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return after - before
+
+
+def report(name: str, count: int, old: int, new: int) -> None:
+    print(f"{name:<28} {old/count:>10.1f} {new/count:>10.1f} {old/new:>8.2f}x")
+
+
+def main(count: int) -> None:
+    print(f"{'bytes per object':<28} {'before':>10} {'after':>10} {'saving':>9}")
+    for dimensions in (2, 3):
+        old = traced_size(lambda: [DictVector(*[random.random() for _ in range(dimensions)])
+                                   for _ in range(count)])
+        new = traced_size(lambda: [lp.Vector(*[random.random() for _ in range(dimensions)])
+                                   for _ in range(count)])
+        report(f"Vector, {dimensions}D", count, old, new)
+    matrices = max(count//1000, 1)
+    for n in (3, 16, 256):
+        rows = [[random.random() for _ in range(n)] for _ in range(n)]
+        old = traced_size(lambda: [DictMatrix(*[[x + 0.0 for x in row] for row in rows])
+                                   for _ in range(matrices)])
+        new = traced_size(lambda: [lp.Matrix(*rows) for _ in range(matrices)])
+        report(f"Matrix, {n}x{n}", matrices, old, new)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
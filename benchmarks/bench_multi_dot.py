@@ -0,0 +1,55 @@
+"""
+Matrix chain benchmark
+
+Compare left-to-right `A*B*C*...` with `multi_dot()` on chains of skewed shapes: the scalar multiplications each order needs, and the measured time.
+
+Usage:
+    python benchmarks/bench_multi_dot.py
+"""
+
+import time
+from functools import reduce
+
+import numpy as np
+
+import lalgpy as lp
+from lalgpy.matrices import _chain_order, multi_dot
+
+CHAINS = {
+    "wide-narrow-wide": [(1000, 20), (20, 1000), (1000, 20), (20, 1000), (1000, 10)],
+    "funnel": [(2000, 1500), (1500, 1000), (1000, 500), (500, 100), (100, 10)],
+    "projection": [(1500, 1500), (1500, 1500), (1500, 10)],
+    "8 mixed": [(50, 800), (800, 30), (30, 900), (900, 40), (40, 700), (700, 20), (20, 600), (600, 5)],
+    "chain times vector": [(800, 800), (800, 800), (800, 800), (800, 800), 800],
+}
+
+
+def left_to_right_flops(shapes: list[tuple[int, int]]) -> int:
+    flops, rows = 0, shapes[0][0]
+    for inner, cols in shapes[1:]:
+        flops += rows*inner*cols
+    return flops
+
+
+def timed(function) -> float:
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    print(f"{'chain':<20} {'left-to-right':>14} {'multi_dot':>12} {'flop saving':>12} {'time':>18}")
+    for name, shapes in CHAINS.items():
+        operands = [lp.Matrix.from_numpy(rng.random(shape)) if isinstance(shape, tuple)
+                    else lp.Vector.from_numpy(rng.random(shape)) for shape in shapes]
+        shapes = [shape if isinstance(shape, tuple) else (shape, 1) for shape in shapes]
+        naive = left_to_right_flops(shapes)
+        best = _chain_order(shapes)[0]
+        naive_time = timed(lambda: reduce(lambda a, b: a*b, operands))
+        best_time = timed(lambda: multi_dot(operands))
+        print(f"{name:<20} {naive:>14.3g} {best:>12.3g} {naive/best:>11.1f}x {naive_time:>8.3f}s/{best_time:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Nearest-neighbour benchmark
+
+Compare a Python loop of `Vector.distance()` over every candidate with the batched `nearest()`, and repeated `magnitude` reads with and without the norm cache.
+
+Usage:
+    python benchmarks/bench_nearest.py
+"""
+
+import time
+
+import numpy as np
+
+import lalgpy as lp
+
+DIMENSIONS = 32
+K = 10
+
+
+def timed(function) -> float:
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def loop_nearest(query, vectors, k):
+    distances = [lp.Vector.distance(query, v) for v in vectors]
+    return sorted(range(len(vectors)), key=distances.__getitem__)[:k]
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    print(f"{'candidates':>10} {'queries':>8} {'loop':>10} {'nearest':>10} {'speedup':>8}")
+    for count, queries in ((10000, 10), (100000, 10), (300000, 100)):
+        data = rng.random((count, DIMENSIONS))
+        vectors = [lp.Vector(*row) for row in data.tolist()]
+        candidates = lp.VectorArray(data)
+        batch = lp.VectorArray(rng.random((queries, DIMENSIONS)))
+        sample = batch[:min(queries, 3)].to_vectors()
+        loop_time = timed(lambda: [loop_nearest(q, vectors, K) for q in sample])/len(sample)*queries
+        batched_time = timed(lambda: lp.nearest(batch, candidates, K))
+        assert list(lp.nearest(sample[0], candidates, K)[0]) == loop_nearest(sample[0], vectors, K)
+        print(f"{count:>10} {queries:>8} {loop_time:>9.3f}s {batched_time:>9.3f}s {loop_time/batched_time:>7.0f}x")
+
+    vector = lp.Vector(*rng.random(1000).tolist())
+    uncached = timed(lambda: [sum([c**2 for c in vector.components])**0.5 for _ in range(10000)])
+    cached = timed(lambda: [vector.magnitude for _ in range(10000)])
+    print(f"10000 magnitude reads of a 1000-d vector: {uncached:.3f}s recomputed, {cached:.4f}s cached")
+
+
+if __name__ == "__main__":
+    main()
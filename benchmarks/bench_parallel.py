@@ -0,0 +1,40 @@
+"""
+Parallel multiplication benchmark
+
+Time `Matrix.matmul(other, workers=N)` for growing worker counts, on float and 64-bit integer matrices (thread pool) and on integers too large for 64 bits (process pool over shared memory).
+
+Usage:
+    python benchmarks/bench_parallel.py [n]
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+import lalgpy as lp
+
+
+def timed(function) -> float:
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main(n: int) -> None:
+    rng = np.random.default_rng(0)
+    cases = {
+        "float64": lp.Matrix.from_buffer(rng.random((n, n))),
+        "int64": lp.Matrix.from_buffer(rng.integers(0, 100, (n, n))),
+        "big int": lp.Matrix(*[[2**70 + int(x) for x in row] for row in rng.integers(0, 100, (n//4, n//4))]),
+    }
+    counts = sorted({1, 2, 4, 8, 16, 32, 64} & set(range(1, (os.cpu_count() or 1) + 1)))
+    print(f"{'operands':<10}" + "".join(f"{f'{w} workers':>12}" for w in counts))
+    for name, A in cases.items():
+        times = [timed(lambda: A.matmul(A, workers=w)) for w in counts]
+        print(f"{name:<10}" + "".join(f"{t:>11.3f}s" for t in times))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1024)
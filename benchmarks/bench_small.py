@@ -0,0 +1,44 @@
+"""
+Small matrix benchmark
+
+Compare `Matrix3`/`Matrix4` with the generic `Matrix` on the operations of 3D transforms: products, matrix-vector products, determinants and inverses.
+
+Usage:
+    python benchmarks/bench_small.py
+"""
+
+import timeit
+
+import numpy as np
+
+import lalgpy as lp
+
+REPEAT = 20000
+
+
+def per_call(function) -> float:
+    return min(timeit.repeat(function, number=REPEAT, repeat=3))/REPEAT*1e6
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    print(f"{'operation':<20} {'Matrix':>10} {'fixed':>10} {'speedup':>8}")
+    for cls, n in ((lp.Matrix3, 3), (lp.Matrix4, 4)):
+        rows = (rng.random((n, n)) + n*np.eye(n)).tolist()
+        other = rng.random((n, n)).tolist()
+        generic, generic_other = lp.Matrix(*rows), lp.Matrix(*other)
+        fixed, fixed_other = cls(*rows), cls(*other)
+        vector = lp.Vector(*rng.random(n).tolist())
+        cases = {
+            "product": (lambda: generic*generic_other, lambda: fixed*fixed_other),
+            "matrix-vector": (lambda: generic*vector, lambda: fixed*vector),
+            "determinant": (lambda: generic.det(), lambda: fixed.det()),
+            "inverse": (lambda: generic.inverse(), lambda: fixed.inverse()),
+        }
+        for name, (slow, fast) in cases.items():
+            slow_time, fast_time = per_call(slow), per_call(fast)
+            print(f"{f'{n}x{n} {name}':<20} {slow_time:>8.2f}us {fast_time:>8.2f}us {slow_time/fast_time:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
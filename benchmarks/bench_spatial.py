@@ -0,0 +1,65 @@
+"""
+Spatial index benchmark
+
+Compare `KDTree` with brute force over lists of `Vector`: the build time, then the time per k-nearest and radius query against a scan with `Vector.__sub__` and `magnitude`, and against the vectorized scan of `nearest()`.
+
+Usage:
+    python benchmarks/bench_spatial.py
+"""
+
+import time
+
+import numpy as np
+
+import lalgpy as lp
+
+DIMENSIONS = 3
+K = 10
+RADIUS = 0.05
+QUERIES = 200
+
+
+def timed(function) -> float:
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def brute_query(vectors, v, k):
+    distances = [(v - point).magnitude for point in vectors]
+    return sorted(range(len(vectors)), key=distances.__getitem__)[:k]
+
+
+def brute_radius(vectors, v, r):
+    return [i for i, point in enumerate(vectors) if (v - point).magnitude <= r]
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    print(f"{'points':>8} {'build':>8} {'k-NN brute':>11} {'nearest()':>10} {'tree':>9} {'radius brute':>13} {'tree':>9} {'insert':>9}")
+    for count in (10000, 100000, 1000000):
+        data = rng.random((count, DIMENSIONS))
+        vectors = [lp.Vector(*row) for row in data.tolist()]
+        points = lp.VectorArray(data)
+        queries = lp.VectorArray(rng.random((QUERIES, DIMENSIONS))).to_vectors()
+        tree = None
+
+        def build():
+            nonlocal tree
+            tree = lp.KDTree(points)
+        build_time = timed(build)
+        sample = queries[:2]
+        brute_time = timed(lambda: [brute_query(vectors, q, K) for q in sample])/len(sample)
+        radius_brute_time = timed(lambda: [brute_radius(vectors, q, RADIUS) for q in sample])/len(sample)
+        nearest_time = timed(lambda: [lp.nearest(q, points, K) for q in queries])/QUERIES
+        tree_time = timed(lambda: [tree.query(q, K) for q in queries])/QUERIES
+        radius_time = timed(lambda: [tree.query_radius(q, RADIUS) for q in queries])/QUERIES
+        assert list(tree.query(sample[0], K)[0]) == brute_query(vectors, sample[0], K)
+        assert sorted(tree.query_radius(sample[1], RADIUS)[0]) == brute_radius(vectors, sample[1], RADIUS)
+        insert_time = timed(lambda: [tree.insert(q) for q in queries])/QUERIES
+        print(f"{count:>8} {build_time:>7.3f}s {brute_time*1e3:>9.1f}ms {nearest_time*1e3:>8.2f}ms {tree_time*1e3:>7.3f}ms"
+              f" {radius_brute_time*1e3:>11.1f}ms {radius_time*1e3:>7.3f}ms {insert_time*1e3:>7.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,268 @@
+"""
+Benchmark suite
+
+Time every hot path of `Vector`, `Matrix` and `utilities` over sizes from 2 to 4096 and store the results as JSON, so two commits can be compared.
+    Vectors and `utilities.array_*` use n components, matrices are n×n, `Vector.cross` (3D only) times a batch of n products
+    Matrix benchmarks stop at 1024 unless `--full` is given, building a 4096×4096 matrix from Python lists alone takes minutes
+Each benchmark is run in an adaptive number of loops taking at least `--min-time` seconds, repeated `--repeat` times, the minimum and median time per call are kept.
+
+Usage:
+    python benchmarks/suite.py run -o results.json [--filter vector.] [--full]
+    python benchmarks/suite.py compare base.json head.json [--threshold 1.1]
+"""
+
+import argparse
+import datetime
+import json
+import math
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+import lalgpy as lp
+
+SIZES = [2**k for k in range(1, 13)]
+MATRIX_LIMIT = 1024
+
+BENCHMARKS = {}
+
+
+def benchmark(name: str, matrix: bool = False):
+    """
+    Register `setup(size, rng)`, which builds the operands and returns the function to time
+    """
+    def register(setup):
+        BENCHMARKS[name] = (setup, matrix)
+        return setup
+    return register
+
+
+def numbers(rng, size: int) -> list[float]:
+    return rng.random(size).tolist()
+
+
+def rows(rng, size: int) -> list[list[float]]:
+    return rng.random((size, size)).tolist()
+
+
+@benchmark("vector.construct")
+def _(size, rng):
+    data = numbers(rng, size)
+    return lambda: lp.Vector(*data)
+
+
+@benchmark("vector.add")
+def _(size, rng):
+    a, b = lp.Vector(*numbers(rng, size)), lp.Vector(*numbers(rng, size))
+    return lambda: a + b
+
+
+@benchmark("vector.sub")
+def _(size, rng):
+    a, b = lp.Vector(*numbers(rng, size)), lp.Vector(*numbers(rng, size))
+    return lambda: a - b
+
+
+@benchmark("vector.scalar_mul")
+def _(size, rng):
+    a = lp.Vector(*numbers(rng, size))
+    return lambda: a*2.5
+
+
+@benchmark("vector.truediv")
+def _(size, rng):
+    a = lp.Vector(*numbers(rng, size))
+    return lambda: a/2.5
+
+
+@benchmark("vector.floordiv")
+def _(size, rng):
+    a = lp.Vector(*numbers(rng, size))
+    return lambda: a//0.25
+
+
+@benchmark("vector.dot")
+def _(size, rng):
+    a, b = lp.Vector(*numbers(rng, size)), lp.Vector(*numbers(rng, size))
+    return lambda: lp.Vector.dot(a, b)
+
+
+@benchmark("vector.cross")
+def _(size, rng):
+    pairs = [(lp.Vector(*numbers(rng, 3)), lp.Vector(*numbers(rng, 3))) for _ in range(size)]
+    cross = lp.Vector.cross
+    return lambda: [cross(a, b) for a, b in pairs]
+
+
+@benchmark("vector.get_angle")
+def _(size, rng):
+    a, b = lp.Vector(*numbers(rng, size)), lp.Vector(*numbers(rng, size))
+    return lambda: lp.Vector.get_angle(a, b)
+
+
+@benchmark("vector.magnitude")
+def _(size, rng):
+    a = lp.Vector(*numbers(rng, size))
+    return lambda: a.magnitude
+
+
+@benchmark("vector.magnitude_uncached")
+def _(size, rng):
+    data = numbers(rng, size)
+    return lambda: lp.Vector._from_trusted(data).magnitude
+
+
+@benchmark("matrix.construct", matrix=True)
+def _(size, rng):
+    data = rows(rng, size)
+    return lambda: lp.Matrix(*data)
+
+
+@benchmark("matrix.add", matrix=True)
+def _(size, rng):
+    A, B = lp.Matrix(*rows(rng, size)), lp.Matrix(*rows(rng, size))
+    return lambda: A + B
+
+
+@benchmark("matrix.sub", matrix=True)
+def _(size, rng):
+    A, B = lp.Matrix(*rows(rng, size)), lp.Matrix(*rows(rng, size))
+    return lambda: A - B
+
+
+@benchmark("matrix.mul_scalar", matrix=True)
+def _(size, rng):
+    A = lp.Matrix(*rows(rng, size))
+    return lambda: A*2.5
+
+
+@benchmark("matrix.mul_vector", matrix=True)
+def _(size, rng):
+    A, v = lp.Matrix(*rows(rng, size)), lp.Vector(*numbers(rng, size))
+    return lambda: A*v
+
+
+@benchmark("matrix.mul_matrix", matrix=True)
+def _(size, rng):
+    A, B = lp.Matrix(*rows(rng, size)), lp.Matrix(*rows(rng, size))
+    return lambda: A*B
+
+
+for _name in ("array_add", "array_sub", "array_mul", "array_truediv", "array_floordiv"):
+    def _pairwise(size, rng, function=getattr(lp, _name)):
+        a, b = numbers(rng, size), [x + 1 for x in numbers(rng, size)]
+        return lambda: function(a, b)
+    benchmark(f"utilities.{_name}")(_pairwise)
+
+for _name in ("array_scalar_mul", "array_scalar_truediv", "array_floor_div"):
+    def _scalar(size, rng, function=getattr(lp, _name)):
+        a = numbers(rng, size)
+        return lambda: function(a, 0.25)
+    benchmark(f"utilities.{_name}")(_scalar)
+
+
+def measure(function, repeat: int, min_time: float) -> dict:
+    """
+    The time per call of `function`, from `repeat` runs of enough loops to last `min_time` seconds
+    """
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            function()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        loops *= 10 if elapsed < min_time/10 else 2
+    times = [elapsed/loops]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(loops):
+            function()
+        times.append((time.perf_counter() - start)/loops)
+    return {"min": min(times), "median": statistics.median(times), "loops": loops, "repeat": repeat}
+
+
+def metadata() -> dict:
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "date": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+def run(arguments) -> None:
+    limit = max(SIZES) if arguments.full else MATRIX_LIMIT
+    results = {}
+    for name, (setup, matrix) in BENCHMARKS.items():
+        if arguments.filter and arguments.filter not in name:
+            continue
+        results[name] = {}
+        for size in SIZES:
+            if matrix and size > limit:
+                continue
+            # Seeded per size, so a filtered run times the same operands as a full one
+            timing = measure(setup(size, np.random.default_rng(size)), arguments.repeat, arguments.min_time)
+            results[name][str(size)] = timing
+            print(f"{name:<32} {size:>5} {timing['median']*1e6:>14.2f}us", flush=True)
+    document = {"metadata": metadata(), "results": results}
+    if arguments.output:
+        with open(arguments.output, "w") as file:
+            json.dump(document, file, indent=1)
+        print(f"Saved {sum(map(len, results.values()))} results to {arguments.output}")
+
+
+def compare(arguments) -> int:
+    with open(arguments.base) as file:
+        base = json.load(file)["results"]
+    with open(arguments.head) as file:
+        head = json.load(file)["results"]
+    regressions = 0
+    print(f"{'benchmark':<32} {'size':>5} {'base':>12} {'head':>12} {'ratio':>7}")
+    for name in sorted(base.keys() & head.keys()):
+        for size in sorted(base[name].keys() & head[name].keys(), key=int):
+            before, after = base[name][size]["min"], head[name][size]["min"]
+            ratio = after/before if before else math.inf
+            flag = ""
+            if ratio > arguments.threshold:
+                flag, regressions = "  slower", regressions + 1
+            elif ratio < 1/arguments.threshold:
+                flag = "  faster"
+            print(f"{name:<32} {size:>5} {before*1e6:>10.2f}us {after*1e6:>10.2f}us {ratio:>6.2f}x{flag}")
+    print(f"{regressions} regression(s) above {arguments.threshold}x")
+    return 1 if regressions else 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    runner = commands.add_parser("run", help="run the benchmarks")
+    runner.add_argument("-o", "--output", help="the JSON file to write")
+    runner.add_argument("--filter", help="only run the benchmarks whose name contains this text")
+    runner.add_argument("--full", action="store_true", help=f"run matrix benchmarks past {MATRIX_LIMIT} up to {max(SIZES)}")
+    runner.add_argument("--repeat", type=int, default=3)
+    runner.add_argument("--min-time", type=float, default=0.05, help="seconds per repeat")
+    comparer = commands.add_parser("compare", help="compare two result files")
+    comparer.add_argument("base")
+    comparer.add_argument("head")
+    comparer.add_argument("--threshold", type=float, default=1.1, help="the time ratio flagged as a regression")
+    arguments = parser.parse_args()
+    if arguments.command == "run":
+        run(arguments)
+        return 0
+    return compare(arguments)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
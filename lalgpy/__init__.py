@@ -1,5 +1,11 @@
-__all__ = ["exceptions", "utilities","vectors", "matrices"]
+__all__ = ["config", "exceptions", "serialization", "utilities", "backends", "vectors", "matrices", "expressions", "spatial", "solvers"]
+from .config import *
 from .exceptions import *
+from .serialization import *
 from .utilities import *
+from .backends import *
 from .vectors import *
 from .matrices import *
+from .expressions import *
+from .spatial import *
+from .solvers import *
@@ -0,0 +1,349 @@
+"""
+Compute backends
+
+A backend implements the kernels the arithmetic of `Vector` and `Matrix` runs on: elementwise operations, dot and cross products, matrix and matrix-vector products and norms. `config.set_backend(name)` routes every kernel to one backend, by default ("auto") each operation picks its own strategy from the type and size of its operands, see `utilities`.
+Registered backends:
+    python: pure Python loops over Python numbers, the reference the other backends are tested against. Typed buffers come back as Python numbers
+    numpy: one numpy kernel per operation
+    numba: loops compiled by Numba when it is installed. Without Numba the same loops run as plain Python over numpy arrays, so the backend always works, only slower
+Other backends can be added with `register_backend()`.
+"""
+
+import math
+import operator
+from abc import ABC, abstractmethod
+import numpy as np
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+__all__ = ["Backend", "register_backend", "available_backends"]
+
+_OPERATORS = {"add": operator.add, "sub": operator.sub, "mul": operator.mul, "truediv": operator.truediv, "floordiv": operator.floordiv}
+_UFUNCS = {"add": np.add, "sub": np.subtract, "mul": np.multiply, "truediv": np.true_divide, "floordiv": np.floor_divide}
+_SYMBOLS = {"add": "+", "sub": "-", "mul": "*", "truediv": "/", "floordiv": "//"}
+
+# The backends `config.set_backend()` can select, by name
+_registry = {}
+
+
+class Backend(ABC):
+    """
+    `Backend` is the abstract interface every backend implements, a subclass missing one of the methods cannot be instantiated, so it never reaches `register_backend()`. The operands are the storages of vectors and matrices: lists or one-dimensional numpy arrays for vectors, two-dimensional numpy arrays for matrices, dimensions already checked. A kernel may return a list (of rows for a matrix) or a numpy array, lists are turned into buffers of the type numpy gives their elements
+
+    Methods
+    -------
+    elementwise(self, op: str, a, b)
+        `a op b` element by element, op is "add", "sub", "mul", "truediv" or "floordiv", b is an array of the same shape or a scalar
+    dot(self, a, b)
+        The dot product of two vectors as a Python number
+    cross(self, a, b)
+        The cross product of two 3D vectors
+    matmul(self, A, B)
+        The matrix product
+    matvec(self, A, x)
+        The matrix-vector product
+    norm(self, a, ord)
+        The L1, L2 or L∞ norm of a vector as a Python number
+    """
+
+    @abstractmethod
+    def elementwise(self, op: str, a, b):
+        raise NotImplementedError
+
+    @abstractmethod
+    def dot(self, a, b):
+        raise NotImplementedError
+
+    @abstractmethod
+    def cross(self, a, b):
+        raise NotImplementedError
+
+    @abstractmethod
+    def matmul(self, A, B):
+        raise NotImplementedError
+
+    @abstractmethod
+    def matvec(self, A, x):
+        raise NotImplementedError
+
+    @abstractmethod
+    def norm(self, a, ord):
+        raise NotImplementedError
+
+
+def _euclidean(data: np.ndarray) -> float:
+    """
+    The Euclidean norm of a numpy array, scaled by the largest magnitude when the squares leave the float range, so like `math.hypot()` it only overflows or underflows when the norm itself does
+    """
+    if not data.size:
+        return 0.0
+    with np.errstate(over="ignore", under="ignore"):
+        value = float(np.linalg.norm(data))
+    if math.sqrt(np.finfo(np.result_type(data.dtype, 1.0)).tiny) < value < math.inf:
+        return value
+    scale = float(np.abs(data).max())
+    if not 0 < scale < math.inf:
+        return scale
+    return scale*float(np.linalg.norm(data/scale))
+
+
+def _python(a):
+    """
+    Python numbers, lists are used as they are
+    """
+    return a.tolist() if isinstance(a, np.ndarray) else a
+
+
+class _PythonBackend(Backend):
+    """
+    Pure Python loops, the reference implementation
+    """
+
+    def elementwise(self, op: str, a, b):
+        function = _OPERATORS[op]
+        a, b = _python(a), _python(b)
+        if a and isinstance(a[0], list):
+            if isinstance(b, list):
+                return [list(map(function, row, other)) for row, other in zip(a, b)]
+            return [[function(c, b) for c in row] for row in a]
+        if isinstance(b, list):
+            return list(map(function, a, b))
+        return [function(c, b) for c in a]
+
+    def dot(self, a, b):
+        return sum(map(operator.mul, _python(a), _python(b)))
+
+    def cross(self, a, b):
+        (x1, y1, z1), (x2, y2, z2) = _python(a), _python(b)
+        return [y1*z2 - z1*y2, z1*x2 - x1*z2, x1*y2 - y1*x2]
+
+    def matmul(self, A, B):
+        columns = list(zip(*_python(B)))
+        return [[sum(map(operator.mul, row, column)) for column in columns] for row in _python(A)]
+
+    def matvec(self, A, x):
+        x = _python(x)
+        return [sum(map(operator.mul, row, x)) for row in _python(A)]
+
+    def norm(self, a, ord):
+        magnitudes = list(map(abs, _python(a)))
+        if ord == 1:
+            return float(sum(magnitudes))
+        if ord == 2:
+            return math.hypot(*magnitudes)
+        return float(max(magnitudes, default=0))
+
+
+class _NumpyBackend(Backend):
+    """
+    One numpy kernel per operation
+    """
+
+    def elementwise(self, op: str, a, b):
+        return _UFUNCS[op](np.asarray(a), np.asarray(b) if isinstance(b, list) else b)
+
+    def dot(self, a, b):
+        return np.dot(np.asarray(a), np.asarray(b)).item()
+
+    def cross(self, a, b):
+        return np.cross(np.asarray(a), np.asarray(b))
+
+    def matmul(self, A, B):
+        return A @ B
+
+    def matvec(self, A, x):
+        return A @ np.asarray(x)
+
+    def norm(self, a, ord):
+        a = np.asarray(a)
+        if ord == 2:
+            return _euclidean(a)
+        return float(np.linalg.norm(a, ord)) if a.size else 0.0
+
+
+def _compile(function):
+    """
+    Compile a loop kernel with Numba when it is installed, keep the Python function otherwise
+    """
+    return numba.njit(function) if numba is not None else function
+
+
+# Compiled elementwise loops, by operation and whether the second operand is a scalar
+_loops = {}
+
+
+def _elementwise_loop(op: str, scalar: bool):
+    """
+    The compiled loop of one elementwise operation over one-dimensional arrays
+    """
+    key = (op, scalar)
+    if key not in _loops:
+        index = "" if scalar else "[i]"
+        source = (f"def loop(a, b, out):\n"
+                  f"    for i in range(out.shape[0]):\n"
+                  f"        out[i] = a[i] {_SYMBOLS[op]} b{index}\n")
+        namespace = {}
+        exec(compile(source, f"<{op} loop>", "exec"), namespace)
+        _loops[key] = _compile(namespace["loop"])
+    return _loops[key]
+
+
+def _dot_loop(a, b):
+    """
+    The dot product of two one-dimensional arrays of the same type, at least one element
+    """
+    total = a[0]*b[0]
+    for i in range(1, a.shape[0]):
+        total += a[i]*b[i]
+    return total
+
+
+def _matmul_loop(A, B, out):
+    """
+    Accumulate `A @ B` into the zeroed `out`, in i-k-j order so the innermost loop walks rows
+    """
+    for i in range(A.shape[0]):
+        for k in range(A.shape[1]):
+            a = A[i, k]
+            for j in range(B.shape[1]):
+                out[i, j] += a*B[k, j]
+
+
+def _matvec_loop(A, x, out):
+    """
+    Accumulate `A @ x` into the zeroed `out`
+    """
+    for i in range(A.shape[0]):
+        total = out[i]
+        for j in range(A.shape[1]):
+            total += A[i, j]*x[j]
+        out[i] = total
+
+
+def _norm_loop(a, ord):
+    """
+    The L1, L2 or L∞ norm of a one-dimensional array, ord given as a float
+
+    The L2 norm sums the squares of the magnitudes divided by the largest one, like `math.hypot()`, so it only overflows or underflows when the norm itself does
+    """
+    total = 0.0
+    largest = 0.0
+    for i in range(a.shape[0]):
+        magnitude = abs(a[i])
+        if ord == 1:
+            total += magnitude
+        elif magnitude > largest:
+            largest = magnitude
+    if ord == 1:
+        return total
+    if ord != 2 or largest == 0.0 or largest == math.inf:
+        return largest
+    for i in range(a.shape[0]):
+        scaled = abs(a[i])/largest
+        total += scaled*scaled
+    return largest*math.sqrt(total)
+
+
+_dot_loop = _compile(_dot_loop)
+_matmul_loop = _compile(_matmul_loop)
+_matvec_loop = _compile(_matvec_loop)
+_norm_loop = _compile(_norm_loop)
+
+
+class _NumbaBackend(Backend):
+    """
+    Explicit loops over numpy arrays, compiled by Numba when it is installed. Integers too large for 64 bits cannot be compiled and go to the Python backend
+    """
+
+    compiled = numba is not None
+
+    def __init__(self, fallback: Backend) -> None:
+        self.__fallback = fallback
+
+    def elementwise(self, op: str, a, b):
+        a = np.asarray(a)
+        scalar = not isinstance(b, (list, np.ndarray))
+        b = b if scalar else np.asarray(b)
+        if a.dtype == object or (not scalar and b.dtype == object):
+            return self.__fallback.elementwise(op, a, b)
+        dtype = _UFUNCS[op](a[:0], b if scalar else b[:0]).dtype
+        out = np.empty(a.shape, dtype=dtype)
+        b = dtype.type(b) if scalar else b.astype(dtype, copy=False).ravel()
+        _elementwise_loop(op, scalar)(a.astype(dtype, copy=False).ravel(), b, out.reshape(-1))
+        return out
+
+    def dot(self, a, b):
+        a, b = np.asarray(a), np.asarray(b)
+        if a.dtype == object or b.dtype == object:
+            return self.__fallback.dot(a, b)
+        if not a.size:
+            return 0
+        dtype = np.result_type(a, b)
+        result = _dot_loop(a.astype(dtype, copy=False), b.astype(dtype, copy=False))
+        return result.item() if isinstance(result, np.generic) else result
+
+    def cross(self, a, b):
+        return np.asarray(self.__fallback.cross(a, b))
+
+    def matmul(self, A, B):
+        if A.dtype == object or B.dtype == object:
+            return self.__fallback.matmul(A, B)
+        dtype = np.result_type(A, B)
+        out = np.zeros((A.shape[0], B.shape[1]), dtype=dtype)
+        _matmul_loop(np.ascontiguousarray(A, dtype=dtype), np.ascontiguousarray(B, dtype=dtype), out)
+        return out
+
+    def matvec(self, A, x):
+        x = np.asarray(x)
+        if A.dtype == object or x.dtype == object:
+            return self.__fallback.matvec(A, x)
+        dtype = np.result_type(A, x)
+        out = np.zeros(A.shape[0], dtype=dtype)
+        _matvec_loop(np.ascontiguousarray(A, dtype=dtype), x.astype(dtype, copy=False), out)
+        return out
+
+    def norm(self, a, ord):
+        a = np.asarray(a)
+        if a.dtype == object:
+            return self.__fallback.norm(a, ord)
+        return float(_norm_loop(a, float(ord)))
+
+
+def register_backend(name: str, backend: Backend) -> None:
+    """
+    Make a backend selectable with `config.set_backend(name)`
+
+    Parameters
+    ----------
+    name: str
+        The backend name, registering an existing name replaces that backend
+    backend: Backend
+        The kernels
+
+    Raises
+    ------
+    TypeError
+        If the backend is not a `Backend`
+    ValueError
+        If the name is "auto", which is reserved for the default strategy
+    """
+    if not isinstance(backend, Backend):
+        raise TypeError("register_backend() accept a `Backend` instance")
+    if name == "auto":
+        raise ValueError("The backend name 'auto' is reserved")
+    _registry[name] = backend
+
+
+def available_backends() -> list[str]:
+    """
+    The names `config.set_backend()` accepts, "auto" first
+    """
+    return ["auto", *_registry]
+
+
+register_backend("python", _PythonBackend())
+register_backend("numpy", _NumpyBackend())
+register_backend("numba", _NumbaBackend(_registry["python"]))
@@ -0,0 +1,204 @@
+"""
+Global settings
+"""
+
+from contextlib import contextmanager
+
+__all__ = ["set_validation", "get_validation", "validation", "set_num_threads", "get_num_threads", "num_threads",
+           "set_lazy", "get_lazy", "lazy", "set_backend", "get_backend", "backend"]
+
+_validate = True
+
+
+def set_validation(enabled: bool) -> None:
+    """
+    Turn input validation on or off
+
+    When validation is off, `Vector()` and `Matrix()` no longer check the type of every component, only the structure of the input is checked. Use it for arithmetic-heavy code whose inputs are already known to be numbers
+
+    Parameters
+    ----------
+    enabled: bool
+        True to check every component (the default), False to skip the checks
+    """
+    global _validate
+    _validate = bool(enabled)
+
+
+def get_validation() -> bool:
+    """
+    Whether input validation is currently on
+    """
+    return _validate
+
+
+@contextmanager
+def validation(enabled: bool):
+    """
+    Validation context
+
+    Turn input validation on or off inside a `with` block and restore the previous setting when leaving it
+
+    Parameters
+    ----------
+    enabled: bool
+        The validation setting inside the block
+    """
+    previous = _validate
+    set_validation(enabled)
+    try:
+        yield
+    finally:
+        set_validation(previous)
+
+
+_num_threads = 1
+
+
+def set_num_threads(workers: int) -> None:
+    """
+    Set how many workers matrix products run on
+
+    Products of large matrices are split into row blocks computed in parallel, on a thread pool for machine numbers and on a process pool for integers too large for 64 bits. `Matrix.matmul(other, workers=...)` overrides it for one product
+
+    Parameters
+    ----------
+    workers: int
+        The number of workers, 1 (the default) to run every product on the calling thread, `os.cpu_count()` to use every core
+
+    Raises
+    ------
+    ValueError
+        If workers is not a positive integer
+    """
+    global _num_threads
+    if not isinstance(workers, int) or isinstance(workers, bool) or workers < 1:
+        raise ValueError("The number of workers should be a positive integer")
+    _num_threads = workers
+
+
+def get_num_threads() -> int:
+    """
+    How many workers matrix products currently run on
+    """
+    return _num_threads
+
+
+@contextmanager
+def num_threads(workers: int):
+    """
+    Worker count context
+
+    Set the number of workers inside a `with` block and restore the previous setting when leaving it
+
+    Parameters
+    ----------
+    workers: int
+        The number of workers inside the block
+    """
+    previous = _num_threads
+    set_num_threads(workers)
+    try:
+        yield
+    finally:
+        set_num_threads(previous)
+
+
+_lazy = False
+
+
+def set_lazy(enabled: bool) -> None:
+    """
+    Turn lazy evaluation on or off
+
+    While lazy evaluation is on, the arithmetic operators of `Vector` and `Matrix` build an `Expression` graph instead of computing the result. Evaluating the graph fuses chains of elementwise operations into one pass and multiplies chains of matrices in the cheapest order, so `A*B*v` runs as `A*(B*v)`. An expression is evaluated by `Expression.eval()`, or implicitly as soon as its value is used
+
+    Parameters
+    ----------
+    enabled: bool
+        True to build expressions, False to compute every operation right away (the default)
+    """
+    global _lazy
+    _lazy = bool(enabled)
+
+
+def get_lazy() -> bool:
+    """
+    Whether lazy evaluation is currently on
+    """
+    return _lazy
+
+
+@contextmanager
+def lazy(enabled: bool = True):
+    """
+    Lazy evaluation context
+
+    Turn lazy evaluation on or off inside a `with` block and restore the previous setting when leaving it
+
+    Parameters
+    ----------
+    enabled: bool (default True)
+        The lazy setting inside the block
+    """
+    previous = _lazy
+    set_lazy(enabled)
+    try:
+        yield
+    finally:
+        set_lazy(previous)
+
+
+_backend = None
+_backend_name = "auto"
+
+
+def set_backend(name: str) -> None:
+    """
+    Select the compute backend
+
+    Every kernel of `Vector` and `Matrix` arithmetic (elementwise operations, dot and cross products, matrix and matrix-vector products, norms) and of the `utilities.array_*` functions runs on the selected backend, see `lalgpy.backends`
+
+    Parameters
+    ----------
+    name: str
+        "auto" (the default) to let each operation pick its strategy, or a registered backend: "python", "numpy", "numba", or any name added with `backends.register_backend()`
+
+    Raises
+    ------
+    ValueError
+        If no backend has that name
+    """
+    global _backend, _backend_name
+    from .backends import _registry
+    if name != "auto" and name not in _registry:
+        raise ValueError(f"Unknown backend {name!r}, expected one of {', '.join(['auto', *_registry])}")
+    _backend = None if name == "auto" else _registry[name]
+    _backend_name = name
+
+
+def get_backend() -> str:
+    """
+    The name of the current compute backend
+    """
+    return _backend_name
+
+
+@contextmanager
+def backend(name: str):
+    """
+    Backend context
+
+    Select a compute backend inside a `with` block and restore the previous one when leaving it
+
+    Parameters
+    ----------
+    name: str
+        The backend inside the block
+    """
+    previous = _backend_name
+    set_backend(name)
+    try:
+        yield
+    finally:
+        set_backend(previous)
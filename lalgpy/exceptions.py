@@ -3,3 +3,17 @@ class DimensionsError(Exception):
     Dimensional related error
     """
     pass
+
+class SingularMatrixError(Exception):
+    """
+    Raised when an operation needs an invertible matrix but the matrix is singular
+    """
+    pass
+
+class ConvergenceError(Exception):
+    """
+    Raised when an iterative solver does not reach its tolerance within the iteration limit, the last iterate is kept in `solution`
+    """
+    def __init__(self, message: str, solution=None) -> None:
+        super().__init__(message)
+        self.solution = solution
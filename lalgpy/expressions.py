@@ -0,0 +1,298 @@
+"""
+Lazy expressions
+
+While lazy evaluation is on, see `config.set_lazy()`, the arithmetic operators of `Vector` and `Matrix` return an `Expression` instead of their result. Evaluation happens once the whole expression is known:
+    A chain of elementwise operations (+, -, and *, /, // by scalars) runs in one fused pass. On vectors holding Python lists, it is one list comprehension over all the operands instead of one intermediate list per operator. On numpy buffers, the operators write into one temporary buffer instead of allocating one per operator
+    A chain of products `A*B*...*v` is multiplied in the order with the fewest scalar multiplications, so `A*B*v` runs as `A*(B*v)` and never forms the matrix `A*B`
+"""
+
+import operator
+import numpy as np
+from . import config
+from .exceptions import *
+from .vectors import Vector
+from .matrices import Matrix, _chain_product
+
+__all__ = ["Expression"]
+
+_UFUNCS = {"+": np.add, "-": np.subtract, "*": np.multiply, "/": np.true_divide, "//": np.floor_divide}
+_OPERATORS = {"+": operator.add, "-": operator.sub, "*": operator.mul, "/": operator.truediv, "//": operator.floordiv}
+
+# Fused list kernels compiled so far, by the source of their expression
+_kernels = {}
+
+
+def _shape(operand) -> tuple | None:
+    """
+    The shape of a vector, a matrix or an expression, (n,) for vectors, None for anything else
+    """
+    if isinstance(operand, Expression):
+        return operand._shape()
+    if isinstance(operand, Vector):
+        return (operand.dimensions,)
+    if isinstance(operand, Matrix):
+        return operand.dimensions
+    return None
+
+
+def _value(operand):
+    """
+    The value of an operand, evaluating it if it is an expression
+    """
+    return operand.eval() if isinstance(operand, Expression) else operand
+
+
+def _list_kernel(source: str, inputs: int, scalars: int):
+    """
+    The compiled function running the fused elementwise `source` over lists, one element of every input at a time
+    """
+    key = (source, inputs, scalars)
+    if key not in _kernels:
+        arrays = ", ".join(f"x{i}" for i in range(inputs))
+        elements = "".join(f"a{i}, " for i in range(inputs))
+        parameters = ", ".join([arrays] + [f"s{i}" for i in range(scalars)])
+        code = f"lambda {parameters}: [{source} for {elements}in zip({arrays})]"
+        _kernels[key] = eval(compile(code, "<fused kernel>", "eval"), {})
+    return _kernels[key]
+
+
+class Expression:
+    """
+Lazy expressions
+
+    `Expression` is a node of the graph built by the `Vector` and `Matrix` operators while lazy evaluation is on. It stands for the vector or matrix it evaluates to, and is evaluated once, on the first `eval()` or the first use of its value
+    Supported operations: the operators of the value it stands for, lazily while lazy evaluation is on, on the evaluated value otherwise
+    Supported statements:
+        Equality(==) and Non-equality(!=), compared by value
+    Representation:
+        The representation of the evaluated value
+
+    Attributes
+    ----------
+    __op: str
+        "+", "-", "*", "/" or "//" for elementwise operations, with a scalar as the second operand of "*", "/" and "//", or "@" for a chain of products
+    __operands: list
+        The operands, vectors, matrices, expressions and scalars. A chain of products holds all its factors
+    __shape: tuple
+        (n,) for a vector result, (rows, cols) for a matrix result
+    __value: Vector | Matrix | None
+        The evaluated value, None until the expression is evaluated
+
+    Properties
+    ----------
+    dimensions(self) -> int | tuple
+        The dimensions of the result, known without evaluating
+    components(self)
+        The components of the evaluated value
+
+    Methods
+    -------
+    eval(self) -> Vector | Matrix
+        Evaluate the expression
+    Any other attribute is looked up on the evaluated value
+    """
+
+    __slots__ = ("__op", "__operands", "__shape", "__value")
+
+    @classmethod
+    def _node(cls, op: str, left, right):
+        """
+        The expression of `left op right`, or NotImplemented for operands that do not support the operator
+
+        Raises
+        ------
+        TypeError
+            For the products of a vector and anything else but a scalar, and for divisions by anything else but a scalar
+        DimensionsError
+            If the operands dimensions are not compatible
+        """
+        shape = _shape(left)
+        if shape is None:
+            return NotImplemented
+        if op in ("+", "-"):
+            if _shape(right) is None or len(_shape(right)) != len(shape):
+                return NotImplemented
+            if _shape(right) != shape:
+                raise DimensionsError(f"Operator `{op}` required two operands with the same dimensions")
+            operands = [left, right]
+        elif isinstance(right, (int, float, complex)):
+            operands = [left, right]
+        elif op != "*":
+            raise TypeError(f"Division using `{op}` is for scalar only")
+        elif len(shape) == 1:
+            raise TypeError("Vector multiplication using `*` is for scalar only, if you want vectors multiplication, use Vector.dot(v1, v2) or Vector.cross(v1, v2)")
+        else:
+            other = _shape(right)
+            if other is None:
+                return NotImplemented
+            if shape[1] != other[0]:
+                raise DimensionsError("Incompatible operands for multiplication, expected matrix in the form m×n to be multiply by n×p or by 1×n vector")
+            op = "@"
+            shape = (shape[0],) if len(other) == 1 else (shape[0], other[1])
+            operands = [*cls.__factors(left), *cls.__factors(right)]
+        node = cls.__new__(cls)
+        node.__op = op
+        node.__operands = operands
+        node.__shape = shape
+        node.__value = None
+        return node
+
+    @staticmethod
+    def __factors(operand) -> list:
+        """
+        The factors of a product chain, so nested products are reordered together
+        """
+        if isinstance(operand, Expression) and operand.__op == "@":
+            return operand.__operands
+        return [operand]
+
+    def _shape(self) -> tuple:
+        """
+        The shape of the result, (n,) for a vector
+        """
+        return self.__shape
+
+    @property
+    def dimensions(self) -> int | tuple:
+        """
+        The dimensions of the result, an int for a vector and (rows, cols) for a matrix, known without evaluating
+        """
+        return self.__shape[0] if len(self.__shape) == 1 else self.__shape
+
+    @property
+    def components(self):
+        """
+        The components of the evaluated value
+        """
+        return self.eval().components
+
+    def eval(self):
+        """
+        Evaluate the expression
+
+        The value is computed on the first call and kept, so the operands are read at that time, not when the expression was built
+
+        Return
+        ------
+        The `Vector` or `Matrix` the expression stands for
+        """
+        if self.__value is None:
+            with config.lazy(False):
+                if self.__op == "@":
+                    self.__value = _chain_product([_value(operand) for operand in self.__operands])
+                else:
+                    self.__value = self.__fused()
+        return self.__value
+
+    def __elementwise(self, operand) -> bool:
+        """
+        Whether the operand is an elementwise expression that still has to be evaluated, and so can be fused
+        """
+        return isinstance(operand, Expression) and operand.__op != "@" and operand.__value is None
+
+    def __source(self, inputs: list, scalars: list) -> str:
+        """
+        The Python source of one element of the fused expression, collecting its vector inputs and scalars
+        """
+        terms = []
+        for operand in self.__operands:
+            if self.__elementwise(operand):
+                terms.append(operand.__source(inputs, scalars))
+            elif isinstance(operand, (int, float, complex)):
+                scalars.append(operand)
+                terms.append(f"s{len(scalars) - 1}")
+            else:
+                inputs.append(_value(operand))
+                terms.append(f"a{len(inputs) - 1}")
+        return f"({terms[0]} {self.__op} {terms[1]})"
+
+    def __array(self) -> tuple[np.ndarray, bool]:
+        """
+        The fused expression on numpy buffers, and whether the result is a temporary that later operators may overwrite
+        """
+        arrays = []
+        for operand in self.__operands:
+            if self.__elementwise(operand):
+                arrays.append(operand.__array())
+            elif isinstance(operand, (int, float, complex)):
+                arrays.append((operand, False))
+            else:
+                arrays.append((np.asarray(_value(operand)._storage()), False))
+        (a, a_owned), (b, b_owned) = arrays
+        ufunc = _UFUNCS[self.__op]
+        dtype = np.result_type(a, b, 1.0) if ufunc is np.true_divide else np.result_type(a, b)
+        if a_owned and a.dtype == dtype:
+            return ufunc(a, b, out=a), True
+        if b_owned and b.dtype == dtype:
+            return ufunc(a, b, out=b), True
+        return ufunc(a, b), True
+
+    def __fused(self):
+        """
+        Evaluate a chain of elementwise operations in one pass
+        """
+        if len(self.__shape) == 1:
+            inputs, scalars = [], []
+            source = self.__source(inputs, scalars)
+            if all(isinstance(vector._storage(), list) for vector in inputs) and not any(isinstance(scalar, complex) for scalar in scalars):
+                kernel = _list_kernel(source, len(inputs), len(scalars))
+                return Vector._from_trusted(kernel(*[vector._storage() for vector in inputs], *scalars))
+            return Vector._from_trusted(self.__array()[0])
+        return Matrix._from_trusted(self.__array()[0])
+
+    def __operation(self, op: str, other, reflected: bool = False):
+        """
+        Extend the graph while lazy evaluation is on, otherwise apply the operator to the evaluated values
+        """
+        left, right = (other, self) if reflected else (self, other)
+        if config._lazy:
+            return Expression._node(op, left, right)
+        return _OPERATORS[op](_value(left), _value(right))
+
+    def __add__(self, other):
+        return self.__operation("+", other)
+
+    def __radd__(self, other):
+        return self.__operation("+", other, reflected=True)
+
+    def __sub__(self, other):
+        return self.__operation("-", other)
+
+    def __rsub__(self, other):
+        return self.__operation("-", other, reflected=True)
+
+    def __mul__(self, other):
+        return self.__operation("*", other)
+
+    def __rmul__(self, other):
+        return self.__operation("*", other, reflected=True)
+
+    def __truediv__(self, other):
+        return self.__operation("/", other)
+
+    def __floordiv__(self, other):
+        return self.__operation("//", other)
+
+    def __getattr__(self, name: str):
+        """
+        Look up any other attribute on the evaluated value
+        """
+        return getattr(self.eval(), name)
+
+    def __getitem__(self, index):
+        return self.eval()[index]
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        """
+        The evaluated value as a numpy array
+        """
+        return self.eval().__array__(dtype=dtype, copy=copy)
+
+    def __repr__(self) -> str:
+        return repr(self.eval())
+
+    def __eq__(self, other) -> bool:
+        return self.eval() == _value(other)
+
+    def __ne__(self, other) -> bool:
+        return self.eval() != _value(other)
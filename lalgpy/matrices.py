@@ -3,82 +3,624 @@
 Mathematical object `Matrix`
 """
 
+import mmap
+import operator
+import pickle
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
+from . import config
+from . import serialization
 from .utilities import *
 from .exceptions import *
 from .vectors import *
+from .vectors import _lazy, _evaluated, _as_dtype, _typed, _ACCEPTED
+
+__all__ = ["Matrix", "SparseMatrix", "Matrix3", "Matrix4", "multi_dot"]
+
+
+def _buffer_from_rows(rows, dtype: np.dtype | None = None) -> np.ndarray:
+    """
+    Pack validated rows into one contiguous row-major buffer
+
+    Integers are kept as `int64` and anything containing a float becomes `float64`, so the elements stay unboxed. Integers too large for 64 bits fall back to an object buffer so no precision is lost. A given dtype is used as it is
+    """
+    if not rows:
+        return np.empty((0, 0), dtype=dtype)
+    data = np.array(rows, dtype=dtype)
+    if data.dtype == np.bool_:
+        data = data.astype(np.int64)
+    return data
+
+_BLOCK_SIZE = 64
+
+# The backend kernel names of the ufuncs matrix operators run
+_KERNELS = {np.add: "add", np.subtract: "sub", np.multiply: "mul", np.true_divide: "truediv", np.floor_divide: "floordiv"}
+
+def _as_buffer(result) -> np.ndarray:
+    """
+    The result of a backend kernel as a buffer, rows of Python numbers are packed like `Matrix()` packs them
+    """
+    return result if isinstance(result, np.ndarray) else _buffer_from_rows(result)
+
+def _blocked_matmul(A: list[list], B: list[list]) -> list[list]:
+    """
+    Tiled matrix product on plain rows
+
+    Used when the elements cannot go through numpy `@`, for example integers too large for 64 bits. `B` is transposed once so the inner loop walks two rows instead of a column, and the output is filled tile by tile so the same block of `B` rows is reused for `_BLOCK_SIZE` rows of `A` while it is still hot. Each element is reduced with `sum(map(...))`, which does not allocate a list per element
+
+    Parameters
+    ----------
+    A: list[list]
+        The m×n left operand as a list of rows
+    B: list[list]
+        The n×p right operand as a list of rows
+
+    Return
+    ------
+    The m×p product as a list of rows
+    """
+    rows = len(A)
+    cols = len(B[0]) if B else 0
+    Bt = [list(col) for col in zip(*B)]
+    result = [[0]*cols for _ in range(rows)]
+    mul = operator.mul
+    for i0 in range(0, rows, _BLOCK_SIZE):
+        row_block = range(i0, min(i0 + _BLOCK_SIZE, rows))
+        for j0 in range(0, cols, _BLOCK_SIZE):
+            col_block = Bt[j0:j0 + _BLOCK_SIZE]
+            for i in row_block:
+                Ai = A[i]
+                Ci = result[i]
+                for j, Bj in enumerate(col_block, j0):
+                    Ci[j] = sum(map(mul, Ai, Bj))
+    return result
+
+_PARALLEL_THRESHOLD = 64**3
+
+def _workers_for(workers: int | None, m: int, n: int, p: int) -> int:
+    """
+    How many workers an m×n by n×p product runs on, 1 when it is too small to be worth splitting
+    """
+    if workers is None:
+        workers = config._num_threads
+    elif not isinstance(workers, int) or isinstance(workers, bool) or workers < 1:
+        raise ValueError("The number of workers should be a positive integer")
+    if m*n*p < _PARALLEL_THRESHOLD:
+        return 1
+    return min(workers, m)
+
+def _row_blocks(rows: int, workers: int) -> list[tuple[int, int]]:
+    """
+    Split `rows` into one contiguous (start, stop) block per worker
+    """
+    size = -(-rows//workers)
+    return [(start, min(start + size, rows)) for start in range(0, rows, size)]
+
+def _threaded_matmul(A: np.ndarray, B: np.ndarray, out: np.ndarray, workers: int) -> np.ndarray:
+    """
+    `A @ B` into `out`, one block of rows per thread
+
+    numpy releases the GIL inside `matmul`, so the threads run on separate cores and read the operands in place, without any copy
+    """
+    def block(rows: tuple[int, int]) -> None:
+        start, stop = rows
+        np.matmul(A[start:stop], B, out=out[start:stop])
+
+    with ThreadPoolExecutor(workers) as pool:
+        list(pool.map(block, _row_blocks(len(A), workers)))
+    return out
+
+_worker_operands = None
+
+def _attach_operands(name: str, size: int) -> None:
+    """
+    Process pool initializer, load the operands once per worker from the shared memory block
+    """
+    global _worker_operands
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        _worker_operands = pickle.loads(block.buf[:size])
+    finally:
+        block.close()
+
+def _matmul_rows(start: int, stop: int) -> list[list]:
+    """
+    Process pool task, the rows `start:stop` of the product of the attached operands
+    """
+    A, B = _worker_operands
+    return _blocked_matmul(A[start:stop], B)
+
+def _process_matmul(A: list[list], B: list[list], workers: int) -> list[list]:
+    """
+    `_blocked_matmul(A, B)` with one block of rows per worker process
+
+    The operands are serialized once into a `multiprocessing.shared_memory` block that every worker reads when it starts, so a task only carries its row range instead of a pickled copy of the operands
+    """
+    payload = pickle.dumps((A, B), protocol=pickle.HIGHEST_PROTOCOL)
+    block = shared_memory.SharedMemory(create=True, size=max(len(payload), 1))
+    try:
+        block.buf[:len(payload)] = payload
+        with ProcessPoolExecutor(workers, initializer=_attach_operands, initargs=(block.name, len(payload))) as pool:
+            starts, stops = zip(*_row_blocks(len(A), workers))
+            return [row for rows in pool.map(_matmul_rows, starts, stops) for row in rows]
+    finally:
+        block.close()
+        block.unlink()
+
+def _fits(data: np.ndarray, dtype: np.dtype) -> bool:
+    """
+    Whether a result of type `dtype` can be written into `data` in place
+    """
+    return data.flags.writeable and data.dtype == dtype
+
+_MEMMAP_BLOCK_BYTES = 64*2**20
+
+def _on_disk(*arrays) -> bool:
+    """
+    Whether any of the arrays is a view of a memory-mapped file
+    """
+    for data in arrays:
+        while isinstance(data, (np.ndarray, memoryview)):
+            data = data.base if isinstance(data, np.ndarray) else data.obj
+        if isinstance(data, mmap.mmap):
+            return True
+    return False
+
+def _row_chunks(data: np.ndarray) -> list[tuple[int, int]]:
+    """
+    Split the rows of a memory-mapped buffer into (start, stop) blocks of about `_MEMMAP_BLOCK_BYTES`, an in-memory buffer is one block
+    """
+    rows = len(data)
+    if not _on_disk(data):
+        return [(0, rows)]
+    step = max(_MEMMAP_BLOCK_BYTES//max(data.shape[1]*data.itemsize, 1), 1)
+    return [(start, min(start + step, rows)) for start in range(0, rows, step)]
+
+def _blockwise(ufunc, A: np.ndarray, B, out: np.ndarray) -> np.ndarray:
+    """
+    `ufunc(A, B, out=out)` block of rows by block of rows, so at most one block of a memory-mapped operand is touched at a time. `B` may be a scalar
+    """
+    streamed = next((data for data in (A, B, out) if _on_disk(data)), A)
+    for start, stop in _row_chunks(streamed):
+        ufunc(A[start:stop], B[start:stop] if isinstance(B, np.ndarray) else B, out=out[start:stop])
+    return out
+
+def _streamed_matmul(A: np.ndarray, B: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """
+    `A @ B` into `out` one block of rows of `A` at a time, and one block of rows of `B` at a time when `B` is memory-mapped too
+    """
+    for start, stop in _row_chunks(A if _on_disk(A) else out):
+        block = out[start:stop]
+        if not _on_disk(B):
+            np.matmul(A[start:stop], B, out=block)
+            continue
+        block[...] = 0
+        for inner, end in _row_chunks(B):
+            block += A[start:stop, inner:end] @ B[inner:end]
+    return out
+
+def _inexact(*arrays) -> np.dtype:
+    """
+    The type factorizations of the arrays run in, float64, or complex128 if any of them is complex
+    """
+    return np.result_type(*arrays, float) if any(np.iscomplexobj(a) for a in arrays) else np.dtype(float)
+
+def _lu_factor(data: np.ndarray) -> tuple[np.ndarray, np.ndarray, int]:
+    """
+    LU factorization with partial pivoting
+
+    Doolittle elimination where every step is one vectorized rank-1 update of the trailing block, the largest remaining element of the column is swapped up as the pivot
+
+    Return
+    ------
+    `(lu, perm, swaps)`: `L` below the diagonal (unit diagonal implied) and `U` on and above it packed into one array, the row permutation so that `data[perm] == L @ U`, and the number of row swaps
+    """
+    lu = np.array(data, dtype=_inexact(data))
+    n = lu.shape[0]
+    perm = np.arange(n)
+    swaps = 0
+    for k in range(n):
+        p = k + int(np.argmax(np.abs(lu[k:, k])))
+        if p != k:
+            lu[[k, p]] = lu[[p, k]]
+            perm[[k, p]] = perm[[p, k]]
+            swaps += 1
+        if lu[k, k] == 0:
+            continue
+        lu[k+1:, k] /= lu[k, k]
+        lu[k+1:, k+1:] -= np.outer(lu[k+1:, k], lu[k, k+1:])
+    return lu, perm, swaps
+
+def _forward_substitution(L: np.ndarray, b: np.ndarray, unit_diagonal: bool = False) -> np.ndarray:
+    """
+    Solve `L @ x == b` for a lower triangular `L` in O(n²), `b` may hold several right-hand sides as columns
+    """
+    x = np.array(b, dtype=_inexact(L, b))
+    for i in range(len(x)):
+        x[i] -= L[i, :i] @ x[:i]
+        if not unit_diagonal:
+            x[i] /= L[i, i]
+    return x
+
+def _back_substitution(U: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Solve `U @ x == b` for an upper triangular `U` in O(n²), `b` may hold several right-hand sides as columns
+    """
+    x = np.array(b, dtype=_inexact(U, b))
+    for i in range(len(x) - 1, -1, -1):
+        x[i] = (x[i] - U[i, i+1:] @ x[i+1:])/U[i, i]
+    return x
+
+def _singular(diagonal: np.ndarray) -> bool:
+    """
+    Whether a triangular factor with this diagonal is singular, elements within rounding of zero, relative to the largest one, count as zero
+    """
+    magnitudes = np.abs(diagonal)
+    return len(magnitudes) > 0 and magnitudes.min() <= len(magnitudes)*np.finfo(magnitudes.dtype).eps*magnitudes.max()
+
+def _by_magnitude(values: np.ndarray) -> np.ndarray:
+    """
+    The indices that sort `values` from the largest to the smallest magnitude
+    """
+    return np.argsort(-np.abs(values), kind="stable")
+
+def _lanczos(apply, n: int, k: int, tol: float, rng) -> tuple[np.ndarray, np.ndarray]:
+    """
+    The k eigenpairs of largest magnitude of a symmetric operator
+
+    Build a Krylov basis with the Lanczos recurrence, one `apply` (matrix-vector product) per step, with full reorthogonalization so the basis stays orthonormal in floating point. The eigenpairs of the small tridiagonal matrix approximate those of the operator, and the basis is grown until their residuals are below `tol`, at worst up to n where the result is exact
+
+    Return
+    ------
+    `(values, vectors)` with one unit eigenvector per column
+    """
+    steps = min(n, max(2*k + 10, 20))
+    while True:
+        Q = np.zeros((steps + 1, n))
+        alpha = np.zeros(steps)
+        beta = np.zeros(steps)
+        q = rng.standard_normal(n)
+        Q[0] = q/np.linalg.norm(q)
+        for j in range(steps):
+            w = apply(Q[j])
+            alpha[j] = w @ Q[j]
+            w -= Q[:j+1].T @ (Q[:j+1] @ w)
+            w -= Q[:j+1].T @ (Q[:j+1] @ w)
+            beta[j] = np.linalg.norm(w)
+            if beta[j] <= 1e-12*max(np.abs(alpha[:j+1]).max(), 1.0):
+                steps = j + 1  # invariant subspace, the Ritz pairs are exact
+                break
+            Q[j+1] = w/beta[j]
+        T = np.diag(alpha[:steps]) + np.diag(beta[:steps-1], 1) + np.diag(beta[:steps-1], -1)
+        theta, S = np.linalg.eigh(T)
+        order = _by_magnitude(theta)[:k]
+        residuals = np.abs(beta[steps-1]*S[steps-1, order])
+        if steps >= n or beta[steps-1] == 0 or (residuals <= tol*np.abs(theta[order]).max()).all():
+            return theta[order], Q[:steps].T @ S[:, order]
+        steps = min(n, 2*steps)
+
+def _subspace_iteration(apply, n: int, k: int, tol: float, maxiter: int, rng) -> tuple[np.ndarray, np.ndarray]:
+    """
+    The k eigenpairs of largest magnitude of a general operator
+
+    Block power iteration: a block of k + extra orthonormal vectors is multiplied by the operator and orthonormalized again at each step, and the Rayleigh-Ritz projection onto the block gives the eigenpairs, possibly complex
+
+    Raises
+    ------
+    ConvergenceError
+        If the residuals are not below `tol` after `maxiter` iterations
+    """
+    block = min(n, 2*k + 5)
+    Q = np.linalg.qr(rng.standard_normal((n, block)))[0]
+    for _ in range(maxiter):
+        Z = apply(Q)
+        values, S = np.linalg.eig(Q.conj().T @ Z)
+        order = _by_magnitude(values)[:k]
+        values, S = values[order], S[:, order]
+        vectors = Q @ S
+        residuals = np.linalg.norm(Z @ S - vectors*values, axis=0)
+        if (residuals <= tol*max(np.abs(values).max(), 1e-300)).all():
+            return values, vectors/np.linalg.norm(vectors, axis=0)
+        Q = np.linalg.qr(Z)[0]
+    raise ConvergenceError(f"top_k_eig() did not converge in {maxiter} iterations")
+
+def _top_k_eig(apply, n: int, k: int, symmetric: bool, tol: float, maxiter: int) -> tuple:
+    """
+    Shared driver of `Matrix.top_k_eig()` and `SparseMatrix.top_k_eig()`, `apply` multiplies the operator by a vector or a block of column vectors
+    """
+    if not isinstance(k, int) or not 0 < k <= n:
+        raise ValueError(f"k should be an integer between 1 and the matrix order {n}")
+    rng = np.random.default_rng(0)
+    if symmetric:
+        values, vectors = _lanczos(apply, n, k, tol, rng)
+    else:
+        values, vectors = _subspace_iteration(apply, n, k, tol, maxiter, rng)
+    return values.tolist(), [Vector._from_trusted(column if np.iscomplexobj(column) else column.tolist()) for column in vectors.T]
 
 class Matrix:
     """
     `Matrix` is a mathematical object that can be seen as a two-dimensional array, where you need two indices to get any of its elements.
     -- New features will come soon --
-    Supported operations: addition, subtraction, multiplication
-    IMPORTANT: For multiplication, `Matrix` should be the first operand, the multiplication operator support scalar, vector and matrix!
+    Supported operations: addition, subtraction, multiplication, true division, floor division
+    IMPORTANT: For multiplication, `Matrix` should be the first operand, the multiplication operator support scalar, vector and matrix! Division is for scalar only
+    The in-place operators (+=, -=, *=, /=, //=) write into the existing buffer whenever it can hold the result
+    Indexing: `matrix[i]`, `matrix[:, j]` give a row or a column as a `Vector`, `matrix[i, j]` one element, and slices give a `Matrix`. Like `T`, `row()` and `col()`, they view the same elements without copying, copy-on-write
     
     Supported statements: 
         Equality(==): True if the components are the same else False
         Non-equality(): True if the components are different else False
-        If the two sides are not the same type, it will return True or False depends on the nature of the statement. No inequalities supported
+        If the two sides are not the same type, the other operand decides: a lazy `Expression` compares by its value, other types are unequal. No inequalities supported
     Representation:
         Formatted as `Matrix(*components)`
+    NumPy interoperability:
+        The buffer is exposed through `__array__`, `__array_interface__` and the buffer protocol, and `from_numpy()` wraps an array, so data is shared with numpy both ways without copying. Writes made through a shared array show in the matrix, which therefore stops caching its factorizations once the buffer is shared
+    Numeric types:
+        `Matrix(*rows, dtype=...)` stores the elements as float32, float64, int64, complex64 or complex128, float32 halves the memory and bandwidth of a float64 matrix. Results follow the same promotion rules as `Vector`, the wider type of the two operands with scalars keeping the matrix type
 
     Attributes
     ----------
-    __components: list[list[int | float]]
-        The matrix components, each elements represent a row. Not directly changeable, if you want to change the components, see `set_components()` method
+    __factors: dict | bool | None
+        Cached LU, QR and Cholesky factorizations and eigen decomposition, reset whenever the components change. False when the buffer is shared with code outside the matrix, which can change it without the matrix knowing, nothing is cached then
+    __data: numpy.ndarray
+        The matrix elements stored as one contiguous row-major buffer with a (rows, cols) shape header, one machine number per element instead of a boxed Python object. Held in a slot, matrices have no per-instance `__dict__`. Not directly changeable, if you want to change the components, see `set_components()` method
 
     Properties
     ----------
     components(self) -> list[list[int | float]]
-        Get the matrix components as a list contain each rows
+        Get the matrix components as a list contain each rows, built from the underlying buffer
     dimensions(self) -> tuple
         Get the Matrix dimensions, as a tuple in the form (rows, cols)
+    dtype(self) -> numpy.dtype
+        Get the type the elements are stored as
+    T(self) -> Matrix
+        The transposed matrix, a copy-on-write view
     
     Methods
     -------
     set_components(self, *args: list[int | float])
         Set a new set of components for the matrix
+    astype(self, dtype) -> Matrix
+        Return a copy of the matrix stored as another type
+    from_buffer(buffer, shape=None) -> Matrix
+        Wrap a typed numeric buffer as a matrix without checking every element
+    from_numpy(arr, copy=False) -> Matrix
+        Build a matrix on a numpy array, sharing its buffer
+    open_memmap(path, shape=None, dtype="float64", mode="r+") -> Matrix
+        Open a matrix stored in a file without reading it into memory
+    flush(self)
+        Write the changes of a memory-mapped matrix to its file
+    to_bytes(self) -> bytes
+        Serialize the matrix into a small header followed by the raw buffer
+    from_bytes(buffer) -> Matrix
+        View serialized bytes as a matrix without copying
+    save(self, path)
+        Write the serialized matrix to a file
+    load(path, mmap_mode=None) -> Matrix
+        Read a matrix written by `save()`, optionally memory-mapped
+    row(self, i: int) -> Vector
+        The row i, a copy-on-write view
+    col(self, j: int) -> Vector
+        The column j, a copy-on-write view
+    matmul(self, other, out=None, workers=None) -> Matrix | Vector
+        Multiply like `*`, optionally writing the result into a preallocated matrix or vector, or splitting a large product over several workers
+    apply(self, vectors) -> VectorArray
+        Multiply the matrix by a whole batch of vectors at once, also available as `matrix @ vector_array`
+    apply_stream(self, vectors, chunk_size: int = 4096) -> Iterator[VectorArray]
+        Multiply the matrix by an iterable of vectors, yielding the results chunk by chunk
+    diagonal(self) -> list[int | float]
+        The elements on the main diagonal
+    lu(self) -> tuple[Matrix, Matrix, Matrix]
+        LU factorization with partial pivoting
+    qr(self) -> tuple[Matrix, Matrix]
+        QR factorization
+    cholesky(self) -> Matrix
+        Cholesky factorization of a symmetric positive definite matrix
+    solve(self, b, method: str = "lu") -> Vector | Matrix
+        Solve `self*x == b`
+    det(self) -> float
+        The determinant
+    inverse(self) -> Matrix
+        The inverse matrix
+    eigvals(self) -> list[float | complex]
+        The eigenvalues, from the largest to the smallest magnitude
+    eig(self) -> tuple[list, list[Vector]]
+        The eigenvalues and unit eigenvectors
+    top_k_eig(self, k: int, tol: float = 1e-10, maxiter: int = 1000) -> tuple[list, list[Vector]]
+        The k eigenpairs of largest magnitude, only with matrix-vector products
+    Factorizations and eigen decompositions are cached on the matrix and dropped whenever its components change. A matrix whose buffer is shared with other code, built with `from_numpy()`, `from_buffer()`, `open_memmap()`, `from_bytes()`, as a view, or handed out through `numpy.asarray()`, computes them again on every call
 
     """
-    def __init__(self, *args: list[int | float]) -> None:
+
+    __slots__ = ("__data", "__factors")
+
+    def __init__(self, *args: list[int | float | complex], dtype=None) -> None:
         """
         Initialize the matrix
 
         Parameters
         ----------
-        *args: list[int | float] 
-            Lists represent a row, every list should have the same length
+        *args: list[int | float | complex] 
+            Lists represent a row, every list should have the same length. Complex elements need a complex dtype
+        dtype: str | type | numpy.dtype | None (default None)
+            None to store integers as int64 and floats as float64, otherwise "float32", "float64", "int64", "complex64" or "complex128"
 
         Raises
         ------
         TypeError
-            For invalid types
+            For invalid types, only checked while validation is on, see `config.set_validation()`. If the dtype is not supported
         DimensionsError
             If the input lists are not the same length
         """
-        for arg in args:
-            if not isinstance(arg, list):
-                raise TypeError("Matrix components(rows) should be a list with elements of type `int` or `float`")
-            for elements in arg:
-                if not isinstance(elements, (int, float)):
-                    raise TypeError("Matrix components(rows) should be a list with elements of type `int` or `float`")
+        if dtype is not None:
+            dtype = _as_dtype(dtype)
+        Matrix.__check(args, dtype)
+        self.__data = _buffer_from_rows(args, dtype)
+        self.__factors = None
+
+    @staticmethod
+    def __check(args, dtype: np.dtype | None = None) -> None:
+        """
+        Check the rows structure, and the type of every element while validation is on
+        """
+        if config._validate:
+            accepted = (int, float) if dtype is None else _ACCEPTED[dtype.kind]
+            names = " or ".join(f"`{t.__name__}`" for t in accepted)
+            for arg in args:
+                if not isinstance(arg, list):
+                    raise TypeError(f"Matrix components(rows) should be a list with elements of type {names}")
+                for elements in arg:
+                    if not isinstance(elements, accepted):
+                        raise TypeError(f"Matrix components(rows) should be a list with elements of type {names}")
         if not all(len(component) == len(args[0]) for component in args):
             raise DimensionsError("Matrix components(rows) should all be the same length")
-        self.__components = [*args]
+
+    @classmethod
+    def _from_trusted(cls, data: np.ndarray, shared: bool = False):
+        """
+        Trusted constructor
+
+        Wrap a two-dimensional numeric array without copying or checking it. Meant for results computed inside the package
+
+        Parameters
+        ----------
+        data: numpy.ndarray
+            The elements, the new matrix takes ownership of the array
+        shared: bool (default False)
+            True when code outside the matrix can also write to the array, the factorizations are not cached then
+        """
+        matrix = cls.__new__(cls)
+        matrix.__data = data
+        matrix.__factors = False if shared else None
+        return matrix
+
+    @classmethod
+    def from_buffer(cls, buffer, shape: tuple[int, int] | None = None):
+        """
+        Build a matrix from a buffer
+
+        The buffer is wrapped as it is, without going through Python numbers, so only its type and shape are checked, not every element
+
+        Parameters
+        ----------
+        buffer: numpy.ndarray | array.array | memoryview
+            Any object exposing a typed numeric buffer. It is not copied, so later changes to the buffer show in the matrix
+        shape: tuple[int, int] | None (default None)
+            The (rows, cols) to view a flat buffer as. Can be left out for a buffer that is already two-dimensional
+
+        Raises
+        ------
+        TypeError
+            If the buffer does not hold numbers
+        DimensionsError
+            If the buffer cannot be viewed with the requested shape
+        """
+        data = np.asarray(buffer)
+        if data.dtype == np.bool_:
+            data = data.astype(np.int64)
+        if data.dtype.kind not in "iufc":
+            raise TypeError("Matrix buffer should hold numbers of type `int`, `float` or `complex`")
+        if shape is not None:
+            if data.size != shape[0]*shape[1]:
+                raise DimensionsError(f"A buffer of {data.size} elements cannot be viewed as a {shape[0]}×{shape[1]} matrix")
+            data = data.reshape(shape)
+        if data.ndim != 2:
+            raise DimensionsError("Matrix buffer should be two-dimensional, pass `shape` for a flat buffer")
+        return cls._from_trusted(data, shared=True)
+
+    @classmethod
+    def from_numpy(cls, arr, copy: bool = False):
+        """
+        Build a matrix on a numpy array
+
+        The matrix keeps the array as its buffer, so nothing is copied and changes made through either side show in the other. Since the array can change without the matrix knowing, factorizations of such a matrix are not cached
+
+        Parameters
+        ----------
+        arr: numpy.ndarray
+            A two-dimensional array of integers, floats or complex numbers, or anything `numpy.asarray()` accepts
+        copy: bool (default False)
+            True to give the matrix its own copy of the data
+
+        Raises
+        ------
+        TypeError
+            If the array does not hold numbers
+        DimensionsError
+            If the array is not two-dimensional
+        """
+        if not copy:
+            return cls.from_buffer(arr)
+        matrix = cls.from_buffer(np.array(arr, copy=True))
+        matrix.__factors = None
+        return matrix
+
+    @classmethod
+    def open_memmap(cls, path, shape: tuple[int, int] | None = None, dtype="float64", mode: str = "r+"):
+        """
+        Open a matrix stored in a file
+
+        The file is memory-mapped instead of read, so the matrix can be larger than the memory. Row slices are views of the file, and multiplication and `+`/`-` against other matrices and vectors stream through it block by block, so only one block of rows is in memory at a time. In-place operators and `matmul(out=...)` on a writable mapped matrix write their result straight back into the file, for example `C = Matrix.open_memmap(path, shape, mode="w+")` followed by `C += A` and `C -= B`
+
+        Parameters
+        ----------
+        path: str | os.PathLike
+            The file, either a `.npy` file, whose header gives the shape and type, or raw row-major elements
+        shape: tuple[int, int] | None (default None)
+            The (rows, cols), required for raw files and when creating a file
+        dtype: str | numpy.dtype (default "float64")
+            The element type of a raw file or of a created file, an integer, floating point or complex type
+        mode: str (default "r+")
+            "r" read-only, "r+" read and write, "w+" create or overwrite, "c" copy-on-write, changes stay in memory
+
+        Raises
+        ------
+        TypeError
+            If the element type is not an integer, floating point or complex type
+        ValueError
+            If the shape is missing
+        DimensionsError
+            If the file does not hold a two-dimensional matrix
+        """
+        if str(path).endswith(".npy"):
+            if mode == "w+" and shape is None:
+                raise ValueError("open_memmap() required a shape to create a file")
+            data = np.lib.format.open_memmap(path, mode=mode, dtype=dtype, shape=shape)
+        else:
+            if shape is None:
+                raise ValueError("open_memmap() required a shape for a raw file")
+            data = np.memmap(path, dtype=dtype, mode=mode, shape=tuple(shape))
+        if data.dtype.kind not in "iufc":
+            raise TypeError("Matrix buffer should hold numbers of type `int`, `float` or `complex`")
+        if data.ndim != 2:
+            raise DimensionsError("A memory-mapped matrix should be two-dimensional")
+        return cls._from_trusted(data, shared=True)
+
+    def flush(self) -> None:
+        """
+        Write the changes of a memory-mapped matrix to its file, nothing to do for an in-memory matrix
+        """
+        if isinstance(self.__data, np.memmap):
+            self.__data.flush()
 
     @property
     def components(self) -> list[list[int | float]]:
         """
         The matrix components
+
+        A new list of rows is built from the buffer on every access, changing it does not change the matrix
         """
-        return self.__components
+        return self.__data.tolist()
     
-    def set_components(self, *args: list[int | float]) -> None:
+    def set_components(self, *args: list[int | float | complex]) -> None:
         """
         Set a new set of components for the matrix
+
+        A matrix stored as float32, complex64 or complex128 keeps its type, int64 and float64 matrices follow the new elements like `Matrix()` does
  
         Parameters
         ----------
-        *args: list[int | float] 
+        *args: list[int | float | complex] 
             Lists represent a row, every list should have the same length
 
         Raises
@@ -88,7 +630,33 @@ class Matrix:
         DimensionsError
             If the input lists are not the same length
         """
-        self.__components = Matrix(*args).components
+        dtype = self.__data.dtype if _typed(self.__data) else None
+        Matrix.__check(args, dtype)
+        self.__data = _buffer_from_rows(args, dtype)
+        self.__factors = None
+
+    @property
+    def dtype(self) -> np.dtype:
+        """
+        The type the elements are stored as
+        """
+        return self.__data.dtype
+
+    def astype(self, dtype):
+        """
+        A copy of the matrix stored as another type
+
+        Parameters
+        ----------
+        dtype: str | type | numpy.dtype
+            "float32", "float64", "int64", "complex64" or "complex128"
+
+        Raises
+        ------
+        TypeError
+            If the dtype is not supported
+        """
+        return Matrix._from_trusted(self.__data.astype(_as_dtype(dtype)))
     
     @property
     def dimensions(self) -> tuple:
@@ -96,16 +664,182 @@ class Matrix:
         Get the dimensions of a matrix, or the numbers of rows and columns.
         Return a tuple in the form (rows, cols)
         """
-        return (len(self.__components), len(self.__components[0]))
+        return self.__data.shape
 
     def __repr__(self) -> str:
         """
         Representation
 
         form: 
-            `Matrix(*components)`
+            `Matrix(*components)`, followed by the dtype for a type other than int64 and float64
+        """
+        if _typed(self.__data):
+            return f"Matrix({', '.join(map(repr, self.components))}, dtype={self.__data.dtype})"
+        return f"Matrix{tuple(self.components)}"
+
+    def to_bytes(self) -> bytes:
+        """
+        Serialize the matrix
+
+        A 32-byte header (shape, element type, byte order) followed by the raw row-major buffer, see `lalgpy.serialization`
+
+        Raises
+        ------
+        TypeError
+            If the matrix holds integers too large for 64 bits
+        """
+        return serialization.to_bytes(self.__data)
+
+    @classmethod
+    def from_bytes(cls, buffer):
+        """
+        Build a matrix from the bytes of `to_bytes()`
+
+        Nothing is copied or parsed, the matrix views the elements inside the buffer, so wrapping a `memoryview` of a network message or an `mmap` is free. A read-only buffer such as `bytes` gives a read-only view, in-place operators then allocate a new buffer
+
+        Parameters
+        ----------
+        buffer: bytes | bytearray | memoryview | mmap.mmap
+            Any object exposing the serialized bytes
+
+        Raises
+        ------
+        ValueError
+            If the buffer does not hold a serialized matrix
+        DimensionsError
+            If the buffer holds a vector
+        """
+        return cls._from_trusted(serialization.from_buffer(buffer, 2), shared=True)
+
+    def save(self, path) -> None:
+        """
+        Write the matrix to a file in the `to_bytes()` format, straight from its buffer
+        """
+        serialization.write(self.__data, path)
+
+    @classmethod
+    def load(cls, path, mmap_mode: str | None = None):
+        """
+        Read a matrix written by `save()`
+
+        Parameters
+        ----------
+        path: str | os.PathLike
+            The file
+        mmap_mode: str | None (default None)
+            None to read the file into memory, otherwise map it without reading it, like `open_memmap()`: "r" read-only, "r+" changes are written to the file, "c" copy-on-write
+
+        Raises
+        ------
+        ValueError
+            If the file does not hold a serialized matrix
+        DimensionsError
+            If the file holds a vector
+        """
+        return cls._from_trusted(serialization.read(path, 2, mmap_mode), shared=mmap_mode is not None)
+
+    def __read_only(self, view: np.ndarray) -> np.ndarray:
+        """
+        Make a view of the buffer read-only
+
+        Only the view is frozen, the matrix keeps writing to its buffer in place and the view sees those changes, while writing to the view gives it its own buffer. Memory-mapped matrices are the exception, their views stay writable windows into the file
+        """
+        if not _on_disk(self.__data):
+            view.flags.writeable = False
+        return view
+
+    def __getitem__(self, index):
+        """
+        Indexing and slicing
+
+        Without copying anything, the result views the elements of the matrix, see `T`
+
+        Parameters
+        ----------
+        index: int | slice | tuple[int | slice, int | slice]
+            `matrix[i]` or `matrix[i, :]` the row i as a `Vector`, `matrix[:, j]` the column j as a `Vector`, `matrix[i, j]` one element, slices in both positions a `Matrix`
+
+        Raises
+        ------
+        TypeError
+            If the index is not made of integers and slices
+        IndexError
+            If a row or column is out of range
+        """
+        parts = index if isinstance(index, tuple) else (index,)
+        if not 0 < len(parts) <= 2 or not all(isinstance(part, (int, slice)) for part in parts):
+            raise TypeError("Matrix indices should be integers or slices, at most one for the rows and one for the columns")
+        if len(parts) == 2 and all(isinstance(part, int) for part in parts):
+            return self.__data[parts].item()
+        view = self.__read_only(self.__data[parts])
+        if view.ndim == 1:
+            return Vector._from_trusted(view)
+        return Matrix._from_trusted(view, shared=True)
+
+    def row(self, i: int):
+        """
+        The row i as a `Vector` viewing the elements of the matrix, copy-on-write like `T`
+
+        Raises
+        ------
+        IndexError
+            If the row is out of range
+        """
+        return Vector._from_trusted(self.__read_only(self.__data[i]))
+
+    def col(self, j: int):
+        """
+        The column j as a `Vector` viewing the elements of the matrix, copy-on-write like `T`
+
+        Raises
+        ------
+        IndexError
+            If the column is out of range
+        """
+        return Vector._from_trusted(self.__read_only(self.__data[:, j]))
+
+    @property
+    def T(self):
+        """
+        The transposed matrix
+
+        A strided view of the same elements, O(1) whatever the size. Views are read-only and copy-on-write: they see later changes of the original matrix, and writing to a view, for example with an in-place operator, gives it its own copy and leaves the original unchanged. Views of memory-mapped matrices are the exception, they stay writable windows into the file
+        """
+        return Matrix._from_trusted(self.__read_only(self.__data.T), shared=True)
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        """
+        The rows×cols numpy array, without copying unless a copy or another dtype is asked for
+
+        The array shares the buffer, writes made through it change the matrix, which from then on computes its factorizations on every call instead of caching them
+        """
+        data = self.__data if dtype is None else self.__data.astype(dtype, copy=False)
+        if copy:
+            return data.copy()
+        if data is self.__data:
+            self.__factors = False
+        return data
+
+    @property
+    def __array_interface__(self) -> dict:
+        """
+        The numpy array interface of the buffer, so other array libraries can view it without copying
+        """
+        self.__factors = False
+        return self.__data.__array_interface__
+
+    def __buffer__(self, flags: int) -> memoryview:
+        """
+        Buffer protocol (Python 3.12+), a view of the matrix buffer
+        """
+        self.__factors = False
+        return memoryview(self.__data)
+
+    def _storage(self) -> np.ndarray:
         """
-        return f"Matrix{tuple(self.__components)}"
+        The buffer itself, without copying, for reading inside the package without handing it out like `__array__` does
+        """
+        return self.__data
 
     def __add__(self, other):
         """
@@ -131,8 +865,9 @@ class Matrix:
             return NotImplemented
         if self.dimensions != other.dimensions:
             raise DimensionsError("Operand `+` required two matrices with the same dimensions")
-        return Matrix(*[utilities.array_add(c1, c2) 
-                        for c1, c2 in zip(self.components, other.components)])
+        if config._lazy:
+            return _lazy("+", self, other)
+        return Matrix._from_trusted(self.__elementwise(np.add, other))
 
     def __sub__(self, other):
         """
@@ -158,20 +893,22 @@ class Matrix:
             return NotImplemented
         if self.dimensions != other.dimensions:
             raise DimensionsError("Operand `+` required two matrices with the same dimensions")
-        return Matrix(*[utilities.array_sub(c1, c2) 
-                        for c1, c2 in zip(self.components, other.components)])
+        if config._lazy:
+            return _lazy("-", self, other)
+        return Matrix._from_trusted(self.__elementwise(np.subtract, other))
     
     def __mul__(self, other):
         """
         Multiplication 
 
         Perform matrix multiplication with scalar, vector and another matrix
+        Matrix products run through numpy `@` on the buffers, matrices holding integers too large for 64 bits use a blocked pure Python kernel instead. Large products are split over `lalgpy.set_num_threads()` workers
 
         Parameters
         ----------
         self: Matrix
             The first matrix
-        other: int | float | Vector | Matrix
+        other: int | float | complex | Vector | Matrix
             The second operand, can be scalar, vector or matrix
 
         Return
@@ -187,49 +924,713 @@ class Matrix:
         DimensionsError
             If the second matrix or vector are not compatible for multiplication with the first one
         """
-        if isinstance(other, (int, float)):
-            return Matrix(*[utilities.array_scalar_mul(c, other) for c in self.components])
+        if isinstance(other, (int, float, complex)):
+            if config._lazy:
+                return _lazy("*", self, other)
+            return Matrix._from_trusted(self.__scalar(np.multiply, other))
         if isinstance(other, Matrix):
             Arows, Acols = self.dimensions
             Brows, Bcols = other.dimensions
             if Acols != Brows:
                 raise DimensionsError("Incompatible matrices for multiplication, expected matrix in the form m×n to b multiply by n×p")
-            result = [[0]*Bcols for _ in range(Arows)]
-            for j in range(Arows):
-                for i in range(Bcols):
-                    result[j][i] = sum([self.components[j][k]*other.components[k][i]
-                                        for k in range(Acols)])
-            return Matrix(*result)
+            if config._lazy:
+                return _lazy("*", self, other)
+            return Matrix._from_trusted(self.__product(other))
         if isinstance(other, Vector):
             Arows, Acols = self.dimensions
             if Acols != other.dimensions:
                 raise DimensionsError("Incompatible matrix-vector for multiplication, expected matrix in the form m×n to be multiply by 1×n vector")
-            result = [0]*Arows
-            for i in range(Arows):
-                for j in range(Acols):
-                    result[i] += self.components[i][j]*other.components[j]
-            return Vector(*result)
+            if config._lazy:
+                return _lazy("*", self, other)
+            return Vector._from_trusted(self.__matvec(other))
         return NotImplemented
-    
-    def __eq__(self, other):
+
+    def __elementwise(self, ufunc, other) -> np.ndarray:
         """
-        Equal statement
+        The buffer of `ufunc(self, other)` for two matrices, dimensions already checked, streamed when an operand is memory-mapped
+        """
+        if config._backend is not None and not _on_disk(self.__data, other.__data):
+            return _as_buffer(config._backend.elementwise(_KERNELS[ufunc], self.__data, other.__data))
+        if not _on_disk(self.__data, other.__data):
+            return ufunc(self.__data, other.__data)
+        out = np.empty(self.dimensions, dtype=np.result_type(self.__data, other.__data))
+        return _blockwise(ufunc, self.__data, other.__data, out)
 
-        The equality of vectors 
+    def __scalar(self, ufunc, scalar) -> np.ndarray:
+        """
+        The buffer of `ufunc(self, scalar)`, on the selected backend if there is one
+        """
+        if config._backend is not None:
+            return _as_buffer(config._backend.elementwise(_KERNELS[ufunc], self.__data, scalar))
+        return ufunc(self.__data, scalar)
 
-        Parameters
-        ----------
-        self: Matrix
-        other: Any
+    def __product(self, other, workers: int | None = None) -> np.ndarray:
+        """
+        The buffer of the matrix product, dimensions already checked, split over `workers` when it is large enough
+        """
+        (m, n), p = self.dimensions, other.dimensions[1]
+        if _on_disk(self.__data, other.__data):
+            out = np.empty((m, p), dtype=np.result_type(self.__data, other.__data))
+            return _streamed_matmul(self.__data, other.__data, out)
+        if config._backend is not None:
+            return _as_buffer(config._backend.matmul(self.__data, other.__data))
+        workers = _workers_for(workers, m, n, p)
+        if self.__data.dtype != object and other.__data.dtype != object:
+            if workers == 1:
+                return self.__data @ other.__data
+            out = np.empty((m, p), dtype=np.result_type(self.__data, other.__data))
+            return _threaded_matmul(self.__data, other.__data, out, workers)
+        if workers == 1:
+            return _buffer_from_rows(_blocked_matmul(self.components, other.components))
+        return _buffer_from_rows(_process_matmul(self.components, other.components, workers))
+
+    def __matvec(self, vector) -> list[int | float] | np.ndarray:
+        """
+        The components of the matrix-vector product, dimensions already checked. A numpy array when the matrix is stored as a type other than int64 and float64 or the vector holds a numpy buffer, so the result keeps the promoted type
+        """
+        Arows, Acols = self.dimensions
+        keep = _typed(self.__data) or isinstance(vector._storage(), np.ndarray)
+        if _on_disk(self.__data):
+            x = np.asarray(vector)
+            if keep:
+                return np.concatenate([self.__data[start:stop] @ x for start, stop in _row_chunks(self.__data)])
+            return [value for start, stop in _row_chunks(self.__data)
+                    for value in (self.__data[start:stop] @ x).tolist()]
+        if config._backend is not None:
+            return config._backend.matvec(self.__data, vector._storage())
+        if keep:
+            return self.__data @ np.asarray(vector)
+        if self.__data.size >= NUMPY_THRESHOLD:
+            return (self.__data @ np.asarray(vector)).tolist()
+        A = self.components
+        x = vector.components
+        result = [0]*Arows
+        for i in range(Arows):
+            for j in range(Acols):
+                result[i] += A[i][j]*x[j]
+        return result
+
+    def __truediv__(self, other: int | float | complex):
+        """
+        Scalar true division
+
+        Perform matrix scalar true division
+        IMPORTANT: the matrix should be the first operand
+
+        Raises
+        ------
+        TypeError
+            If the other is not a scalar
+        """
+        if not isinstance(other, (int, float, complex)):
+            raise TypeError("Matrix true division using `/` is for scalar only")
+        if config._lazy:
+            return _lazy("/", self, other)
+        return Matrix._from_trusted(self.__scalar(np.true_divide, other))
+
+    def __floordiv__(self, other: int | float):
+        """
+        Scalar floor division
+
+        Perform matrix scalar floor division
+        IMPORTANT: the matrix should be the first operand
+
+        Raises
+        ------
+        TypeError
+            If the other is not a scalar
+        """
+        if not isinstance(other, (int, float)):
+            raise TypeError("Matrix floor division using `//` is for scalar only")
+        if config._lazy:
+            return _lazy("//", self, other)
+        return Matrix._from_trusted(self.__scalar(np.floor_divide, other))
+
+    def __iadd__(self, other):
+        """
+        In-place addition
+
+        Add the other matrix into the buffer of `self`. The buffer is only replaced when it cannot hold the result, for example adding floats into an integer matrix
+
+        Raises
+        ------
+        DimensionsError
+            If the inputs matrix are not having the same dimensions
+        """
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        if self.dimensions != other.dimensions:
+            raise DimensionsError("Operand `+=` required two matrices with the same dimensions")
+        if _fits(self.__data, np.result_type(self.__data, other.__data)):
+            _blockwise(np.add, self.__data, other.__data, self.__data)
+        else:
+            self.__data = self.__data + other.__data
+        self.__changed()
+        return self
+
+    def __isub__(self, other):
+        """
+        In-place subtraction
+
+        Subtract the other matrix from the buffer of `self`. The buffer is only replaced when it cannot hold the result
+
+        Raises
+        ------
+        DimensionsError
+            If the inputs matrix are not having the same dimensions
+        """
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        if self.dimensions != other.dimensions:
+            raise DimensionsError("Operand `-=` required two matrices with the same dimensions")
+        if _fits(self.__data, np.result_type(self.__data, other.__data)):
+            _blockwise(np.subtract, self.__data, other.__data, self.__data)
+        else:
+            self.__data = self.__data - other.__data
+        self.__changed()
+        return self
+
+    def __imul__(self, other):
+        """
+        In-place multiplication
+
+        Multiply `self` by a scalar or by a matrix, writing into the existing buffer when the result has the same shape and type. Multiplying by a vector gives a vector, so `matrix *= vector` rebinds the name the same way `matrix = matrix*vector` does
+
+        Raises
+        ------
+        DimensionsError
+            If the other matrix is not compatible for multiplication
+        """
+        if isinstance(other, (int, float, complex)):
+            if _fits(self.__data, np.result_type(self.__data, other)):
+                np.multiply(self.__data, other, out=self.__data)
+            else:
+                self.__data = self.__data*other
+            self.__changed()
+            return self
+        if isinstance(other, Matrix):
+            if other.dimensions[1] == self.dimensions[1]:
+                return self.matmul(other, out=self)
+            self.__data = (self*other).__data
+            self.__changed()
+            return self
+        return NotImplemented
+
+    def __itruediv__(self, other: int | float | complex):
+        """
+        In-place scalar true division
+
+        Divide the buffer of `self` by a scalar. An integer matrix gets a new floating point buffer since true division gives floats
+
+        Raises
+        ------
+        TypeError
+            If the other is not a scalar
+        """
+        if not isinstance(other, (int, float, complex)):
+            raise TypeError("Matrix true division using `/=` is for scalar only")
+        if _fits(self.__data, np.result_type(self.__data, other, 1.0)):
+            np.true_divide(self.__data, other, out=self.__data)
+        else:
+            self.__data = self.__data/other
+        self.__changed()
+        return self
+
+    def __ifloordiv__(self, other: int | float):
+        """
+        In-place scalar floor division
+
+        Floor divide the buffer of `self` by a scalar
+
+        Raises
+        ------
+        TypeError
+            If the other is not a scalar
+        """
+        if not isinstance(other, (int, float)):
+            raise TypeError("Matrix floor division using `//=` is for scalar only")
+        if _fits(self.__data, np.result_type(self.__data, other)):
+            np.floor_divide(self.__data, other, out=self.__data)
+        else:
+            self.__data = self.__data//other
+        self.__changed()
+        return self
+
+    def matmul(self, other, out=None, workers: int | None = None):
+        """
+        Multiplication into an existing result
+
+        The same as `self*other`, but the result can be written into a preallocated `out` so that hot loops reuse one result object. With matching types the numpy kernels write straight into the buffer of `out` without allocating
+        Matrix products can also run on several cores: the output is split into row blocks computed on a thread pool, or on a process pool that reads the operands from shared memory for integers too large for 64 bits
+
+        Parameters
+        ----------
+        self: Matrix
+            The first matrix
+        other: int | float | complex | Vector | Matrix
+            The second operand
+        out: Matrix | Vector | None (default None)
+            Where to write the result, a matrix of the result dimensions for scalar and matrix products, a vector for matrix-vector products. It may be `self` or `other` themselves
+        workers: int | None (default None)
+            The number of workers for a matrix product, None to use `lalgpy.get_num_threads()`. Products smaller than 64×64×64 always run on the calling thread
+
+        Return
+        ------
+        `out` if it was given, otherwise a new result as `self*other` would return
+
+        Raises
+        ------
+        TypeError
+            If the operand is not supported or `out` has the wrong type
+        DimensionsError
+            If the operands are not compatible, or `out` does not have the result dimensions
+        ValueError
+            If workers is not a positive integer
+        """
+        if isinstance(other, Matrix) and self.dimensions[1] != other.dimensions[0]:
+            raise DimensionsError("Incompatible matrices for multiplication, expected matrix in the form m×n to b multiply by n×p")
+        if out is None and isinstance(other, Matrix):
+            return Matrix._from_trusted(self.__product(other, workers))
+        if out is None:
+            result = self*other
+            if result is NotImplemented:
+                raise TypeError("Unsupported operand for matrix multiplication")
+            return result
+        if isinstance(other, Vector):
+            if not isinstance(out, Vector):
+                raise TypeError("Matrix-vector multiplication `out` should be a vector")
+            if self.dimensions[1] != other.dimensions:
+                raise DimensionsError("Incompatible matrix-vector for multiplication, expected matrix in the form m×n to be multiply by 1×n vector")
+            if out.dimensions != self.dimensions[0]:
+                raise DimensionsError("Matrix-vector multiplication `out` should have as many dimensions as the matrix rows")
+            out._assign(self.__matvec(other))
+            return out
+        if not isinstance(out, Matrix):
+            raise TypeError("Matrix multiplication `out` should be a matrix")
+        if isinstance(other, (int, float, complex)):
+            shape, kernel, operand = self.dimensions, np.multiply, other
+        elif isinstance(other, Matrix):
+            shape, kernel, operand = (self.dimensions[0], other.dimensions[1]), np.matmul, other.__data
+        else:
+            raise TypeError("Unsupported operand for matrix multiplication")
+        if out.dimensions != shape:
+            raise DimensionsError(f"Matrix multiplication `out` should be a {shape[0]}×{shape[1]} matrix")
+        dtype = np.result_type(self.__data, operand)
+        if dtype != object and _fits(out.__data, dtype):
+            workers = _workers_for(workers, *self.dimensions, shape[1]) if kernel is np.matmul else 1
+            # Row blocks written by one thread must not be read by another
+            if np.may_share_memory(out.__data, self.__data) or np.may_share_memory(out.__data, operand):
+                workers = 1
+            if _on_disk(self.__data, operand, out.__data) and not np.may_share_memory(out.__data, operand):
+                if kernel is np.matmul:
+                    _streamed_matmul(self.__data, operand, out.__data)
+                else:
+                    _blockwise(kernel, self.__data, operand, out.__data)
+            elif workers > 1:
+                _threaded_matmul(self.__data, operand, out.__data, workers)
+            else:
+                kernel(self.__data, operand, out=out.__data)
+        elif kernel is np.matmul:
+            out.__data = self.__product(other, workers)
+        else:
+            out.__data = (self*other).__data
+        out.__changed()
+        return out
+
+    def __matmul__(self, other):
+        """
+        Matrix multiplication operator
+
+        `matrix @ vector_array` is the same as `matrix.apply(vector_array)`, any other operand behaves as `*`
+        """
+        if isinstance(other, VectorArray):
+            return self.apply(other)
+        if isinstance(other, (Matrix, Vector)):
+            return self*other
+        return NotImplemented
+
+    def apply(self, vectors):
+        """
+        Batched matrix-vector multiplication
+
+        Transform every vector of the batch with the matrix as one matrix-matrix product, no intermediate `Vector` is built for the inputs or the results
+
+        Parameters
+        ----------
+        vectors: VectorArray | Sequence[Vector] | array-like
+            The batch of vectors, as a `VectorArray`, a sequence of `Vector` or an N×n array-like of rows
+
+        Return
+        ------
+        A `VectorArray` holding the transformed vectors in the input order
+
+        Raises
+        ------
+        TypeError
+            If the vectors are not numbers
+        DimensionsError
+            If the vectors dimensions do not match the matrix columns
+        """
+        if not isinstance(vectors, VectorArray):
+            vectors = list(vectors)
+            if not vectors:
+                return VectorArray(np.empty((0, self.dimensions[0]), dtype=self.__data.dtype))
+            if isinstance(vectors[0], Vector):
+                vectors = VectorArray.from_vectors(vectors)
+            else:
+                vectors = VectorArray(vectors)
+        if vectors.dimensions != self.dimensions[1]:
+            raise DimensionsError("Incompatible matrix-vector for multiplication, expected matrix in the form m×n to be multiply by 1×n vectors")
+        return VectorArray(np.asarray(vectors) @ self.__data.T)
+
+    def apply_stream(self, vectors, chunk_size: int = 4096):
+        """
+        Streaming batched matrix-vector multiplication
+
+        Consume an iterable of vectors lazily and yield the transformed vectors in chunks, so an unbounded stream goes through with memory bounded by `chunk_size`
+
+        Parameters
+        ----------
+        vectors: Iterable[Vector | VectorArray | Sequence[int | float]]
+            The stream, `Vector` objects and rows are grouped into chunks of `chunk_size`, a `VectorArray` in the stream is treated as a ready-made chunk
+        chunk_size: int (default 4096)
+            The number of vectors per chunk
+
+        Return
+        ------
+        An iterator of `VectorArray`, one per chunk, in the input order
+
+        Raises
+        ------
+        ValueError
+            If `chunk_size` is not positive
+        DimensionsError
+            If the vectors dimensions do not match the matrix columns
+        """
+        if not isinstance(chunk_size, int) or chunk_size < 1:
+            raise ValueError("chunk_size should be a positive integer")
+        chunk = []
+        for item in vectors:
+            if isinstance(item, VectorArray):
+                if chunk:
+                    yield self.apply(chunk)
+                    chunk = []
+                yield self.apply(item)
+                continue
+            chunk.append(item)
+            if len(chunk) == chunk_size:
+                yield self.apply(chunk)
+                chunk = []
+        if chunk:
+            yield self.apply(chunk)
+
+    def diagonal(self) -> list[int | float]:
+        """
+        The elements on the main diagonal
+        """
+        return np.diagonal(self.__data).tolist()
+
+    def __square(self, operation: str) -> int:
+        """
+        The matrix order, raise DimensionsError if the matrix is not square
+        """
+        rows, cols = self.dimensions
+        if rows != cols:
+            raise DimensionsError(f"{operation} is only supported for square matrices")
+        return rows
+
+    def __changed(self) -> None:
+        """
+        Drop the cached factorizations after the components changed
+        """
+        if self.__factors:
+            self.__factors = None
+
+    def __cache(self, kind: str, value):
+        """
+        Keep a factorization for the next calls, unless the buffer is shared outside the matrix
+        """
+        if self.__factors is None:
+            self.__factors = {}
+        if self.__factors is not False:
+            self.__factors[kind] = value
+        return value
+
+    def __factor(self, kind: str):
+        """
+        The cached factorization of the given kind, computed on first use
+        """
+        if self.__factors and kind in self.__factors:
+            return self.__factors[kind]
+        if kind == "lu":
+            self.__square("LU factorization")
+            return self.__cache(kind, _lu_factor(self.__data))
+        if kind == "qr":
+            return self.__cache(kind, np.linalg.qr(self.__data.astype(_inexact(self.__data))))
+        self.__square("Cholesky factorization")
+        data = self.__data.astype(_inexact(self.__data))
+        if not np.allclose(data, data.conj().T):
+            raise ValueError("Cholesky factorization required a symmetric matrix")
+        try:
+            return self.__cache(kind, np.linalg.cholesky(data))
+        except np.linalg.LinAlgError:
+            raise ValueError("Cholesky factorization required a positive definite matrix") from None
+
+    def lu(self) -> tuple:
+        """
+        LU factorization
+
+        Factor the square matrix with partial pivoting. The factorization is cached on the matrix, so `solve()`, `det()` and `inverse()` reuse it until the components change
+
+        Return
+        ------
+        `(P, L, U)` as matrices, where `P` is a permutation matrix, `L` is lower triangular with a unit diagonal and `U` is upper triangular, so that `P*A == L*U`
+
+        Raises
+        ------
+        DimensionsError
+            If the matrix is not square
+        """
+        lu, perm, _ = self.__factor("lu")
+        n = len(lu)
+        L = np.tril(lu, -1) + np.eye(n)
+        return (Matrix._from_trusted(np.eye(n, dtype=np.int64)[perm]),
+                Matrix._from_trusted(L), Matrix._from_trusted(np.triu(lu)))
+
+    def qr(self) -> tuple:
+        """
+        QR factorization
+
+        Factor the m×n matrix with Householder reflections into an orthonormal part and an upper triangular part. The factorization is cached on the matrix
+
+        Return
+        ------
+        `(Q, R)` as matrices, where `Q` is m×k with orthonormal columns and `R` is k×n upper triangular, k = min(m, n), so that `A == Q*R`
+        """
+        Q, R = self.__factor("qr")
+        return Matrix._from_trusted(Q.copy()), Matrix._from_trusted(R.copy())
+
+    def cholesky(self):
+        """
+        Cholesky factorization
+
+        Factor a symmetric positive definite matrix. The factorization is cached on the matrix
+
+        Return
+        ------
+        The lower triangular matrix `L` so that `A == L*L^T`
+
+        Raises
+        ------
+        DimensionsError
+            If the matrix is not square
+        ValueError
+            If the matrix is not symmetric positive definite
+        """
+        return Matrix._from_trusted(self.__factor("cholesky").copy())
+
+    def solve(self, b, method: str = "lu"):
+        """
+        Solve linear systems
+
+        Solve `A*x == b` with a cached factorization of `A`, the first call costs O(n³) and every later call with the same matrix only O(n²)
+
+        Parameters
+        ----------
+        b: Vector | Matrix | Expression
+            The right-hand side, a `Matrix` holds one right-hand side per column
+        method: str (default "lu")
+            "lu" for general square matrices, "cholesky" for symmetric positive definite ones (about twice as fast), "qr" also accepts tall matrices and gives the least squares solution
+
+        Return
+        ------
+        `x` with the same type as `b`
+
+        Raises
+        ------
+        TypeError
+            If `b` is not a vector or a matrix
+        ValueError
+            If the method is unknown
+        DimensionsError
+            If the matrix or `b` dimensions are not compatible
+        SingularMatrixError
+            If the matrix is singular
+        """
+        b = _evaluated(b)
+        if isinstance(b, Vector):
+            rhs = np.asarray(b)
+            rhs = rhs.astype(_inexact(rhs))
+        elif isinstance(b, Matrix):
+            rhs = b.__data
+        else:
+            raise TypeError("solve() accept a vector or a matrix as the right-hand side")
+        if method not in ("lu", "qr", "cholesky"):
+            raise ValueError("solve() method should be one of 'lu', 'qr' or 'cholesky'")
+        rows, cols = self.dimensions
+        if len(rhs) != rows:
+            raise DimensionsError("Incompatible right-hand side, expected as many components(rows) as the matrix rows")
+        if method == "qr":
+            if rows < cols:
+                raise DimensionsError("QR solve required a matrix with at least as many rows as columns")
+            Q, R = self.__factor("qr")
+            if _singular(np.diag(R)):
+                raise SingularMatrixError("Matrix is singular, columns are linearly dependent")
+            x = _back_substitution(R, Q.conj().T @ rhs)
+        elif method == "cholesky":
+            L = self.__factor("cholesky")
+            x = _back_substitution(L.conj().T, _forward_substitution(L, rhs))
+        else:
+            lu, perm, _ = self.__factor("lu")
+            if _singular(np.diag(lu)):
+                raise SingularMatrixError("Matrix is singular")
+            x = _back_substitution(lu, _forward_substitution(lu, rhs[perm], unit_diagonal=True))
+        if isinstance(b, Vector):
+            return Vector._from_trusted(x if np.iscomplexobj(x) else x.tolist())
+        return Matrix._from_trusted(x)
+
+    def det(self) -> float | complex:
+        """
+        Determinant
+
+        Computed from the cached LU factorization, complex for a complex matrix
+
+        Raises
+        ------
+        DimensionsError
+            If the matrix is not square
+        """
+        lu, _, swaps = self.__factor("lu")
+        return ((-1)**swaps*np.prod(np.diag(lu))).item()
+
+    def inverse(self):
+        """
+        Inverse matrix
+
+        Computed by solving against the identity with the cached LU factorization
+
+        Raises
+        ------
+        DimensionsError
+            If the matrix is not square
+        SingularMatrixError
+            If the matrix is singular
+        """
+        n = self.__square("Inverse")
+        return self.solve(Matrix._from_trusted(np.eye(n)))
+
+    def __symmetric(self) -> bool:
+        """
+        Whether the matrix is square and equal to its conjugate transpose, up to rounding, so symmetric for a real matrix and Hermitian for a complex one
+        """
+        rows, cols = self.dimensions
+        return rows == cols and np.allclose(self.__data, self.__data.conj().T)
+
+    def __eigen(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        The cached full eigen decomposition, sorted from the largest to the smallest eigenvalue magnitude
+        """
+        if self.__factors and "eig" in self.__factors:
+            return self.__factors["eig"]
+        self.__square("Eigen decomposition")
+        data = self.__data.astype(_inexact(self.__data))
+        if self.__symmetric():
+            values, vectors = np.linalg.eigh(data)
+        else:
+            values, vectors = np.linalg.eig(data)
+        order = _by_magnitude(values)
+        return self.__cache("eig", (values[order], vectors[:, order]))
+
+    def eigvals(self) -> list[float | complex]:
+        """
+        Eigenvalues
+
+        Computed with the QR algorithm on the whole matrix (O(n³)), the symmetric solver is used for symmetric matrices so their eigenvalues are always real. The decomposition is cached on the matrix
+
+        Return
+        ------
+        The n eigenvalues from the largest to the smallest magnitude, complex numbers for a non-symmetric matrix with complex eigenvalues
+
+        Raises
+        ------
+        DimensionsError
+            If the matrix is not square
+        """
+        return self.__eigen()[0].tolist()
+
+    def eig(self) -> tuple:
+        """
+        Eigenvalues and eigenvectors
+
+        Full decomposition with the QR algorithm, see `eigvals()`. For only a few eigenpairs of a large matrix, `top_k_eig()` is much cheaper
+
+        Return
+        ------
+        `(values, vectors)`, a list of the n eigenvalues from the largest to the smallest magnitude and a list of the matching unit eigenvectors as `Vector`, so that `A*vectors[i] == values[i]*vectors[i]`
+
+        Raises
+        ------
+        DimensionsError
+            If the matrix is not square
+        """
+        values, vectors = self.__eigen()
+        return values.tolist(), [Vector._from_trusted(column if np.iscomplexobj(column) else column.tolist()) for column in vectors.T]
+
+    def top_k_eig(self, k: int, tol: float = 1e-10, maxiter: int = 1000) -> tuple:
+        """
+        The k eigenpairs of largest magnitude
+
+        Only use matrix-vector products, so it costs about O(n²) per iteration instead of the O(n³) of `eig()`, which pays off when k is much smaller than n. Symmetric matrices use Lanczos iteration, general matrices use block power (subspace) iteration, which converges slower when the k-th and the next eigenvalues have close magnitudes
+
+        Parameters
+        ----------
+        k: int
+            The number of eigenpairs
+        tol: float (default 1e-10)
+            The relative residual `||A*v - λ*v||` accepted for every eigenpair
+        maxiter: int (default 1000)
+            The maximum number of block iterations for non-symmetric matrices
+
+        Return
+        ------
+        `(values, vectors)` like `eig()`, limited to the k eigenvalues of largest magnitude
+
+        Raises
+        ------
+        DimensionsError
+            If the matrix is not square
+        ValueError
+            If k is not between 1 and n
+        ConvergenceError
+            If the iteration of a non-symmetric matrix did not converge
+        """
+        n = self.__square("Eigen decomposition")
+        data = self.__data if self.__data.dtype != object else self.__data.astype(float)
+        return _top_k_eig(data.__matmul__, n, k, self.__symmetric() and not np.iscomplexobj(data), tol, maxiter)
+
+    def __eq__(self, other):
+        """
+        Equal statement
+
+        The equality of vectors 
+
+        Parameters
+        ----------
+        self: Matrix
+        other: Any
 
         Return 
         ------
         True if two matrices components are the same 
-        else it will return False. If the other is not `Matrix` type, automatically return False
+        else it will return False. A `Matrix3` or `Matrix4` compares by its elements, for any other type NotImplemented is returned so the other operand decides, a lazy `Expression` compares by its value and other types compare unequal
         """
+        if isinstance(other, _FixedMatrix):
+            return other == self
         if not isinstance(other, Matrix):
-            return False 
-        return self.components == other.components
+            return NotImplemented
+        if self.dimensions != other.dimensions:
+            return False
+        return bool((self.__data == other.__data).all())
 
     def __ne__(self, other):
         """
@@ -245,8 +1646,891 @@ class Matrix:
         Return 
         ------
         True if two matrices components are not the same 
-        else it will return False. If the other is not `Matrix` type, automatically return True
+        else it will return False. A `Matrix3` or `Matrix4` compares by its elements, for any other type NotImplemented is returned so the other operand decides
         """
+        if isinstance(other, _FixedMatrix):
+            return other != self
         if not isinstance(other, Matrix):
-            return True
-        return self.components != other.components 
\ No newline at end of file
+            return NotImplemented
+        return not self == other 
+
+def _chain_order(shapes: list[tuple[int, int]]) -> tuple[int, list[list[int]]]:
+    """
+    The cheapest parenthesization of a chain of products, by dynamic programming
+
+    `cost[i][j]` is the fewest scalar multiplications for the operands i..j, and `split[i][j]` the k where that product splits into (i..k)(k+1..j). O(n³) in the chain length, which is negligible next to any product
+
+    Return
+    ------
+    `(cost, split)`, the total scalar multiplications of the best order and the split table
+    """
+    n = len(shapes)
+    dims = [shapes[0][0]] + [shape[1] for shape in shapes]
+    cost = [[0]*n for _ in range(n)]
+    split = [[0]*n for _ in range(n)]
+    for length in range(1, n):
+        for i in range(n - length):
+            j = i + length
+            cost[i][j], split[i][j] = min((cost[i][k] + cost[k+1][j] + dims[i]*dims[k+1]*dims[j+1], k)
+                                          for k in range(i, j))
+    return cost[0][n-1], split
+
+def _chain_product(operands: list):
+    """
+    Multiply a chain of matrices, optionally ending with a vector, in the cheapest order, dimensions already checked
+    """
+    shapes = [(operand.dimensions, 1) if isinstance(operand, Vector) else operand.dimensions for operand in operands]
+    _, split = _chain_order(shapes)
+
+    def product(i: int, j: int):
+        if i == j:
+            return operands[i]
+        k = split[i][j]
+        return product(i, k)*product(k + 1, j)
+
+    return product(0, len(operands) - 1)
+
+def multi_dot(operands):
+    """
+    Chain multiplication
+
+    Multiply a chain of matrices, optionally ending with a vector, in the cheapest order. Left-to-right `A*B*C*...` can cost orders of magnitude more scalar multiplications than the best parenthesization when the shapes differ a lot, for example `A*B*v` forms the whole matrix `A*B` where `A*(B*v)` only needs two matrix-vector products. The order is found by dynamic programming over the `dimensions` of the operands
+
+    Parameters
+    ----------
+    operands: list[Matrix | Vector | Expression]
+        The matrices to multiply, left to right, the last one may be a `Vector`
+
+    Return
+    ------
+    The product, a `Matrix`, or a `Vector` when the chain ends with a vector
+
+    Raises
+    ------
+    TypeError
+        If an operand is not a matrix, or a vector anywhere else but at the end
+    ValueError
+        If the chain is empty
+    DimensionsError
+        If two neighbouring operands are not compatible for multiplication
+    """
+    operands = [_evaluated(operand) for operand in operands]
+    if not operands:
+        raise ValueError("multi_dot() required at least one operand")
+    for i, operand in enumerate(operands):
+        if not isinstance(operand, Matrix) and not (isinstance(operand, Vector) and i == len(operands) - 1 and i > 0):
+            raise TypeError("multi_dot() accept matrices, and a vector as the last operand only")
+    for i, (left, right) in enumerate(zip(operands, operands[1:])):
+        rows = right.dimensions if isinstance(right, Vector) else right.dimensions[0]
+        if left.dimensions[1] != rows:
+            raise DimensionsError(f"Incompatible operands {i} and {i + 1} for multiplication, expected matrix in the form m×n to be multiply by n×p or by 1×n vector")
+    with config.lazy(False):
+        return _chain_product(operands)
+
+def _segment_sums(values: np.ndarray, indptr: np.ndarray, dtype) -> np.ndarray:
+    """
+    Sum `values` over the CSR row segments given by `indptr`, empty rows sum to 0
+    """
+    result = np.zeros((len(indptr) - 1,) + values.shape[1:], dtype=dtype)
+    starts = indptr[:-1]
+    nonempty = starts < indptr[1:]
+    if nonempty.any():
+        result[nonempty] = np.add.reduceat(values, starts[nonempty], axis=0)
+    return result
+
+def _coo_to_csr(rows: np.ndarray, cols: np.ndarray, values: np.ndarray, shape: tuple[int, int]) -> tuple:
+    """
+    Sort COO triplets into CSR arrays, summing duplicates and dropping zeros
+    """
+    width = max(shape[1], 1)
+    keys = rows.astype(np.int64)*width + cols
+    order = np.argsort(keys, kind="stable")
+    keys, values = keys[order], values[order]
+    if len(keys):
+        starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+        keys, values = keys[starts], np.add.reduceat(values, starts)
+    kept = values != 0
+    keys, values = keys[kept], values[kept]
+    indptr = np.zeros(shape[0] + 1, dtype=np.int64)
+    np.cumsum(np.bincount(keys//width, minlength=shape[0]), out=indptr[1:])
+    return values, keys % width, indptr
+
+class SparseMatrix:
+    """
+Sparse matrices
+
+    `SparseMatrix` only stores the nonzero elements of a matrix in compressed sparse row (CSR) form, so memory and multiplication time grow with the number of nonzeros instead of rows×cols. It is built from coordinate (COO) triplets or from a dense `Matrix`
+    Supported operations: addition, subtraction, multiplication
+        Addition and subtraction with another `SparseMatrix` stay sparse, with a dense `Matrix` they give a `Matrix`
+        Multiplication supports scalar, `Vector` and dense `Matrix` on the right, and a dense `Matrix` on the left
+    Supported statements:
+        Equality(==): True if the other sparse or dense matrix has the same dimensions and elements else False
+        Non-equality(!=): The opposite
+    Representation:
+        Formatted as `SparseMatrix((rows, cols), {(row, col): value, ...})`
+
+    Attributes
+    ----------
+    __data: numpy.ndarray
+        The nonzero values, row by row
+    __indices: numpy.ndarray
+        The column of every nonzero value
+    __indptr: numpy.ndarray
+        Where every row starts in `__data`, with one extra element for the end
+    __shape: tuple[int, int]
+        The (rows, cols) of the matrix
+
+    Properties
+    ----------
+    components(self) -> list[list[int | float]]
+        The dense components as a list of rows
+    dimensions(self) -> tuple
+        The (rows, cols) of the matrix
+    nnz(self) -> int
+        The number of stored nonzeros
+
+    Methods
+    -------
+    from_matrix(matrix) -> SparseMatrix
+        Build from a dense `Matrix`
+    to_matrix(self) -> Matrix
+        Convert into a dense `Matrix`
+    transpose(self) -> SparseMatrix
+        The transposed matrix
+    diagonal(self) -> list[int | float]
+        The elements on the main diagonal
+    top_k_eig(self, k: int, tol: float = 1e-10, maxiter: int = 1000) -> tuple[list, list[Vector]]
+        The k eigenpairs of largest magnitude, only with sparse matrix-vector products
+    """
+
+    __slots__ = ("__data", "__indices", "__indptr", "__shape")
+
+    def __init__(self, rows, cols, values, shape: tuple[int, int]) -> None:
+        """
+        Initialize from COO triplets
+
+        Parameters
+        ----------
+        rows: Sequence[int]
+            The row of every element
+        cols: Sequence[int]
+            The column of every element
+        values: Sequence[int | float | complex]
+            The value of every element, values given twice for the same position are summed and zeros are not stored
+        shape: tuple[int, int]
+            The (rows, cols) of the matrix
+
+        Raises
+        ------
+        TypeError
+            If the values are not numbers or the positions are not integers
+        DimensionsError
+            If the three sequences do not have the same length or a position is out of the matrix
+        """
+        rows, cols, values = np.asarray(rows), np.asarray(cols), np.asarray(values)
+        if values.dtype == np.bool_:
+            values = values.astype(np.int64)
+        if values.dtype.kind not in "iufc":
+            raise TypeError("SparseMatrix values should be of type `int`, `float` or `complex`")
+        if len(rows) and (rows.dtype.kind not in "iu" or cols.dtype.kind not in "iu"):
+            raise TypeError("SparseMatrix positions should be of type `int`")
+        rows, cols = rows.astype(np.int64, copy=False), cols.astype(np.int64, copy=False)
+        if not (rows.ndim == cols.ndim == values.ndim == 1 and len(rows) == len(cols) == len(values)):
+            raise DimensionsError("SparseMatrix rows, cols and values should be flat and the same length")
+        shape = (int(shape[0]), int(shape[1]))
+        if len(rows) and (rows.min() < 0 or cols.min() < 0 or rows.max() >= shape[0] or cols.max() >= shape[1]):
+            raise DimensionsError(f"SparseMatrix positions should be inside the {shape[0]}×{shape[1]} matrix")
+        self.__data, self.__indices, self.__indptr = _coo_to_csr(rows, cols, values, shape)
+        self.__shape = shape
+
+    @classmethod
+    def _from_csr(cls, data: np.ndarray, indices: np.ndarray, indptr: np.ndarray, shape: tuple[int, int]):
+        """
+        Trusted constructor from CSR arrays, without copying or checking them
+        """
+        matrix = cls.__new__(cls)
+        matrix.__data, matrix.__indices, matrix.__indptr, matrix.__shape = data, indices, indptr, shape
+        return matrix
+
+    @staticmethod
+    def from_matrix(matrix: Matrix):
+        """
+        Build from a dense matrix, keeping only its nonzero elements
+
+        Raises
+        ------
+        TypeError
+            If the input is not a `Matrix`
+        """
+        if not isinstance(matrix, Matrix):
+            raise TypeError("SparseMatrix.from_matrix() accept a matrix only")
+        dense = matrix._storage()
+        rows, cols = np.nonzero(dense)
+        indptr = np.zeros(dense.shape[0] + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=dense.shape[0]), out=indptr[1:])
+        return SparseMatrix._from_csr(dense[rows, cols], cols, indptr, dense.shape)
+
+    def _csr(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        The `(data, indices, indptr)` CSR arrays, shared and not copied, for use inside the package
+        """
+        return self.__data, self.__indices, self.__indptr
+
+    def diagonal(self) -> list[int | float]:
+        """
+        The elements on the main diagonal, zeros included
+        """
+        diagonal = np.zeros(min(self.__shape), dtype=self.__data.dtype)
+        rows = self.__row_ids()
+        on_diagonal = rows == self.__indices
+        diagonal[rows[on_diagonal]] = self.__data[on_diagonal]
+        return diagonal.tolist()
+
+    def __row_ids(self) -> np.ndarray:
+        """
+        The row of every stored nonzero
+        """
+        return np.repeat(np.arange(self.__shape[0]), np.diff(self.__indptr))
+
+    def to_matrix(self) -> Matrix:
+        """
+        Convert into a dense `Matrix`
+        """
+        dense = np.zeros(self.__shape, dtype=self.__data.dtype)
+        dense[self.__row_ids(), self.__indices] = self.__data
+        return Matrix._from_trusted(dense)
+
+    @property
+    def components(self) -> list[list[int | float]]:
+        """
+        The dense components as a list of rows
+        """
+        return self.to_matrix().components
+
+    @property
+    def dimensions(self) -> tuple:
+        """
+        The (rows, cols) of the matrix
+        """
+        return self.__shape
+
+    @property
+    def nnz(self) -> int:
+        """
+        The number of stored nonzeros
+        """
+        return len(self.__data)
+
+    def __repr__(self) -> str:
+        """
+        Representation
+
+        form:
+            `SparseMatrix((rows, cols), {(row, col): value, ...})`
+        """
+        entries = dict(zip(zip(self.__row_ids().tolist(), self.__indices.tolist()), self.__data.tolist()))
+        return f"SparseMatrix({self.__shape}, {entries})"
+
+    def transpose(self):
+        """
+        The transposed matrix, as a new `SparseMatrix`
+        """
+        rows, cols = self.__shape
+        data, indices, indptr = _coo_to_csr(self.__indices, self.__row_ids(), self.__data, (cols, rows))
+        return SparseMatrix._from_csr(data, indices, indptr, (cols, rows))
+
+    def __combine(self, other, sign: int, symbol: str):
+        """
+        `self + sign*other`, sparse with a sparse operand and dense with a `Matrix` operand
+        """
+        if self.__shape != other.dimensions:
+            raise DimensionsError(f"Operand `{symbol}` required two matrices with the same dimensions")
+        if isinstance(other, Matrix):
+            dense = self.to_matrix()._storage()
+            return Matrix._from_trusted(dense + sign*other._storage())
+        rows = np.concatenate((self.__row_ids(), other.__row_ids()))
+        cols = np.concatenate((self.__indices, other.__indices))
+        values = np.concatenate((self.__data, sign*other.__data))
+        return SparseMatrix._from_csr(*_coo_to_csr(rows, cols, values, self.__shape), self.__shape)
+
+    def __add__(self, other):
+        """
+        Addition
+
+        Raises
+        ------
+        DimensionsError
+            If the matrices are not having the same dimensions
+        """
+        if not isinstance(other, (SparseMatrix, Matrix)):
+            return NotImplemented
+        return self.__combine(other, 1, "+")
+
+    def __radd__(self, other):
+        """
+        Addition with a dense matrix on the left
+        """
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        return self.__combine(other, 1, "+")
+
+    def __sub__(self, other):
+        """
+        Subtraction
+
+        Raises
+        ------
+        DimensionsError
+            If the matrices are not having the same dimensions
+        """
+        if not isinstance(other, (SparseMatrix, Matrix)):
+            return NotImplemented
+        return self.__combine(other, -1, "-")
+
+    def __rsub__(self, other):
+        """
+        Subtraction from a dense matrix on the left
+        """
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        return (self*-1).__combine(other, 1, "-")
+
+    def __mul__(self, other):
+        """
+        Multiplication
+
+        Multiply by a scalar, a vector or a dense matrix, only the stored nonzeros take part
+
+        Return
+        ------
+        Scalar: a `SparseMatrix`
+        Vector: a `Vector`
+        Matrix: a dense `Matrix`
+
+        Raises
+        ------
+        DimensionsError
+            If the operand is not compatible for multiplication
+        """
+        other = _evaluated(other)
+        if isinstance(other, (int, float, complex)):
+            return SparseMatrix._from_csr(*_coo_to_csr(self.__row_ids(), self.__indices, self.__data*other, self.__shape), self.__shape)
+        if isinstance(other, Vector):
+            if self.__shape[1] != other.dimensions:
+                raise DimensionsError("Incompatible matrix-vector for multiplication, expected matrix in the form m×n to be multiply by 1×n vector")
+            x = self.__apply(np.asarray(other))
+            return Vector._from_trusted(x if np.iscomplexobj(x) else x.tolist())
+        if isinstance(other, Matrix):
+            B = other._storage()
+            if self.__shape[1] != B.shape[0]:
+                raise DimensionsError("Incompatible matrices for multiplication, expected matrix in the form m×n to b multiply by n×p")
+            return Matrix._from_trusted(self.__apply(B))
+        return NotImplemented
+
+    def __apply(self, x: np.ndarray) -> np.ndarray:
+        """
+        Multiply by a 1-D array or by the columns of a 2-D array, without checking the dimensions
+        """
+        values = self.__data.reshape((-1,) + (1,)*(x.ndim - 1))
+        products = values*x[self.__indices]
+        return _segment_sums(products, self.__indptr, products.dtype)
+
+    def __rmul__(self, other):
+        """
+        Multiplication with a dense matrix on the left, computed as `(self^T * other^T)^T`
+        """
+        other = _evaluated(other)
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        if other.dimensions[1] != self.__shape[0]:
+            raise DimensionsError("Incompatible matrices for multiplication, expected matrix in the form m×n to b multiply by n×p")
+        product = self.transpose()*Matrix._from_trusted(other._storage().T)
+        return Matrix._from_trusted(np.ascontiguousarray(product._storage().T))
+
+    def top_k_eig(self, k: int, tol: float = 1e-10, maxiter: int = 1000) -> tuple:
+        """
+        The k eigenpairs of largest magnitude
+
+        Same as `Matrix.top_k_eig()`, every iteration only costs O(nnz), the matrix is never made dense
+
+        Return
+        ------
+        `(values, vectors)`, a list of the k eigenvalues from the largest to the smallest magnitude and a list of the matching unit eigenvectors as `Vector`
+
+        Raises
+        ------
+        DimensionsError
+            If the matrix is not square
+        ValueError
+            If k is not between 1 and n
+        ConvergenceError
+            If the iteration of a non-symmetric matrix did not converge
+        """
+        rows, cols = self.__shape
+        if rows != cols:
+            raise DimensionsError("Eigen decomposition is only supported for square matrices")
+        return _top_k_eig(self.__apply, rows, k, self == self.transpose(), tol, maxiter)
+
+    def __eq__(self, other) -> bool:
+        """
+        Equal statement
+
+        A dense `Matrix` compares by its elements without making `self` dense, for any other type NotImplemented is returned so the other operand decides
+        """
+        if isinstance(other, Matrix):
+            B = other._storage()
+            return (self.__shape == B.shape and np.count_nonzero(B) == np.count_nonzero(self.__data)
+                    and bool((B[self.__row_ids(), self.__indices] == self.__data).all()))
+        if not isinstance(other, SparseMatrix):
+            return NotImplemented
+        return (self.__shape == other.__shape and np.array_equal(self.__indptr, other.__indptr)
+                and np.array_equal(self.__indices, other.__indices) and np.array_equal(self.__data, other.__data))
+
+    def __ne__(self, other) -> bool:
+        """
+        Not equal statement
+
+        The opposite of `==`, for types other than `SparseMatrix` and `Matrix` NotImplemented is returned so the other operand decides
+        """
+        if not isinstance(other, (SparseMatrix, Matrix)):
+            return NotImplemented
+        return not self == other
+
+class _FixedMatrix:
+    """
+Fixed-size matrices
+
+    Common base of `Matrix3` and `Matrix4`. The elements are kept as one flat row-major tuple of Python numbers, so the small products, determinants and inverses the subclasses write out term by term run without any loop, buffer or dimensions check
+    Supported operations: addition, subtraction, multiplication, true division
+        Multiplication supports scalar, `Vector`, the same fixed-size type and any general `Matrix`, on both sides for matrices, a general matrix operand gives a general `Matrix`
+    Supported statements:
+        Equality(==): True if the other is a fixed-size or general matrix with the same elements else False
+        Non-equality(!=): The opposite
+    Representation:
+        Formatted as `Matrix3(*components)` or `Matrix4(*components)`
+
+    Attributes
+    ----------
+    _elements: tuple
+        The n×n elements, row by row
+    _N: int
+        The order of the matrix, set by the subclasses
+
+    Properties
+    ----------
+    components(self) -> list[list[int | float]]
+        The components as a list of rows
+    dimensions(self) -> tuple
+        (n, n)
+    T(self)
+        The transposed matrix
+
+    Methods
+    -------
+    identity() -> Matrix3 | Matrix4
+        The identity matrix
+    from_matrix(matrix: Matrix) -> Matrix3 | Matrix4
+        Convert a general n×n `Matrix`
+    to_matrix(self) -> Matrix
+        Convert into a general `Matrix`
+    det(self) -> int | float
+        The determinant
+    inverse(self) -> Matrix3 | Matrix4
+        The inverse matrix
+    """
+
+    __slots__ = ("_elements",)
+    _N = 0
+
+    def __init__(self, *args: list[int | float]) -> None:
+        """
+        Initialize the matrix
+
+        Parameters
+        ----------
+        *args: list[int | float]
+            The n rows of n elements
+
+        Raises
+        ------
+        TypeError
+            If an element is not a number, only checked while validation is on, see `config.set_validation()`
+        DimensionsError
+            If there are not n rows of n elements
+        """
+        n = self._N
+        if len(args) != n or any(len(row) != n for row in args):
+            raise DimensionsError(f"{type(self).__name__} required {n} rows of {n} elements")
+        elements = tuple(element for row in args for element in row)
+        if config._validate:
+            for element in elements:
+                if not isinstance(element, (int, float)):
+                    raise TypeError("Matrix components(rows) should be a list with elements of type `int` or `float`")
+        self._elements = elements
+
+    @classmethod
+    def _from_trusted(cls, elements: tuple):
+        """
+        Trusted constructor, wrap a flat row-major tuple of n×n numbers without checking it
+        """
+        matrix = cls.__new__(cls)
+        matrix._elements = elements
+        return matrix
+
+    @classmethod
+    def identity(cls):
+        """
+        The identity matrix
+        """
+        n = cls._N
+        return cls._from_trusted(tuple(int(i == j) for i in range(n) for j in range(n)))
+
+    @classmethod
+    def from_matrix(cls, matrix: Matrix):
+        """
+        Convert a general `Matrix`
+
+        Raises
+        ------
+        TypeError
+            If the input is not a matrix
+        DimensionsError
+            If the matrix is not n×n
+        """
+        if not isinstance(matrix, Matrix):
+            raise TypeError(f"{cls.__name__}.from_matrix() accept a `Matrix` only")
+        if matrix.dimensions != (cls._N, cls._N):
+            raise DimensionsError(f"{cls.__name__}.from_matrix() required a {cls._N}×{cls._N} matrix")
+        return cls._from_trusted(tuple(matrix._storage().ravel().tolist()))
+
+    def to_matrix(self) -> Matrix:
+        """
+        Convert into a general `Matrix`, for the methods only general matrices have, like `solve()` or `eig()`
+        """
+        return Matrix._from_trusted(_buffer_from_rows(self.components))
+
+    @property
+    def components(self) -> list[list[int | float]]:
+        """
+        The components as a list of rows
+        """
+        n = self._N
+        return [list(self._elements[i:i + n]) for i in range(0, n*n, n)]
+
+    @property
+    def dimensions(self) -> tuple:
+        """
+        (n, n)
+        """
+        return (self._N, self._N)
+
+    @property
+    def T(self):
+        """
+        The transposed matrix
+        """
+        n = self._N
+        return self._from_trusted(self._elements[0::n] + tuple(element for j in range(1, n) for element in self._elements[j::n]))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}{tuple(self.components)}"
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        """
+        The n×n numpy array, always a new array
+        """
+        return np.array(self._elements, dtype=dtype).reshape(self._N, self._N)
+
+    def __add__(self, other):
+        """
+        Addition with the same fixed-size type, or with a general `Matrix` giving a `Matrix`
+
+        Raises
+        ------
+        DimensionsError
+            If a general matrix operand is not n×n
+        """
+        if type(other) is type(self):
+            return self._from_trusted(tuple(map(operator.add, self._elements, other._elements)))
+        if isinstance(other, Matrix):
+            return self.to_matrix() + other
+        return NotImplemented
+
+    def __radd__(self, other):
+        if isinstance(other, Matrix):
+            return other + self.to_matrix()
+        return NotImplemented
+
+    def __sub__(self, other):
+        """
+        Subtraction with the same fixed-size type, or with a general `Matrix` giving a `Matrix`
+
+        Raises
+        ------
+        DimensionsError
+            If a general matrix operand is not n×n
+        """
+        if type(other) is type(self):
+            return self._from_trusted(tuple(map(operator.sub, self._elements, other._elements)))
+        if isinstance(other, Matrix):
+            return self.to_matrix() - other
+        return NotImplemented
+
+    def __rsub__(self, other):
+        if isinstance(other, Matrix):
+            return other - self.to_matrix()
+        return NotImplemented
+
+    def __mul__(self, other):
+        """
+        Multiplication
+
+        Return
+        ------
+        Scalar or the same fixed-size type: the same fixed-size type
+        Vector: a `Vector`
+        Matrix: a general `Matrix`
+
+        Raises
+        ------
+        DimensionsError
+            If the vector or general matrix operand is not compatible for multiplication
+        """
+        other = _evaluated(other)
+        if isinstance(other, (int, float)):
+            return self._from_trusted(tuple(element*other for element in self._elements))
+        if type(other) is type(self):
+            return self._from_trusted(self._product(other._elements))
+        if isinstance(other, Vector):
+            if other.dimensions != self._N:
+                raise DimensionsError(f"Incompatible matrix-vector for multiplication, expected a {self._N}-dimensional vector")
+            return Vector._from_trusted(self._apply(other.components))
+        if isinstance(other, Matrix):
+            return self.to_matrix()*other
+        return NotImplemented
+
+    def __rmul__(self, other):
+        """
+        Multiplication by a general `Matrix` on the left, giving a `Matrix`
+        """
+        other = _evaluated(other)
+        if isinstance(other, Matrix):
+            return other*self.to_matrix()
+        return NotImplemented
+
+    def __truediv__(self, other: int | float):
+        """
+        Scalar true division
+
+        Raises
+        ------
+        TypeError
+            If the other is not a scalar
+        """
+        if not isinstance(other, (int, float)):
+            raise TypeError("Matrix true division using `/` is for scalar only")
+        return self._from_trusted(tuple(element/other for element in self._elements))
+
+    def inverse(self):
+        """
+        The inverse matrix, from the adjugate divided by the determinant
+
+        Raises
+        ------
+        SingularMatrixError
+            If the determinant is 0
+        """
+        det, adjugate = self._adjugate()
+        if det == 0:
+            raise SingularMatrixError("Matrix is singular")
+        return self._from_trusted(tuple(element/det for element in adjugate))
+
+    def __eq__(self, other) -> bool:
+        """
+        Equal statement
+
+        True if the other is a fixed-size or general matrix with the same elements, NotImplemented for types other than matrices so the other operand decides
+        """
+        if type(other) is type(self):
+            return self._elements == other._elements
+        if isinstance(other, Matrix):
+            return other.dimensions == self.dimensions and other._storage().ravel().tolist() == list(self._elements)
+        if isinstance(other, _FixedMatrix):
+            return False
+        return NotImplemented
+
+    def __ne__(self, other) -> bool:
+        return not self == other
+
+
+class Matrix3(_FixedMatrix):
+    """
+3×3 matrices
+
+    A `_FixedMatrix` of order 3 for rotations and other linear maps of 3D vectors, every operation is written out term by term
+    """
+
+    __slots__ = ()
+    _N = 3
+
+    def _product(self, b: tuple) -> tuple:
+        """
+        The elements of the product with another 3×3 matrix
+        """
+        a00, a01, a02, a10, a11, a12, a20, a21, a22 = self._elements
+        b00, b01, b02, b10, b11, b12, b20, b21, b22 = b
+        return (a00*b00 + a01*b10 + a02*b20, a00*b01 + a01*b11 + a02*b21, a00*b02 + a01*b12 + a02*b22,
+                a10*b00 + a11*b10 + a12*b20, a10*b01 + a11*b11 + a12*b21, a10*b02 + a11*b12 + a12*b22,
+                a20*b00 + a21*b10 + a22*b20, a20*b01 + a21*b11 + a22*b21, a20*b02 + a21*b12 + a22*b22)
+
+    def _apply(self, v: list) -> list:
+        """
+        The components of the product with a 3D vector
+        """
+        a00, a01, a02, a10, a11, a12, a20, a21, a22 = self._elements
+        x, y, z = v
+        return [a00*x + a01*y + a02*z, a10*x + a11*y + a12*z, a20*x + a21*y + a22*z]
+
+    def transform(self, vector):
+        """
+        Apply the matrix to a 3D vector, the same as `self*vector`
+
+        Raises
+        ------
+        DimensionsError
+            If the vector is not 3-dimensional
+        """
+        return self*vector
+
+    def det(self) -> int | float:
+        """
+        The determinant, by cofactor expansion along the first row
+        """
+        a00, a01, a02, a10, a11, a12, a20, a21, a22 = self._elements
+        return a00*(a11*a22 - a12*a21) - a01*(a10*a22 - a12*a20) + a02*(a10*a21 - a11*a20)
+
+    def _adjugate(self) -> tuple[int | float, tuple]:
+        """
+        The determinant and the elements of the adjugate matrix
+        """
+        a00, a01, a02, a10, a11, a12, a20, a21, a22 = self._elements
+        c00 = a11*a22 - a12*a21
+        c01 = a12*a20 - a10*a22
+        c02 = a10*a21 - a11*a20
+        det = a00*c00 + a01*c01 + a02*c02
+        return det, (c00, a02*a21 - a01*a22, a01*a12 - a02*a11,
+                     c01, a00*a22 - a02*a20, a02*a10 - a00*a12,
+                     c02, a01*a20 - a00*a21, a00*a11 - a01*a10)
+
+
+class Matrix4(_FixedMatrix):
+    """
+4×4 matrices
+
+    A `_FixedMatrix` of order 4 for homogeneous transforms of 3D points and directions, every operation is written out term by term
+    """
+
+    __slots__ = ()
+    _N = 4
+
+    def _product(self, b: tuple) -> tuple:
+        """
+        The elements of the product with another 4×4 matrix
+        """
+        a00, a01, a02, a03, a10, a11, a12, a13, a20, a21, a22, a23, a30, a31, a32, a33 = self._elements
+        b00, b01, b02, b03, b10, b11, b12, b13, b20, b21, b22, b23, b30, b31, b32, b33 = b
+        return (a00*b00 + a01*b10 + a02*b20 + a03*b30, a00*b01 + a01*b11 + a02*b21 + a03*b31,
+                a00*b02 + a01*b12 + a02*b22 + a03*b32, a00*b03 + a01*b13 + a02*b23 + a03*b33,
+                a10*b00 + a11*b10 + a12*b20 + a13*b30, a10*b01 + a11*b11 + a12*b21 + a13*b31,
+                a10*b02 + a11*b12 + a12*b22 + a13*b32, a10*b03 + a11*b13 + a12*b23 + a13*b33,
+                a20*b00 + a21*b10 + a22*b20 + a23*b30, a20*b01 + a21*b11 + a22*b21 + a23*b31,
+                a20*b02 + a21*b12 + a22*b22 + a23*b32, a20*b03 + a21*b13 + a22*b23 + a23*b33,
+                a30*b00 + a31*b10 + a32*b20 + a33*b30, a30*b01 + a31*b11 + a32*b21 + a33*b31,
+                a30*b02 + a31*b12 + a32*b22 + a33*b32, a30*b03 + a31*b13 + a32*b23 + a33*b33)
+
+    def _apply(self, v: list) -> list:
+        """
+        The components of the product with a 4D vector
+        """
+        a00, a01, a02, a03, a10, a11, a12, a13, a20, a21, a22, a23, a30, a31, a32, a33 = self._elements
+        x, y, z, w = v
+        return [a00*x + a01*y + a02*z + a03*w, a10*x + a11*y + a12*z + a13*w,
+                a20*x + a21*y + a22*z + a23*w, a30*x + a31*y + a32*z + a33*w]
+
+    def transform_point(self, vector):
+        """
+        Transform a 3D point
+
+        The point is extended with w = 1, so translations apply, and the result is divided by its w when it is not 1, as after a projection
+
+        Raises
+        ------
+        DimensionsError
+            If the vector is not 3-dimensional
+        ZeroDivisionError
+            If the transformed w is 0
+        """
+        if not isinstance(vector, Vector) or vector.dimensions != 3:
+            raise DimensionsError("transform_point() required a 3D vector")
+        a00, a01, a02, a03, a10, a11, a12, a13, a20, a21, a22, a23, a30, a31, a32, a33 = self._elements
+        x, y, z = vector.components
+        px = a00*x + a01*y + a02*z + a03
+        py = a10*x + a11*y + a12*z + a13
+        pz = a20*x + a21*y + a22*z + a23
+        w = a30*x + a31*y + a32*z + a33
+        if w != 1:
+            return Vector._from_trusted([px/w, py/w, pz/w])
+        return Vector._from_trusted([px, py, pz])
+
+    def transform_direction(self, vector):
+        """
+        Transform a 3D direction
+
+        The direction is extended with w = 0, so only the upper left 3×3 block applies and translations are ignored
+
+        Raises
+        ------
+        DimensionsError
+            If the vector is not 3-dimensional
+        """
+        if not isinstance(vector, Vector) or vector.dimensions != 3:
+            raise DimensionsError("transform_direction() required a 3D vector")
+        a00, a01, a02, a03, a10, a11, a12, a13, a20, a21, a22, a23, a30, a31, a32, a33 = self._elements
+        x, y, z = vector.components
+        return Vector._from_trusted([a00*x + a01*y + a02*z, a10*x + a11*y + a12*z, a20*x + a21*y + a22*z])
+
+    def det(self) -> int | float:
+        """
+        The determinant, from the 2×2 minors of the upper and lower row pairs
+        """
+        a00, a01, a02, a03, a10, a11, a12, a13, a20, a21, a22, a23, a30, a31, a32, a33 = self._elements
+        return ((a00*a11 - a10*a01)*(a22*a33 - a32*a23) - (a00*a12 - a10*a02)*(a21*a33 - a31*a23)
+                + (a00*a13 - a10*a03)*(a21*a32 - a31*a22) + (a01*a12 - a11*a02)*(a20*a33 - a30*a23)
+                - (a01*a13 - a11*a03)*(a20*a32 - a30*a22) + (a02*a13 - a12*a03)*(a20*a31 - a30*a21))
+
+    def _adjugate(self) -> tuple[int | float, tuple]:
+        """
+        The determinant and the elements of the adjugate matrix, built from the six 2×2 minors of the two upper rows and the six of the two lower rows
+        """
+        a00, a01, a02, a03, a10, a11, a12, a13, a20, a21, a22, a23, a30, a31, a32, a33 = self._elements
+        s0 = a00*a11 - a10*a01
+        s1 = a00*a12 - a10*a02
+        s2 = a00*a13 - a10*a03
+        s3 = a01*a12 - a11*a02
+        s4 = a01*a13 - a11*a03
+        s5 = a02*a13 - a12*a03
+        c5 = a22*a33 - a32*a23
+        c4 = a21*a33 - a31*a23
+        c3 = a21*a32 - a31*a22
+        c2 = a20*a33 - a30*a23
+        c1 = a20*a32 - a30*a22
+        c0 = a20*a31 - a30*a21
+        det = s0*c5 - s1*c4 + s2*c3 + s3*c2 - s4*c1 + s5*c0
+        return det, (a11*c5 - a12*c4 + a13*c3, -a01*c5 + a02*c4 - a03*c3,
+                     a31*s5 - a32*s4 + a33*s3, -a21*s5 + a22*s4 - a23*s3,
+                     -a10*c5 + a12*c2 - a13*c1, a00*c5 - a02*c2 + a03*c1,
+                     -a30*s5 + a32*s2 - a33*s1, a20*s5 - a22*s2 + a23*s1,
+                     a10*c4 - a11*c2 + a13*c0, -a00*c4 + a01*c2 - a03*c0,
+                     a30*s4 - a31*s2 + a33*s0, -a20*s4 + a21*s2 - a23*s0,
+                     -a10*c3 + a11*c1 - a12*c0, a00*c3 - a01*c1 + a02*c0,
+                     -a30*s3 + a31*s1 - a32*s0, a20*s3 - a21*s1 + a22*s0)
@@ -0,0 +1,140 @@
+"""
+Binary format
+
+Vectors and matrices are stored as a fixed 32-byte header followed by the raw contiguous elements, so writing is one copy of the buffer and reading can wrap the bytes, a `memoryview` or a memory-mapped file without copying or parsing anything.
+
+Header, all fields little-endian:
+    magic: 4 bytes, b"LALG"
+    version: uint8, currently 1
+    ndim: uint8, 1 for a vector, 2 for a matrix
+    kind: 1 byte, b"i" signed integer, b"u" unsigned integer, b"f" floating point, b"c" complex
+    itemsize: uint8, the size of one element in bytes
+    byteorder: 1 byte, b"<" little-endian or b">" big-endian elements
+    padding: 3 bytes
+    shape: 2 × uint64, (dimensions, 0) for a vector, (rows, cols) for a matrix
+The elements follow in row-major order, the header size keeps them aligned for any element type.
+"""
+
+import mmap
+import struct
+import sys
+import numpy as np
+from .exceptions import *
+
+__all__ = []
+
+MAGIC = b"LALG"
+VERSION = 1
+_HEADER = struct.Struct("<4sBBcBc3xQQ")
+HEADER_SIZE = _HEADER.size
+
+_ACCESS = {"r": mmap.ACCESS_READ, "r+": mmap.ACCESS_WRITE, "c": mmap.ACCESS_COPY}
+
+
+def header(data: np.ndarray) -> bytes:
+    """
+    The header describing a one or two-dimensional array
+
+    Raises
+    ------
+    TypeError
+        If the elements are not machine integers, floats or complex numbers, for example integers too large for 64 bits
+    """
+    if data.dtype.kind not in "iufc":
+        raise TypeError("Only integers and floats of at most 64 bits and complex numbers can be serialized")
+    byteorder = data.dtype.byteorder
+    if byteorder in "=|":
+        byteorder = "<" if sys.byteorder == "little" else ">"
+    shape = data.shape + (0,)*(2 - data.ndim)
+    return _HEADER.pack(MAGIC, VERSION, data.ndim, data.dtype.kind.encode(), data.dtype.itemsize, byteorder.encode(), *shape)
+
+
+def to_bytes(data: np.ndarray) -> bytes:
+    """
+    Serialize an array into header and elements
+    """
+    return header(data) + np.ascontiguousarray(data).tobytes()
+
+
+def write(data: np.ndarray, path) -> None:
+    """
+    Write an array to a file, the elements go straight from the buffer to the file
+    """
+    head = header(data)
+    with open(path, "wb") as file:
+        file.write(head)
+        file.write(memoryview(np.ascontiguousarray(data)).cast("B"))
+
+
+def from_buffer(buffer, ndim: int) -> np.ndarray:
+    """
+    The array stored in a buffer
+
+    The result is a view of the buffer whenever the elements are in the machine byte order, later changes to a writable buffer show in the array. Elements in the other byte order are converted, which copies them
+
+    Parameters
+    ----------
+    buffer: bytes | bytearray | memoryview | mmap.mmap
+        Any object exposing the serialized bytes
+    ndim: int
+        The expected number of dimensions, 1 for a vector, 2 for a matrix
+
+    Raises
+    ------
+    ValueError
+        If the buffer does not hold data in this format
+    DimensionsError
+        If the buffer holds a different kind of object than expected
+    """
+    view = memoryview(buffer).cast("B")
+    if len(view) < HEADER_SIZE:
+        raise ValueError("Buffer is too short to hold a header")
+    magic, version, stored_ndim, kind, itemsize, byteorder, *shape = _HEADER.unpack_from(view)
+    if magic != MAGIC:
+        raise ValueError("Buffer does not hold a serialized vector or matrix")
+    if version != VERSION:
+        raise ValueError(f"Unsupported format version {version}")
+    if stored_ndim != ndim:
+        expected, found = (("vector", "matrix") if ndim == 1 else ("matrix", "vector"))
+        raise DimensionsError(f"Buffer holds a {found}, not a {expected}")
+    dtype = np.dtype(f"{byteorder.decode()}{kind.decode()}{itemsize}")
+    shape = tuple(shape[:ndim])
+    count = shape[0]*shape[1] if ndim == 2 else shape[0]
+    if len(view) < HEADER_SIZE + count*itemsize:
+        raise ValueError("Buffer is too short for the shape in its header")
+    data = np.frombuffer(view, dtype=dtype, count=count, offset=HEADER_SIZE).reshape(shape)
+    if not dtype.isnative:
+        data = data.astype(dtype.newbyteorder("="))
+    return data
+
+
+def read(path, ndim: int, mmap_mode: str | None = None) -> np.ndarray:
+    """
+    The array stored in a file
+
+    Parameters
+    ----------
+    path: str | os.PathLike
+        The file
+    ndim: int
+        The expected number of dimensions, 1 for a vector, 2 for a matrix
+    mmap_mode: str | None (default None)
+        None to read the file into memory, otherwise map the file without reading it: "r" read-only, "r+" changes are written to the file, "c" copy-on-write, changes stay in memory
+
+    Raises
+    ------
+    ValueError
+        If the file does not hold data in this format, or mmap_mode is unknown
+    DimensionsError
+        If the file holds a different kind of object than expected
+    """
+    if mmap_mode is not None and mmap_mode not in _ACCESS:
+        raise ValueError("mmap_mode should be one of None, 'r', 'r+' or 'c'")
+    with open(path, "rb" if mmap_mode in (None, "r", "c") else "r+b") as file:
+        if mmap_mode is None:
+            buffer = bytearray(file.seek(0, 2))
+            file.seek(0)
+            file.readinto(buffer)
+        else:
+            buffer = mmap.mmap(file.fileno(), 0, access=_ACCESS[mmap_mode])
+    return from_buffer(buffer, ndim)
@@ -0,0 +1,353 @@
+"""
+Iterative solvers for linear systems `A*x == b`
+
+Every solver takes the operator `A` as a `Matrix`, a `SparseMatrix`, any object supporting `A*vector` for a `Vector`, or a plain callable taking a `Vector` and returning the product (as a `Vector` or a sequence of numbers) for matrix-free use. Preconditioners `M` are given the same way and should approximate the inverse of `A`. Lazy `Expression` operands are evaluated first.
+`callback(iteration, residual)` is called after every iteration with the iteration number and the residual norm `|b - A*x|`, to monitor convergence.
+A solver that does not reach `tol` within `maxiter` iterations raises `ConvergenceError`, with the last iterate in its `solution` attribute.
+"""
+
+import numpy as np
+from .exceptions import *
+from .vectors import Vector, _evaluated
+from .matrices import Matrix, SparseMatrix
+
+__all__ = ["cg", "gmres", "jacobi", "gauss_seidel"]
+
+
+def _as_function(A):
+    """
+    Turn an operator into a function from numpy arrays to numpy arrays
+    """
+    A = _evaluated(A)
+    if A is None:
+        return lambda x: x
+    if isinstance(A, Matrix):
+        data = A._storage()
+        if data.dtype == object:
+            data = data.astype(float)
+        return lambda x: data @ x
+    def apply(x: np.ndarray) -> np.ndarray:
+        vector = Vector._from_trusted(x.tolist())
+        result = A(vector) if callable(A) else A*vector
+        if isinstance(result, Vector):
+            result = result.components
+        return np.asarray(result, dtype=float)
+    return apply
+
+def _start(A, b, x0) -> tuple:
+    """
+    Check the inputs and return the operator function, `b` and the first iterate as numpy arrays
+    """
+    A, b, x0 = _evaluated(A), _evaluated(b), _evaluated(x0)
+    if not isinstance(b, Vector):
+        raise TypeError("The right-hand side `b` should be a vector")
+    if isinstance(A, (Matrix, SparseMatrix)) and A.dimensions != (b.dimensions, b.dimensions):
+        raise DimensionsError("Iterative solvers required a square n×n operator for a n-dimensional right-hand side")
+    rhs = np.asarray(b, dtype=float)
+    if x0 is None:
+        x = np.zeros_like(rhs)
+    elif not isinstance(x0, Vector) or x0.dimensions != b.dimensions:
+        raise DimensionsError("The initial guess `x0` should be a vector with the same dimensions as `b`")
+    else:
+        x = np.array(x0, dtype=float)
+    return _as_function(A), rhs, x
+
+def _result(x: np.ndarray) -> Vector:
+    """
+    Wrap the solution array as a `Vector`
+    """
+    return Vector._from_trusted(x.tolist())
+
+def cg(A, b: Vector, x0: Vector | None = None, tol: float = 1e-8, maxiter: int | None = None,
+       M=None, callback=None) -> Vector:
+    """
+    Conjugate gradient
+
+    Solve a symmetric positive definite system, every iteration costs one operator product
+
+    Parameters
+    ----------
+    A: Matrix | SparseMatrix | operator | callable
+        The symmetric positive definite operator
+    b: Vector
+        The right-hand side
+    x0: Vector | None (default None)
+        The initial guess, zeros by default
+    tol: float (default 1e-8)
+        Stop when the residual norm is at most `tol*|b|`
+    maxiter: int | None (default None)
+        The iteration limit, 10 times the dimensions by default
+    M: Matrix | SparseMatrix | operator | callable | None (default None)
+        A symmetric positive definite preconditioner approximating the inverse of `A`
+    callback: callable | None (default None)
+        Called as `callback(iteration, residual)` after every iteration
+
+    Return
+    ------
+    The solution as a `Vector`
+
+    Raises
+    ------
+    TypeError
+        If `b` is not a vector
+    DimensionsError
+        If the operator, `b` and `x0` dimensions do not match
+    ConvergenceError
+        If `tol` is not reached within `maxiter` iterations
+    """
+    apply_A, rhs, x = _start(A, b, x0)
+    apply_M = _as_function(M)
+    maxiter = 10*len(rhs) if maxiter is None else maxiter
+    target = tol*np.linalg.norm(rhs)
+    r = rhs - apply_A(x)
+    if np.linalg.norm(r) <= target:
+        return _result(x)
+    z = apply_M(r)
+    p = z.copy()
+    rz = r @ z
+    for iteration in range(1, maxiter + 1):
+        Ap = apply_A(p)
+        alpha = rz/(p @ Ap)
+        x += alpha*p
+        r -= alpha*Ap
+        residual = float(np.linalg.norm(r))
+        if callback is not None:
+            callback(iteration, residual)
+        if residual <= target:
+            return _result(x)
+        z = apply_M(r)
+        rz_next = r @ z
+        p *= rz_next/rz
+        p += z
+        rz = rz_next
+    raise ConvergenceError(f"Conjugate gradient did not converge in {maxiter} iterations", _result(x))
+
+def gmres(A, b: Vector, x0: Vector | None = None, tol: float = 1e-8, restart: int = 30,
+          maxiter: int | None = None, M=None, callback=None) -> Vector:
+    """
+    Restarted GMRES
+
+    Solve a general (nonsymmetric) system by minimizing the residual over a Krylov subspace that is rebuilt every `restart` iterations. The preconditioner is applied on the right, so the reported residual is the true residual
+
+    Parameters
+    ----------
+    A: Matrix | SparseMatrix | operator | callable
+        The operator
+    b: Vector
+        The right-hand side
+    x0: Vector | None (default None)
+        The initial guess, zeros by default
+    tol: float (default 1e-8)
+        Stop when the residual norm is at most `tol*|b|`
+    restart: int (default 30)
+        The Krylov subspace size before restarting, larger converges in fewer iterations but keeps `restart` vectors in memory
+    maxiter: int | None (default None)
+        The limit on the total number of inner iterations, 10 times the dimensions by default
+    M: Matrix | SparseMatrix | operator | callable | None (default None)
+        A preconditioner approximating the inverse of `A`
+    callback: callable | None (default None)
+        Called as `callback(iteration, residual)` after every inner iteration
+
+    Return
+    ------
+    The solution as a `Vector`
+
+    Raises
+    ------
+    TypeError
+        If `b` is not a vector
+    DimensionsError
+        If the operator, `b` and `x0` dimensions do not match
+    ConvergenceError
+        If `tol` is not reached within `maxiter` iterations
+    """
+    apply_A, rhs, x = _start(A, b, x0)
+    apply_M = _as_function(M)
+    n = len(rhs)
+    maxiter = 10*n if maxiter is None else maxiter
+    restart = max(1, min(restart, n))
+    target = tol*np.linalg.norm(rhs)
+    iteration = 0
+    while True:
+        r = rhs - apply_A(x)
+        beta = np.linalg.norm(r)
+        if beta <= target:
+            return _result(x)
+        if iteration >= maxiter:
+            raise ConvergenceError(f"GMRES did not converge in {maxiter} iterations", _result(x))
+        V = np.zeros((restart + 1, n))
+        H = np.zeros((restart + 1, restart))
+        cs, sn = np.zeros(restart), np.zeros(restart)
+        g = np.zeros(restart + 1)
+        V[0] = r/beta
+        g[0] = beta
+        k = 0
+        while k < restart and iteration < maxiter:
+            w = apply_A(apply_M(V[k]))
+            for i in range(k + 1):
+                H[i, k] = w @ V[i]
+                w -= H[i, k]*V[i]
+            H[k+1, k] = np.linalg.norm(w)
+            if H[k+1, k] != 0:
+                V[k+1] = w/H[k+1, k]
+            for i in range(k):
+                H[i, k], H[i+1, k] = cs[i]*H[i, k] + sn[i]*H[i+1, k], -sn[i]*H[i, k] + cs[i]*H[i+1, k]
+            denominator = np.hypot(H[k, k], H[k+1, k])
+            if denominator == 0:
+                break
+            cs[k], sn[k] = H[k, k]/denominator, H[k+1, k]/denominator
+            H[k, k], H[k+1, k] = denominator, 0
+            g[k+1], g[k] = -sn[k]*g[k], cs[k]*g[k]
+            k += 1
+            iteration += 1
+            if callback is not None:
+                callback(iteration, float(abs(g[k])))
+            if abs(g[k]) <= target:
+                break
+        if k == 0:
+            raise ConvergenceError("GMRES broke down, the operator is singular on the Krylov subspace", _result(x))
+        y = np.zeros(k)
+        for i in range(k - 1, -1, -1):
+            y[i] = (g[i] - H[i, i+1:k] @ y[i+1:])/H[i, i]
+        x += apply_M(V[:k].T @ y)
+
+def _check_diagonal(diagonal: np.ndarray) -> np.ndarray:
+    """
+    Raise SingularMatrixError if the diagonal has a zero
+    """
+    if len(diagonal) == 0 or not diagonal.all():
+        raise SingularMatrixError("Jacobi and Gauss-Seidel required a nonzero diagonal")
+    return diagonal
+
+def jacobi(A, b: Vector, x0: Vector | None = None, tol: float | None = 1e-8, maxiter: int = 1000,
+           omega: float = 1.0, diagonal=None, callback=None) -> Vector:
+    """
+    (Weighted) Jacobi iteration
+
+    Update every component from the residual at once, `x += omega*D^-1*(b - A*x)`. Converges for diagonally dominant systems, and a few sweeps with `tol=None` make a cheap smoother
+
+    Parameters
+    ----------
+    A: Matrix | SparseMatrix | operator | callable
+        The operator
+    b: Vector
+        The right-hand side
+    x0: Vector | None (default None)
+        The initial guess, zeros by default
+    tol: float | None (default 1e-8)
+        Stop when the residual norm is at most `tol*|b|`. None runs exactly `maxiter` sweeps and never raises ConvergenceError
+    maxiter: int (default 1000)
+        The number of sweeps allowed
+    omega: float (default 1.0)
+        The damping weight, 2/3 is a common choice for smoothing
+    diagonal: Vector | Sequence[int | float] | None (default None)
+        The diagonal of `A`. Taken from `A` for matrices, it has to be given for other operators
+    callback: callable | None (default None)
+        Called as `callback(iteration, residual)` after every sweep
+
+    Return
+    ------
+    The solution as a `Vector`
+
+    Raises
+    ------
+    TypeError
+        If `b` is not a vector, or the diagonal is missing for a matrix-free operator
+    DimensionsError
+        If the operator, `b` and `x0` dimensions do not match
+    SingularMatrixError
+        If the diagonal has a zero
+    ConvergenceError
+        If `tol` is not reached within `maxiter` sweeps
+    """
+    A = _evaluated(A)
+    apply_A, rhs, x = _start(A, b, x0)
+    if diagonal is None:
+        if not isinstance(A, (Matrix, SparseMatrix)):
+            raise TypeError("Jacobi required `diagonal` for operators that are not matrices")
+        diagonal = A.diagonal()
+    elif isinstance(diagonal, Vector):
+        diagonal = diagonal.components
+    diagonal = _check_diagonal(np.asarray(diagonal, dtype=float))
+    target = None if tol is None else tol*np.linalg.norm(rhs)
+    r = rhs - apply_A(x)
+    for iteration in range(1, maxiter + 1):
+        if target is not None and np.linalg.norm(r) <= target:
+            return _result(x)
+        x += omega*r/diagonal
+        r = rhs - apply_A(x)
+        if callback is not None:
+            callback(iteration, float(np.linalg.norm(r)))
+    if target is not None and np.linalg.norm(r) > target:
+        raise ConvergenceError(f"Jacobi did not converge in {maxiter} sweeps", _result(x))
+    return _result(x)
+
+def gauss_seidel(A, b: Vector, x0: Vector | None = None, tol: float | None = 1e-8, maxiter: int = 1000,
+                 omega: float = 1.0, callback=None) -> Vector:
+    """
+    Gauss-Seidel iteration
+
+    Sweep through the rows in order, using every updated component right away, so it usually converges about twice as fast as Jacobi. With `omega` other than 1 it becomes successive over-relaxation (SOR). The sweep needs the matrix elements, so `A` has to be a `Matrix` or a `SparseMatrix`
+
+    Parameters
+    ----------
+    A: Matrix | SparseMatrix
+        The matrix
+    b: Vector
+        The right-hand side
+    x0: Vector | None (default None)
+        The initial guess, zeros by default
+    tol: float | None (default 1e-8)
+        Stop when the residual norm is at most `tol*|b|`. None runs exactly `maxiter` sweeps and never raises ConvergenceError
+    maxiter: int (default 1000)
+        The number of sweeps allowed
+    omega: float (default 1.0)
+        The relaxation weight, between 0 and 2
+    callback: callable | None (default None)
+        Called as `callback(iteration, residual)` after every sweep
+
+    Return
+    ------
+    The solution as a `Vector`
+
+    Raises
+    ------
+    TypeError
+        If `A` is not a matrix or `b` is not a vector
+    DimensionsError
+        If the matrix, `b` and `x0` dimensions do not match
+    SingularMatrixError
+        If the diagonal has a zero
+    ConvergenceError
+        If `tol` is not reached within `maxiter` sweeps
+    """
+    A = _evaluated(A)
+    if not isinstance(A, (Matrix, SparseMatrix)):
+        raise TypeError("Gauss-Seidel required a Matrix or a SparseMatrix")
+    apply_A, rhs, x = _start(A, b, x0)
+    diagonal = _check_diagonal(np.asarray(A.diagonal(), dtype=float))
+    n = len(rhs)
+    if isinstance(A, SparseMatrix):
+        data, indices, indptr = A._csr()
+        rows = [(indices[indptr[i]:indptr[i+1]], data[indptr[i]:indptr[i+1]]) for i in range(n)]
+        def row_dot(i: int) -> float:
+            columns, values = rows[i]
+            return values @ x[columns]
+    else:
+        dense = np.asarray(A._storage(), dtype=float)
+        def row_dot(i: int) -> float:
+            return dense[i] @ x
+    target = None if tol is None else tol*np.linalg.norm(rhs)
+    for iteration in range(1, maxiter + 1):
+        for i in range(n):
+            x[i] += omega*(rhs[i] - row_dot(i))/diagonal[i]
+        if target is None and callback is None:
+            continue
+        residual = float(np.linalg.norm(rhs - apply_A(x)))
+        if callback is not None:
+            callback(iteration, residual)
+        if target is not None and residual <= target:
+            return _result(x)
+    if target is not None:
+        raise ConvergenceError(f"Gauss-Seidel did not converge in {maxiter} sweeps", _result(x))
+    return _result(x)
@@ -0,0 +1,309 @@
+"""
+Spatial indexing
+
+`KDTree` answers nearest-neighbour and radius queries over a set of `Vector` points in roughly O(log N) per query instead of the O(N) scan of `nearest()`. Points are kept in one N×d numpy array, the tree splits them at the median of the axis with the largest spread until at most `leaf_size` points remain, and every leaf is scanned with one numpy kernel, so the Python work per query is only the walk down a few levels of the tree.
+"""
+
+import math
+import numpy as np
+from .exceptions import *
+from .vectors import Vector, VectorArray, _evaluated
+
+__all__ = ["KDTree"]
+
+
+class KDTree:
+    """
+k-d trees
+
+    `KDTree` indexes points for Euclidean nearest-neighbour and radius queries. Points keep the position they were given or inserted in, queries answer with those indices
+    Points can be inserted after the tree is built: a point goes down to its leaf, a leaf that grows past twice `leaf_size` is split, and the whole tree is rebuilt once it has doubled since the last build, so the tree stays balanced at an amortized O(log N) cost per insertion
+
+    Attributes
+    ----------
+    __data: numpy.ndarray
+        The points, one row each, with spare rows at the end for insertions
+    __size: int
+        The number of points
+    __built: int
+        The number of points at the last full build
+    __leaf_size: int
+        The number of points a leaf is split at
+    __axis, __split, __left, __right: list
+        Per node, the splitting axis and value and the two children, left holding the points below the value and right the others
+    __buckets: list[numpy.ndarray | None]
+        Per node, the indices of the points of a leaf, None for inner nodes
+
+    Properties
+    ----------
+    dimensions(self) -> int
+        The dimensions of the points
+
+    Methods
+    -------
+    query(self, v, k=1) -> tuple[numpy.ndarray, numpy.ndarray]
+        The k nearest points
+    query_radius(self, v, r) -> tuple[numpy.ndarray, numpy.ndarray]
+        The points within a distance
+    insert(self, v) -> None
+        Add one or more points
+    """
+
+    __slots__ = ("__data", "__size", "__built", "__leaf_size", "__axis", "__split", "__left", "__right", "__buckets")
+
+    def __init__(self, points, leaf_size: int = 32) -> None:
+        """
+        Build the tree
+
+        Parameters
+        ----------
+        points: VectorArray | Sequence[Vector]
+            The points, all with the same dimensions
+        leaf_size: int (default 32)
+            The largest number of points a leaf is built with
+
+        Raises
+        ------
+        TypeError
+            If the points are not vectors
+        DimensionsError
+            If the points are not all in the same dimensions
+        ValueError
+            If leaf_size is not a positive integer
+        """
+        if not isinstance(leaf_size, int) or leaf_size < 1:
+            raise ValueError("leaf_size should be a positive integer")
+        if not isinstance(points, VectorArray):
+            points = VectorArray.from_vectors(points)
+        self.__data = np.array(points, dtype=float)
+        self.__size = len(self.__data)
+        self.__leaf_size = leaf_size
+        self.__build()
+
+    def __len__(self) -> int:
+        """
+        The number of points
+        """
+        return self.__size
+
+    @property
+    def dimensions(self) -> int:
+        """
+        The dimensions of the points
+        """
+        return self.__data.shape[1]
+
+    def __repr__(self) -> str:
+        return f"KDTree({self.__size} points, {self.dimensions} dimensions)"
+
+    def __build(self) -> None:
+        """
+        Build the whole tree over the current points
+        """
+        self.__axis, self.__split, self.__left, self.__right, self.__buckets = [], [], [], [], []
+        self.__built = self.__size
+        stack = [(self.__node(), np.arange(self.__size))]
+        while stack:
+            node, bucket = stack.pop()
+            children = self.__divide(node, bucket) if len(bucket) > self.__leaf_size else None
+            if children is None:
+                self.__buckets[node] = bucket
+            else:
+                stack.extend(zip((self.__left[node], self.__right[node]), children))
+
+    def __node(self) -> int:
+        """
+        Append an empty leaf and return its number
+        """
+        self.__axis.append(0)
+        self.__split.append(0.0)
+        self.__left.append(-1)
+        self.__right.append(-1)
+        self.__buckets.append(np.empty(0, dtype=np.intp))
+        return len(self.__buckets) - 1
+
+    def __divide(self, node: int, bucket: np.ndarray) -> tuple[np.ndarray, np.ndarray] | None:
+        """
+        Turn a node into an inner node split at the median of the axis with the largest spread, and return the points of its two children. None if all the points are the same and cannot be split
+        """
+        points = self.__data[bucket]
+        spread = points.max(axis=0) - points.min(axis=0)
+        axis = int(spread.argmax())
+        if spread[axis] == 0:
+            return None
+        values = points[:, axis]
+        middle = len(bucket)//2
+        order = np.argpartition(values, middle)
+        self.__axis[node] = axis
+        self.__split[node] = float(values[order[middle]])
+        self.__buckets[node] = None
+        self.__left[node] = self.__node()
+        self.__right[node] = self.__node()
+        return bucket[order[:middle]], bucket[order[middle:]]
+
+    def insert(self, v) -> None:
+        """
+        Add points to the tree
+
+        The new points get the next indices, in order
+
+        Parameters
+        ----------
+        v: Vector | VectorArray | Expression
+            One point or a batch of points
+
+        Raises
+        ------
+        TypeError
+            If the input is not a vector
+        DimensionsError
+            If the points dimensions are not the tree dimensions
+        """
+        v = _evaluated(v)
+        if not isinstance(v, (Vector, VectorArray)):
+            raise TypeError("KDTree.insert() accept a `Vector` or a `VectorArray`")
+        points = np.atleast_2d(np.asarray(v, dtype=float))
+        if self.__size == 0 and self.__data.shape[1] == 0:
+            self.__data = np.empty((0, points.shape[1]))
+        if points.shape[1] != self.dimensions:
+            raise DimensionsError("KDTree.insert() required points with the tree dimensions")
+        if self.__size + len(points) > len(self.__data):
+            grown = np.empty((max(2*len(self.__data), self.__size + len(points)), self.dimensions))
+            grown[:self.__size] = self.__data[:self.__size]
+            self.__data = grown
+        self.__data[self.__size:self.__size + len(points)] = points
+        first, self.__size = self.__size, self.__size + len(points)
+        if self.__size > 2*self.__built:
+            self.__build()
+            return
+        for index, point in enumerate(points, first):
+            node = 0
+            while self.__buckets[node] is None:
+                node = self.__left[node] if point[self.__axis[node]] < self.__split[node] else self.__right[node]
+            bucket = self.__buckets[node] = np.append(self.__buckets[node], index)
+            children = self.__divide(node, bucket) if len(bucket) > 2*self.__leaf_size else None
+            if children is not None:
+                self.__buckets[self.__left[node]], self.__buckets[self.__right[node]] = children
+
+    def __point(self, v) -> np.ndarray:
+        """
+        A query point as a float array, checked against the tree dimensions
+        """
+        v = _evaluated(v)
+        if not isinstance(v, Vector):
+            raise TypeError("KDTree queries accept a `Vector`")
+        if v.dimensions != self.dimensions:
+            raise DimensionsError("KDTree queries required a vector with the tree dimensions")
+        return np.asarray(v, dtype=float)
+
+    def query(self, v, k: int = 1) -> tuple[np.ndarray, np.ndarray]:
+        """
+        k nearest neighbours
+
+        Parameters
+        ----------
+        v: Vector | VectorArray | Expression
+            One query point, or a batch of queries answered one by one
+        k: int (default 1)
+            The number of neighbours, at most the number of points
+
+        Return
+        ------
+        (indices, distances), numpy arrays of the points indices and their Euclidean distances, closest first. One-dimensional of length k for a `Vector`, of shape (number of queries, k) for a `VectorArray`, the same as `nearest()`
+
+        Raises
+        ------
+        TypeError
+            If the query is not a vector
+        DimensionsError
+            If the query dimensions are not the tree dimensions
+        ValueError
+            If k is not between 1 and the number of points
+        """
+        if not isinstance(k, int) or not 1 <= k <= self.__size:
+            raise ValueError("k should be between 1 and the number of points")
+        if isinstance(v, VectorArray):
+            results = [self.query(point, k) for point in v]
+            return (np.array([indices for indices, _ in results], dtype=np.intp).reshape(len(v), k),
+                    np.array([distances for _, distances in results]).reshape(len(v), k))
+        q = self.__point(v)
+        data = self.__data
+        best, chosen = np.empty(0), np.empty(0, dtype=np.intp)
+        bound = math.inf
+        stack = [(0, 0.0)]
+        while stack:
+            node, plane = stack.pop()
+            if plane > bound:
+                continue
+            bucket = self.__buckets[node]
+            if bucket is None:
+                offset = q[self.__axis[node]] - self.__split[node]
+                near, far = (self.__left[node], self.__right[node]) if offset < 0 else (self.__right[node], self.__left[node])
+                stack.append((far, max(plane, offset*offset)))
+                stack.append((near, plane))
+                continue
+            if not len(bucket):
+                continue
+            difference = data[bucket] - q
+            best = np.concatenate((best, np.einsum("ij,ij->i", difference, difference)))
+            chosen = np.concatenate((chosen, bucket))
+            if len(best) > k:
+                keep = np.argpartition(best, k - 1)[:k]
+                best, chosen = best[keep], chosen[keep]
+            if len(best) == k:
+                bound = best.max()
+        order = np.argsort(best, kind="stable")
+        return chosen[order], np.sqrt(best[order])
+
+    def query_radius(self, v, r: int | float) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Points within a distance
+
+        Parameters
+        ----------
+        v: Vector | Expression
+            The query point
+        r: int | float
+            The radius, points at exactly `r` are included
+
+        Return
+        ------
+        (indices, distances), numpy arrays of the points indices and their Euclidean distances, closest first
+
+        Raises
+        ------
+        TypeError
+            If the query is not a vector
+        DimensionsError
+            If the query dimensions are not the tree dimensions
+        ValueError
+            If the radius is negative
+        """
+        if r < 0:
+            raise ValueError("The radius should not be negative")
+        q = self.__point(v)
+        data = self.__data
+        bound = r*r
+        found, chosen = [], []
+        stack = [(0, 0.0)] if self.__size else []
+        while stack:
+            node, plane = stack.pop()
+            if plane > bound:
+                continue
+            bucket = self.__buckets[node]
+            if bucket is None:
+                offset = q[self.__axis[node]] - self.__split[node]
+                near, far = (self.__left[node], self.__right[node]) if offset < 0 else (self.__right[node], self.__left[node])
+                stack.append((far, max(plane, offset*offset)))
+                stack.append((near, plane))
+                continue
+            difference = data[bucket] - q
+            squared = np.einsum("ij,ij->i", difference, difference)
+            inside = squared <= bound
+            found.append(squared[inside])
+            chosen.append(bucket[inside])
+        if not found:
+            return np.empty(0, dtype=np.intp), np.empty(0)
+        squared, chosen = np.concatenate(found), np.concatenate(chosen)
+        order = np.argsort(squared, kind="stable")
+        return chosen[order], np.sqrt(squared[order])
@@ -1,11 +1,141 @@
 """
 Additional utilities
+
+Every `array_*` function runs on one of three backends, picked from the type and size of the inputs:
+    numpy: if any input is a numpy array, the whole operation is one numpy kernel and a numpy array is returned
+    array: if any input is an `array.array`, the result is an `array.array` too. From `NUMPY_THRESHOLD` elements up, numpy works directly on the buffers without copying them, below that a Python loop is cheaper
+    python: everything else runs element by element in pure Python and returns a list, so any element type that supports the operation works
+A backend selected with `config.set_backend()` replaces the three above for every function
+Every function also takes an optional `out`, a list, numpy array or `array.array` with room for the result, which is written into it and returned. With buffer outputs the numpy kernels write straight into `out`
 """
 
+import operator
+from array import array, typecodes
 from typing import Any, Sequence
 
+import numpy as np
+from . import config
+
+__all__ = ["NUMPY_THRESHOLD", "array_add", "array_sub", "array_scalar_mul", "array_scalar_truediv",
+           "array_floor_div", "array_mul", "array_truediv", "array_floordiv"]
+
+NUMPY_THRESHOLD = 64
+
+_OPERATIONS = {
+    "add": (operator.add, np.add),
+    "sub": (operator.sub, np.subtract),
+    "mul": (operator.mul, np.multiply),
+    "truediv": (operator.truediv, np.true_divide),
+    "floordiv": (operator.floordiv, np.floor_divide),
+}
+
+
+def _python_backend(op, arr1, arr2, scalar: bool, out):
+    """
+    Pure Python loop, one element at a time, stopping at the end of the shorter input
+    """
+    if scalar:
+        result = [op(c, arr2) for c in arr1]
+    else:
+        result = list(map(op, arr1, arr2))
+    if out is None:
+        return result
+    out[:len(result)] = result
+    return out
+
+def _numpy_operands(arr1, arr2, scalar: bool) -> tuple:
+    """
+    View the inputs as numpy arrays without copying buffers, truncated to the shorter one
+    """
+    x1 = np.asarray(arr1)
+    if scalar:
+        return x1, arr2
+    x2 = np.asarray(arr2)
+    n = min(len(x1), len(x2))
+    return x1[:n], x2[:n]
+
+def _numpy_into(ufunc, x1, x2, out):
+    """
+    Run `ufunc` into `out`, directly into its buffer when it has one
+    """
+    if isinstance(out, list):
+        result = ufunc(x1, x2).tolist()
+        out[:len(result)] = result
+    else:
+        ufunc(x1, x2, out=np.asarray(out)[:len(x1)])
+    return out
+
+def _numpy_backend(ufunc, arr1, arr2, scalar: bool, out):
+    """
+    One numpy kernel over the whole input, returning a numpy array
+    """
+    x1, x2 = _numpy_operands(arr1, arr2, scalar)
+    if out is not None:
+        return _numpy_into(ufunc, x1, x2, out)
+    return ufunc(x1, x2)
+
+def _array_backend(op, ufunc, arr1, arr2, scalar: bool, out):
+    """
+    `array.array` results, computed by numpy on the buffers for large inputs and by a Python loop for small ones
+    """
+    x1, x2 = _numpy_operands(arr1, arr2, scalar)
+    if len(x1) < NUMPY_THRESHOLD:
+        result = _python_backend(op, arr1, arr2, scalar, out)
+        if out is not None:
+            return result
+        typecode = _result_typecode(ufunc, x1, x2, scalar)
+        return result if typecode is None else array(typecode, result)
+    if out is not None:
+        return _numpy_into(ufunc, x1, x2, out)
+    typecode = _result_typecode(ufunc, x1, x2, scalar)
+    if typecode is None:
+        return ufunc(x1, x2).tolist()
+    result = array(typecode, [0])*len(x1)
+    ufunc(x1, x2, out=np.asarray(result))
+    return result
+
+def _result_typecode(ufunc, x1, x2, scalar: bool) -> str | None:
+    """
+    The `array.array` typecode of the result, None if `array.array` cannot hold it
+    """
+    dtype = ufunc(x1[:0], x2 if scalar else x2[:0]).dtype
+    return dtype.char if dtype.char in typecodes else None
+
+def _backend_into(name: str, arr1, arr2, scalar: bool, out):
+    """
+    Run one elementwise operation on the selected backend, with the truncation and `out` handling of the other backends
+    """
+    if not scalar and len(arr1) != len(arr2):
+        n = min(len(arr1), len(arr2))
+        arr1, arr2 = arr1[:n], arr2[:n]
+    if not isinstance(arr1, (list, np.ndarray)):
+        arr1 = np.asarray(arr1) if isinstance(arr1, array) else list(arr1)
+    if not scalar and not isinstance(arr2, (list, np.ndarray)):
+        arr2 = np.asarray(arr2) if isinstance(arr2, array) else list(arr2)
+    result = config._backend.elementwise(name, arr1, arr2)
+    if out is None:
+        return result
+    if isinstance(out, list):
+        out[:len(result)] = result.tolist() if isinstance(result, np.ndarray) else result
+    else:
+        np.asarray(out)[:len(result)] = result
+    return out
+
+def _elementwise(name: str, arr1, arr2, scalar: bool = False, out=None):
+    """
+    Run one elementwise operation on the backend picked for the inputs
+    """
+    op, ufunc = _OPERATIONS[name]
+    if config._backend is not None:
+        return _backend_into(name, arr1, arr2, scalar, out)
+    if isinstance(arr1, np.ndarray) or isinstance(arr2, np.ndarray):
+        return _numpy_backend(ufunc, arr1, arr2, scalar, out)
+    if isinstance(arr1, array) or isinstance(arr2, array):
+        return _array_backend(op, ufunc, arr1, arr2, scalar, out)
+    return _python_backend(op, arr1, arr2, scalar, out)
+
 
-def array_add(arr1: Sequence[Any], arr2: Sequence[Any]) -> list[Any]:
+def array_add(arr1: Sequence[Any], arr2: Sequence[Any], out=None) -> list[Any] | np.ndarray | array:
     """
     Arrays addition
 
@@ -17,14 +147,16 @@ def array_add(arr1: Sequence[Any], arr2: Sequence[Any]) -> list[Any]:
         Any sequence that is iterable
     arr2: Sequence 
         Any sequence that is iterable
+    out: list | numpy.ndarray | array.array | None (default None)
+        Where to write the result, it should have room for the whole result
 
     Return 
     ------
-    Return a single list with every corresponding sums as output
+    Return a single list with every corresponding sums as output. The result is a numpy array or `array.array` when the inputs are, and `out` itself when it is given
     """
-    return list(c1 + c2 for c1, c2 in zip(arr1, arr2))
+    return _elementwise("add", arr1, arr2, out=out)
 
-def array_sub(arr1: Sequence[Any], arr2: Sequence[Any]) -> list[Any]:
+def array_sub(arr1: Sequence[Any], arr2: Sequence[Any], out=None) -> list[Any] | np.ndarray | array:
     """
     Arrays subtraction
 
@@ -36,14 +168,16 @@ def array_sub(arr1: Sequence[Any], arr2: Sequence[Any]) -> list[Any]:
         Any sequence that is iterable
     arr2: Sequence 
         Any sequence that is iterable
+    out: list | numpy.ndarray | array.array | None (default None)
+        Where to write the result, it should have room for the whole result
 
     Return 
     ------
-    Return a single list with every corresponding differences as output
+    Return a single list with every corresponding differences as output. The result is a numpy array or `array.array` when the inputs are, and `out` itself when it is given
     """
-    return list(c1 - c2 for c1, c2 in zip(arr1, arr2))
+    return _elementwise("sub", arr1, arr2, out=out)
 
-def array_scalar_mul(arr: Sequence[Any], scalar: int | float) -> list[Any]:
+def array_scalar_mul(arr: Sequence[Any], scalar: int | float, out=None) -> list[Any] | np.ndarray | array:
     """
     Array scalar multiplication
     
@@ -55,14 +189,16 @@ def array_scalar_mul(arr: Sequence[Any], scalar: int | float) -> list[Any]:
         Any sequence that is iterable
     scalar: int
         Factor
+    out: list | numpy.ndarray | array.array | None (default None)
+        Where to write the result, it should have room for the whole result
 
     Return
     ------
-    Return a list with every corresponding products as output
+    Return a list with every corresponding products as output. The result is a numpy array or `array.array` when the inputs are, and `out` itself when it is given
     """
-    return list(c*scalar for c in arr)
+    return _elementwise("mul", arr, scalar, scalar=True, out=out)
 
-def array_scalar_truediv(arr: Sequence[Any], scalar: int | float) -> list[Any]:
+def array_scalar_truediv(arr: Sequence[Any], scalar: int | float, out=None) -> list[Any] | np.ndarray | array:
     """
     Array scalar true division
     
@@ -74,14 +210,16 @@ def array_scalar_truediv(arr: Sequence[Any], scalar: int | float) -> list[Any]:
         Any sequence that is iterable
     scalar: int
         Divisor
+    out: list | numpy.ndarray | array.array | None (default None)
+        Where to write the result, it should have room for the whole result
 
     Return
     ------
-    Return a list with every corresponding quotient as output
+    Return a list with every corresponding quotient as output. The result is a numpy array or `array.array` when the inputs are, and `out` itself when it is given
     """
-    return list(c/scalar for c in arr)
+    return _elementwise("truediv", arr, scalar, scalar=True, out=out)
 
-def array_floor_div(arr: Sequence[Any], scalar: int | float) -> list[Any]:
+def array_floor_div(arr: Sequence[Any], scalar: int | float, out=None) -> list[Any] | np.ndarray | array:
     """
     Array scalar floor division
     
@@ -93,14 +231,16 @@ def array_floor_div(arr: Sequence[Any], scalar: int | float) -> list[Any]:
         Any sequence that is iterable
     scalar: int
         Divisor
+    out: list | numpy.ndarray | array.array | None (default None)
+        Where to write the result, it should have room for the whole result
 
     Return
     ------
-    Return a list with every corresponding quotient as output
+    Return a list with every corresponding quotient as output. The result is a numpy array or `array.array` when the inputs are, and `out` itself when it is given
     """
-    return list(c//scalar for c in arr)
+    return _elementwise("floordiv", arr, scalar, scalar=True, out=out)
 
-def array_mul(arr1: Sequence[Any], arr2: Sequence[Any]) -> list[Any]:
+def array_mul(arr1: Sequence[Any], arr2: Sequence[Any], out=None) -> list[Any] | np.ndarray | array:
     """
     Arrays corresponding multiplication
 
@@ -112,14 +252,16 @@ def array_mul(arr1: Sequence[Any], arr2: Sequence[Any]) -> list[Any]:
         Any sequence that is iterable
     arr2: Sequence
         Any sequence that is iterable
+    out: list | numpy.ndarray | array.array | None (default None)
+        Where to write the result, it should have room for the whole result
 
     Return
     ------
-    Return a list with every corresponding products as output
+    Return a list with every corresponding products as output. The result is a numpy array or `array.array` when the inputs are, and `out` itself when it is given
     """
-    return list(c1*c2 for c1, c2 in zip(arr1, arr2))
+    return _elementwise("mul", arr1, arr2, out=out)
 
-def array_truediv(arr1: Sequence[Any], arr2: Sequence[Any]) -> list[Any]:
+def array_truediv(arr1: Sequence[Any], arr2: Sequence[Any], out=None) -> list[Any] | np.ndarray | array:
     """
     Arrays corresponding true division
 
@@ -132,14 +274,16 @@ def array_truediv(arr1: Sequence[Any], arr2: Sequence[Any]) -> list[Any]:
         Any sequence that is iterable
     arr2: Sequence
         Any sequence that is iterable
+    out: list | numpy.ndarray | array.array | None (default None)
+        Where to write the result, it should have room for the whole result
 
     Return
     ------
-    Return a list with every corresponding quotient as output
+    Return a list with every corresponding quotient as output. The result is a numpy array or `array.array` when the inputs are, and `out` itself when it is given
     """
-    return list(c1/c2 for c1, c2 in zip(arr1, arr2))
+    return _elementwise("truediv", arr1, arr2, out=out)
 
-def array_floordiv(arr1: Sequence[Any], arr2: Sequence[Any]) -> list[Any]:
+def array_floordiv(arr1: Sequence[Any], arr2: Sequence[Any], out=None) -> list[Any] | np.ndarray | array:
     """
     Arrays corresponding floor division
 
@@ -152,9 +296,11 @@ def array_floordiv(arr1: Sequence[Any], arr2: Sequence[Any]) -> list[Any]:
         Any sequence that is iterable
     arr2: Sequence
         Any sequence that is iterable
+    out: list | numpy.ndarray | array.array | None (default None)
+        Where to write the result, it should have room for the whole result
 
     Return
     ------
-    Return a list with every corresponding quotient as output
+    Return a list with every corresponding quotient as output. The result is a numpy array or `array.array` when the inputs are, and `out` itself when it is given
     """
-    return list(c1//c2 for c1, c2 in zip(arr1, arr2))
+    return _elementwise("floordiv", arr1, arr2, out=out)
@@ -3,10 +3,81 @@
 Mathematical object `Vector`
 """
 
+import math
 import numpy as np
+from . import config
+from . import serialization
+from . import utilities
+from .backends import _euclidean
 from .exceptions import *
 from .utilities import *
 
+__all__ = ["Vector", "VectorArray", "nearest"]
+
+
+# Elements of the query × candidates distance block computed at once by `nearest()`
+_NEAREST_BLOCK = 2**22
+
+# The types a `dtype` argument can ask for
+_DTYPES = tuple(np.dtype(name) for name in ("float32", "float64", "int64", "complex64", "complex128"))
+# The dtypes plain Python `int` and `float` elements are stored as
+_PYTHON_DTYPES = (np.dtype(np.int64), np.dtype(np.float64), np.dtype(object))
+# The Python element types each kind of buffer accepts while validating
+_ACCEPTED = {"i": (int,), "u": (int,), "f": (int, float), "c": (int, float, complex)}
+
+
+def _as_dtype(dtype) -> np.dtype:
+    """
+    The numpy dtype of a `dtype` argument: "float32", "float64", "int64", "complex64", "complex128", the matching numpy types, or `float`, `int` and `complex` for the 64-bit and 128-bit ones
+
+    Raises
+    ------
+    TypeError
+        If the dtype is not one of those
+    """
+    try:
+        resolved = np.dtype(dtype)
+    except TypeError:
+        resolved = None
+    if resolved not in _DTYPES:
+        raise TypeError("dtype should be one of float32, float64, int64, complex64 or complex128")
+    return resolved
+
+
+def _typed(data) -> bool:
+    """
+    Whether a storage is a numpy buffer of a type plain Python numbers are not stored as, whose results should keep their dtype instead of going back to Python numbers
+    """
+    return isinstance(data, np.ndarray) and data.dtype not in _PYTHON_DTYPES
+
+
+def _lazy(op: str, left, right):
+    """
+    The expression node of `left op right`, built instead of the result while lazy mode is on, see `config.set_lazy()`
+    """
+    from .expressions import Expression
+    return Expression._node(op, left, right)
+
+
+def _squared_norms(x: np.ndarray) -> np.ndarray:
+    """
+    The squared Euclidean norm along the last axis, through the moduli for complex components
+    """
+    if x.dtype.kind == "c":
+        x = np.abs(x)
+    return np.einsum("...i,...i->...", x, x)
+
+
+def _evaluated(operand):
+    """
+    The value of a lazy expression, any other operand as it is, so functions checking the type of their operands also accept expressions built while lazy mode is on
+    """
+    if isinstance(operand, Vector):
+        return operand
+    from .expressions import Expression
+    return operand.eval() if isinstance(operand, Expression) else operand
+
+
 class Vector:
     """
 Mathematical vectors
@@ -15,17 +86,24 @@ Mathematical vectors
     Supported operations: addition, subtraction, multiplication, true division, floor division 
         Those operations work the same way as it is in math, true division will return floats whereas floor division return integers
         IMPORTANT: For multiplication and divison, those are for scalar and the vector should be the first operand. If you want to multiply two vectors, use `Vector.dot()` and `Vector.cross()`, see more later on.
+        The in-place operators (+=, -=, *=, /=, //=) update the vector components directly instead of creating a new vector
     Supported statements:
         Equality(==): True if the two vectors components are the same otherwise False
         Non-Equality(!=): True if the two vectors components are not the otherwise else False
-        If the two sides are not the same type, it will return True or False depends on the nature of the statements. No inequalities supported
+        If the two sides are not the same type, the other operand decides: a lazy `Expression` compares by its value, other types are unequal. No inequalities supported
     Representation: 
         Formatted as `Vector(*components)`
+    NumPy interoperability:
+        `numpy.asarray(vector)` goes through `__array__`, and a vector built on a numpy array with `from_numpy()` also exposes `__array_interface__` and the buffer protocol, so the data is shared both ways without copying
+    Numeric types:
+        By default the components are Python `int` and `float`. `Vector(*components, dtype=...)` stores them in one contiguous numpy buffer of float32, float64, int64, complex64 or complex128 instead, float32 takes half the memory of Python floats in float64. Results take the promoted type of their operands the way numpy promotes them, Python numbers counting as int64 or float64 and scalars keeping the vector type, so float32 + float32 stays float32, float32 + float64 gives float64 and anything with a complex operand is complex
     
     Attributes
     ----------
-    __components: List[int | float]
-        Vectors components. Not directly changable, if you want to change vectors components, see `set_components()` method
+    __components: List[int | float] | numpy.ndarray
+        Vectors components, a list, or the one-dimensional numpy array the vector was built on with `from_numpy()`. Held in a slot, vectors have no per-instance `__dict__`. Not directly changable, if you want to change vectors components, see `set_components()` method
+    __norms: dict | None
+        The norms computed so far by order, for list storage only. Cleared by every method changing the components, a numpy buffer can be changed from outside so its norms are never cached
     
     Properties
     ----------
@@ -33,70 +111,166 @@ Mathematical vectors
         Get access to the vector components as a list
     dimensions(self) -> int
         Get the vector dimensions, or just the length of the list of components
+    dtype(self) -> numpy.dtype
+        Get the type the components are stored as
     magnitude(self) -> float
-        Get the vector magnitude
+        Get the vector magnitude, the same as `norm(2)`
     
     Methods
     -------
     set_components(self, *args: int | float)
         Set a new set of components for that vector
+    norm(self, ord=2) -> float
+        The L1, L2 (Euclidean) or L∞ norm, computed once and cached until the components change
+    normalize(self) -> Vector
+        Return the unit vector in the same direction
     round(self, decimal_places: int) -> None
         Round every components of the vector to a specific decimal_places, directly change the original vector
     rounded(self, decimal_places: int) -> Vector
         Round every components of the vector to a specific decimal_places, return a new vector, the original is unchanged
+    astype(self, dtype) -> Vector
+        Return a copy of the vector stored as another type
+    to_bytes(self) -> bytes
+        Serialize the vector into a small header followed by the raw components
+    save(self, path)
+        Write the serialized vector to a file
     resize(self, dimensions: int) -> None 
         Resize the vector into any dimensions, directly change the vector. This method does not try to maintain any properties of the vector, it will truncate or add additional 0s components so that the vector get to the target dimensions
     
     Static methods 
     --------------
+    from_numpy(arr, copy=False)
+        Build a vector on a one-dimensional numpy array, sharing its buffer
+    from_bytes(buffer)
+        Build a vector from serialized bytes
+    load(path, mmap_mode=None)
+        Read a vector written by `save()`
     dot(v1, v2)
         The dot product between 2 vectors
-    cross(v1, v2)
-        The cross product between 2 vectors
+    distance(v1, v2, ord=2)
+        The L1, L2 or L∞ distance between 2 vectors
+    cross(v1, v2, out=None)
+        The cross product between 2 vectors, optionally written into an existing vector
     get_angle(v1, v2, rad=True)
         Get the angle between the 2 vectors. In the range [0, pi] radians or [0, 180] degrees only, if the angle is larger, it will just take the smaller or you can say absolute value of the co-terminal angle. So you should know what you are doing. Return angle in radians if `rad` is True, otherwise it will be in degrees
     """
 
-    def __init__(self, *args: int | float) -> None:
+    __slots__ = ("__components", "__norms")
+
+    def __init__(self, *args: int | float | complex, dtype=None) -> None:
         """
         Initialize the vector 
 
         Parameters
         ----------
-        *args: int | float 
-            The vectors components
+        *args: int | float | complex
+            The vectors components, complex ones need a complex dtype
+        dtype: str | type | numpy.dtype | None (default None)
+            None to keep the components as Python numbers, otherwise "float32", "float64", "int64", "complex64" or "complex128" to store them in a numpy buffer of that type
         
         Raises
         ------
         TypeError
-            If the components are not of type int or float
+            If the components are not of type int or float, or not of a type the dtype can hold, only checked while validation is on, see `config.set_validation()`. If the dtype is not supported
         """
+        if dtype is not None:
+            dtype = _as_dtype(dtype)
+        if config._validate:
+            Vector.__check(args, dtype)
+        self.__components = [*args] if dtype is None else np.array(args, dtype=dtype)
+        self.__norms = None
+
+    @staticmethod
+    def __check(args, dtype: np.dtype | None = None) -> None:
+        """
+        Raise TypeError if any component is not a number the storage can hold
+        """
+        accepted = (int, float) if dtype is None else _ACCEPTED[dtype.kind]
         for arg in args:
-            if not isinstance(arg, (int, float)):
+            if not isinstance(arg, accepted):
+                if dtype is not None:
+                    raise TypeError(f"Components of a vector stored as {dtype} must be of type {' or '.join(t.__name__ for t in accepted)}")
+                if isinstance(arg, complex):
+                    raise TypeError("Complex vector components need a complex dtype, for example `dtype=complex`")
                 raise TypeError("Vector components must be of type float")
-        self.__components = [*args]
+
+    @classmethod
+    def _from_trusted(cls, components: list[int | float]):
+        """
+        Trusted constructor
+
+        Wrap a list or a one-dimensional numpy array that is already known to hold numbers, without copying or checking it. Meant for results computed inside the package
+
+        Parameters
+        ----------
+        components: list[int | float] | numpy.ndarray
+            The components, the new vector takes ownership of the list or shares the array
+        """
+        vector = cls.__new__(cls)
+        vector.__components = components
+        vector.__norms = None
+        return vector
+
+    @classmethod
+    def from_numpy(cls, arr, copy: bool = False):
+        """
+        Build a vector on a numpy array
+
+        The vector keeps the array as its storage, so nothing is copied and changes made through either side show in the other. Arithmetic on such a vector runs on the numpy kernels and gives vectors backed by numpy arrays too
+
+        Parameters
+        ----------
+        arr: numpy.ndarray
+            A one-dimensional array of integers, floats or complex numbers, or anything `numpy.asarray()` accepts
+        copy: bool (default False)
+            True to give the vector its own copy of the data
+
+        Raises
+        ------
+        TypeError
+            If the array does not hold numbers
+        DimensionsError
+            If the array is not one-dimensional
+        """
+        data = np.array(arr, copy=True) if copy else np.asarray(arr)
+        if data.dtype == np.bool_:
+            data = data.astype(np.int64)
+        if data.dtype.kind not in "iufc":
+            raise TypeError("Vector components must be of type `int`, `float` or `complex`")
+        if data.ndim != 1:
+            raise DimensionsError("A vector should be built on a one-dimensional array")
+        return cls._from_trusted(data)
 
     @property 
     def components(self) -> list[int | float]:
         """
-        The vector components
+        The vector components, a new list on every access, changing it does not change the vector
         """
-        return self.__components
+        if isinstance(self.__components, np.ndarray):
+            return self.__components.tolist()
+        return list(self.__components)
 
-    def set_components(self, *args: int | float) -> None:
+    def set_components(self, *args: int | float | complex) -> None:
         """
         Set a new set of components for the vector 
 
+        A vector stored in a numpy buffer gets a new buffer of the same dtype
+
         Parameters 
         ----------
-        *args: int | float
+        *args: int | float | complex
 
         Raises
         ------
         TypeError
             For invalid types
         """
-        self.__components = Vector(*args).components
+        data = self.__components
+        dtype = data.dtype if isinstance(data, np.ndarray) else None
+        if config._validate:
+            Vector.__check(args, dtype)
+        self.__components = [*args] if dtype is None else np.array(args, dtype=dtype)
+        self.__norms = None
 
     @property
     def dimensions(self) -> int:
@@ -104,14 +278,64 @@ Mathematical vectors
         The vector dimensions, or the length of the components list
         """
         return len(self.__components)
+
+    @property
+    def dtype(self) -> np.dtype:
+        """
+        The type the components are stored as, the dtype numpy gives the Python numbers of a vector that is not stored in a buffer
+        """
+        data = self.__components
+        return data.dtype if isinstance(data, np.ndarray) else np.asarray(data).dtype
+
+    def astype(self, dtype):
+        """
+        A copy of the vector stored in a numpy buffer of another type
+
+        Parameters
+        ----------
+        dtype: str | type | numpy.dtype
+            "float32", "float64", "int64", "complex64" or "complex128"
+
+        Raises
+        ------
+        TypeError
+            If the dtype is not supported
+        """
+        return Vector._from_trusted(np.array(self.__components, dtype=_as_dtype(dtype)))
     
     def __repr__(self) -> str:
         """
         Representation
 
-        Return the string of the form `Vector(*components)`
+        Return the string of the form `Vector(*components)`, followed by the dtype for a type other than Python numbers
+        """
+        if _typed(self.__components):
+            return f"Vector({', '.join(map(repr, self.components))}, dtype={self.__components.dtype})"
+        return f"Vector{tuple(self.components)}"
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        """
+        The components as a numpy array, the shared storage of a vector built with `from_numpy()` unless a copy or another dtype is asked for
         """
-        return f"Vector{tuple(self.__components)}"
+        if isinstance(self.__components, np.ndarray):
+            data = self.__components if dtype is None else self.__components.astype(dtype, copy=False)
+            return data.copy() if copy else data
+        return np.array(self.__components, dtype=dtype)
+
+    @property
+    def __array_interface__(self) -> dict:
+        """
+        The numpy array interface of the storage, only for a vector backed by a numpy array, a list has no buffer to share
+        """
+        if not isinstance(self.__components, np.ndarray):
+            raise AttributeError("Only vectors built with `from_numpy()` expose `__array_interface__`")
+        return self.__components.__array_interface__
+
+    def __buffer__(self, flags: int) -> memoryview:
+        """
+        Buffer protocol (Python 3.12+), a view of the storage for a vector backed by a numpy array, of a packed copy for a list
+        """
+        return memoryview(np.asarray(self))
 
     def __add__(self, other):
         """
@@ -137,7 +361,9 @@ Mathematical vectors
             return NotImplemented
         if self.dimensions != other.dimensions:
             raise DimensionsError("Operator `+` required two vectors with the same dimensions")
-        return Vector(*utilities.array_add(self.components, other.components))
+        if config._lazy:
+            return _lazy("+", self, other)
+        return Vector._from_trusted(utilities.array_add(self.__components, other.__components))
 
     def __sub__(self, other):
         """
@@ -163,9 +389,11 @@ Mathematical vectors
             return NotImplemented
         if self.dimensions != other.dimensions:
             raise DimensionsError("Operator `-` required two vectors with the same dimensions")
-        return Vector(*utilities.array_sub(self.components, other.components))
+        if config._lazy:
+            return _lazy("-", self, other)
+        return Vector._from_trusted(utilities.array_sub(self.__components, other.__components))
     
-    def __mul__(self, other: int | float):
+    def __mul__(self, other: int | float | complex):
         """
         Scalar multiplication
 
@@ -176,19 +404,21 @@ Mathematical vectors
         ----------
         self: Vector
             The first vector
-        other: int | float
-            The scalar
+        other: int | float | complex
+            The scalar, a complex scalar gives a vector stored as complex numbers
 
         Raises
         ------
         TypeError
             If the other is not a scalar
         """
-        if not isinstance(other, (int, float)):
+        if not isinstance(other, (int, float, complex)):
             raise TypeError("Vector multiplication using `*` is for scalar only, if you want vectors multiplication, use Vector.dot(v1, v2) or Vector.cross(v1, v2)")
-        return Vector(*utilities.array_scalar_mul(self.components, other))
+        if config._lazy:
+            return _lazy("*", self, other)
+        return Vector._from_trusted(utilities.array_scalar_mul(self.__for_scalar(other), other))
 
-    def __truediv__(self, other: int | float):
+    def __truediv__(self, other: int | float | complex):
         """
         Scalar true division
 
@@ -199,17 +429,28 @@ Mathematical vectors
         ----------
         self: Vector
             The first vector
-        other: int | float
-            The scalar
+        other: int | float | complex
+            The scalar, a complex scalar gives a vector stored as complex numbers
 
         Raises
         ------
         TypeError
             If the other is not a scalar
         """
-        if not isinstance(other, (int, float)):
+        if not isinstance(other, (int, float, complex)):
             raise TypeError("Vector true division using `/` is for scalar only, if you want vectors multiplication, use Vector.dot(v1, v2) or Vector.cross(v1, v2)")
-        return Vector(*utilities.array_scalar_truediv(self.components, other))
+        if config._lazy:
+            return _lazy("/", self, other)
+        return Vector._from_trusted(utilities.array_scalar_truediv(self.__for_scalar(other), other))
+
+    def __for_scalar(self, scalar):
+        """
+        The storage to combine with a scalar, a list goes into a numpy buffer for a complex scalar, so complex results are stored as complex numbers
+        """
+        data = self.__components
+        if isinstance(scalar, complex) and not isinstance(data, np.ndarray):
+            return np.array(data)
+        return data
     
     def __floordiv__(self, other: int | float):
         """
@@ -233,7 +474,149 @@ Mathematical vectors
         if not isinstance(other, (int, float)):
             
             raise TypeError("Vector floor division using `//` is for scalar only, if you want vectors multiplication, use Vector.dot(v1, v2) or Vector.cross(v1, v2)")
-        return Vector(*utilities.array_floor_div(self.components, other))   
+        if config._lazy:
+            return _lazy("//", self, other)
+        return Vector._from_trusted(utilities.array_floor_div(self.__components, other))
+
+    def __iadd__(self, other):
+        """
+        In-place addition
+
+        Add the other vector into the components of `self`, no new vector or list is created and `self` keeps its identity
+
+        Parameters
+        ----------
+        self: Vector
+            The vector to update
+        other: Vector
+            The other vector
+
+        Raises
+        ------
+        TypeError
+            If the other operand is not a vector
+        exceptions.DimensionsError
+            If the other vector not having the same dimensions as `self`
+        """
+        if not isinstance(other, Vector):
+            return NotImplemented
+        if self.dimensions != other.dimensions:
+            raise DimensionsError("Operator `+=` required two vectors with the same dimensions")
+        if not self.__update(np.add, other):
+            components = self.__components
+            self.__norms = None
+            for i, c in enumerate(other.components):
+                components[i] += c
+        return self
+
+    def __isub__(self, other):
+        """
+        In-place subtraction
+
+        Subtract the other vector from the components of `self`, no new vector or list is created and `self` keeps its identity
+
+        Parameters
+        ----------
+        self: Vector
+            The vector to update
+        other: Vector
+            The other vector
+
+        Raises
+        ------
+        TypeError
+            If the other operand is not a vector
+        exceptions.DimensionsError
+            If the other vector not having the same dimensions as `self`
+        """
+        if not isinstance(other, Vector):
+            return NotImplemented
+        if self.dimensions != other.dimensions:
+            raise DimensionsError("Operator `-=` required two vectors with the same dimensions")
+        if not self.__update(np.subtract, other):
+            components = self.__components
+            self.__norms = None
+            for i, c in enumerate(other.components):
+                components[i] -= c
+        return self
+
+    def __imul__(self, other: int | float | complex):
+        """
+        In-place scalar multiplication
+
+        Multiply the components of `self` by a scalar without creating a new vector, a complex scalar moves the components to a complex buffer
+
+        Raises
+        ------
+        TypeError
+            If the other is not a scalar
+        """
+        if not isinstance(other, (int, float, complex)):
+            raise TypeError("Vector multiplication using `*=` is for scalar only, if you want vectors multiplication, use Vector.dot(v1, v2) or Vector.cross(v1, v2)")
+        self.__components = self.__for_scalar(other)
+        if not self.__update(np.multiply, other):
+            components = self.__components
+            self.__norms = None
+            for i, c in enumerate(components):
+                components[i] = c*other
+        return self
+
+    def __itruediv__(self, other: int | float | complex):
+        """
+        In-place scalar true division
+
+        Truely divide the components of `self` by a scalar without creating a new vector, a complex scalar moves the components to a complex buffer
+
+        Raises
+        ------
+        TypeError
+            If the other is not a scalar
+        """
+        if not isinstance(other, (int, float, complex)):
+            raise TypeError("Vector true division using `/=` is for scalar only, if you want vectors multiplication, use Vector.dot(v1, v2) or Vector.cross(v1, v2)")
+        self.__components = self.__for_scalar(other)
+        if not self.__update(np.true_divide, other):
+            components = self.__components
+            self.__norms = None
+            for i, c in enumerate(components):
+                components[i] = c/other
+        return self
+
+    def __ifloordiv__(self, other: int | float):
+        """
+        In-place scalar floor division
+
+        Floor divide the components of `self` by a scalar without creating a new vector
+
+        Raises
+        ------
+        TypeError
+            If the other is not a scalar
+        """
+        if not isinstance(other, (int, float)):
+            raise TypeError("Vector floor division using `//=` is for scalar only, if you want vectors multiplication, use Vector.dot(v1, v2) or Vector.cross(v1, v2)")
+        if not self.__update(np.floor_divide, other):
+            components = self.__components
+            self.__norms = None
+            for i, c in enumerate(components):
+                components[i] = c//other
+        return self
+
+    def __update(self, ufunc, operand) -> bool:
+        """
+        Apply `ufunc` in place to numpy storage, writing straight into the array when it is writable and of the result type, a new array is only allocated when the storage has to be replaced. The operand is a scalar or a vector, converted to an array only here. Return False for list storage, which the caller updates itself
+        """
+        data = self.__components
+        if not isinstance(data, np.ndarray):
+            return False
+        scalar = not isinstance(operand, Vector)
+        if not scalar:
+            operand = np.asarray(operand.__components)
+        if data.flags.writeable and ufunc(data[:0], operand if scalar else operand[:0]).dtype == data.dtype:
+            ufunc(data, operand, out=data)
+        else:
+            self.__components = ufunc(data, operand)
+        return True
 
     def __eq__(self, other) -> bool:
         """
@@ -249,10 +632,10 @@ Mathematical vectors
         Return 
         ------
         True if two vectors components are the same 
-        else it will return False. If the other is not `Vector` type, automatically return False
+        else it will return False. If the other is not `Vector` type, return NotImplemented so the other operand decides, a lazy `Expression` compares by its value and other types compare unequal
         """
         if not isinstance(other, Vector):
-            return False
+            return NotImplemented
         return self.components == other.components
 
     def __ne__(self, other) -> bool:
@@ -269,10 +652,10 @@ Mathematical vectors
         Return 
         ------
         True if two vectors components are not the same 
-        else it will return False. If the other is not `Vector` type, automatically return True
+        else it will return False. If the other is not `Vector` type, return NotImplemented so the other operand decides, a lazy `Expression` compares by its value and other types compare unequal
         """
         if not isinstance(other, Vector):
-            return True
+            return NotImplemented
         return self.components != other.components
 
     def round(self, decimal_places: int = 0) -> None:
@@ -293,8 +676,12 @@ Mathematical vectors
         ------
         Return None, only change the original vector
         """
-        self.__components = [round(c, decimal_places) 
-                            for c in self.__components]
+        data = self.__components
+        if isinstance(data, np.ndarray):
+            self.__components = np.round(data, decimal_places)
+        else:
+            self.__components = [round(c, decimal_places) for c in data]
+        self.__norms = None
     
     def rounded(self, decimal_places: int = 0):
         """
@@ -314,8 +701,10 @@ Mathematical vectors
         ------
         The rounded version of the vector
         """
-        return Vector(*[round(c, decimal_places) 
-                        for c in self.components])
+        data = self.__components
+        if isinstance(data, np.ndarray):
+            return Vector._from_trusted(np.round(data, decimal_places))
+        return Vector._from_trusted([round(c, decimal_places) for c in data])
 
     def __round__(self, decimal_places: int = 0):
         """
@@ -329,9 +718,73 @@ Mathematical vectors
     @property
     def magnitude(self) -> float:
         """
-        The vector magnitude
+        The vector magnitude, the same as `norm(2)`
+        """
+        return self.norm(2)
+
+    def norm(self, ord: int | float = 2) -> float:
+        """
+        Vector norm
+
+        The norm of a vector holding a list is computed once and cached until the components change through the vector methods or operators, so repeated `magnitude` and `get_angle()` calls cost nothing. A vector built on a numpy array shares its buffer with other code, its norm is computed by numpy on every call
+
+        Parameters
+        ----------
+        ord: int | float (default 2)
+            1 for the sum of the absolute values, 2 for the Euclidean length, `math.inf` for the largest absolute value
+
+        Return
+        ------
+        The norm, 0 for a 0-dimensional vector
+
+        Raises
+        ------
+        ValueError
+            If ord is not 1, 2 or infinity
         """
-        return sum([c**2 for c in self.components])**0.5
+        if ord not in (1, 2, math.inf):
+            raise ValueError("Vector norm order should be 1, 2 or math.inf")
+        data = self.__components
+        if isinstance(data, np.ndarray):
+            if config._backend is not None:
+                return config._backend.norm(data, ord)
+            if ord == 2:
+                return _euclidean(data)
+            return float(np.linalg.norm(data, ord)) if data.size else 0.0
+        norms = self.__norms
+        if norms is None:
+            norms = self.__norms = {}
+        elif ord in norms:
+            return norms[ord]
+        if config._backend is not None:
+            value = config._backend.norm(data, ord)
+        elif ord == 2:
+            value = math.hypot(*data)
+        elif ord == 1:
+            value = float(sum(map(abs, data)))
+        else:
+            value = float(max(map(abs, data), default=0))
+        norms[ord] = value
+        return value
+
+    def normalize(self):
+        """
+        Unit vector
+
+        Return a new vector in the same direction with magnitude 1, the original is unchanged
+
+        Raises
+        ------
+        ZeroDivisionError
+            If the vector magnitude is 0
+        """
+        magnitude = self.norm(2)
+        if magnitude == 0:
+            raise ZeroDivisionError("Cannot normalize a vector with 0 magnitude")
+        data = self.__components
+        if isinstance(data, np.ndarray):
+            return Vector._from_trusted(data/magnitude)
+        return Vector._from_trusted([c/magnitude for c in data])
 
     @staticmethod
     def dot(v1, v2) -> float:
@@ -342,14 +795,14 @@ Mathematical vectors
 
         Parameters
         ----------
-        v1: Vector 
+        v1: Vector | Expression
             The first vector
-        v2: Vector
+        v2: Vector | Expression
             The second vector 
 
         Return 
         ------
-        Return the dot product between the two input vector 
+        Return the dot product between the two input vector, computed in the promoted type of the two vectors and returned as a Python number. Complex components are not conjugated
 
         Raises
         ------
@@ -358,14 +811,51 @@ Mathematical vectors
         exceptions.DimensionsError
             If the two inputs dimensions are not the same, DimensionsError will be raise
         """
+        v1, v2 = _evaluated(v1), _evaluated(v2)
         if not isinstance(v1, Vector) or not isinstance(v2, Vector):
             raise TypeError("Dot product only accept two vectors as arguements")
         if v1.dimensions != v2.dimensions:
             raise DimensionsError("Dot product required 2 Vectors with the same dimensions")
+        if config._backend is not None:
+            return config._backend.dot(v1.__components, v2.__components)
+        if isinstance(v1.__components, np.ndarray) or isinstance(v2.__components, np.ndarray):
+            return np.dot(np.asarray(v1.__components), np.asarray(v2.__components)).item()
         return sum(
-            utilities.array_mul(v1.components, v2.components)
+            utilities.array_mul(v1.__components, v2.__components)
         )
 
+    @staticmethod
+    def distance(v1, v2, ord: int | float = 2) -> float:
+        """
+        Distance between two vectors
+
+        The norm of `v1 - v2`, without going through the operators, so it is a number even while lazy evaluation is on
+
+        Parameters
+        ----------
+        v1: Vector | Expression
+            The first vector
+        v2: Vector | Expression
+            The second vector
+        ord: int | float (default 2)
+            1, 2 or `math.inf`, see `norm()`
+
+        Raises
+        ------
+        TypeError
+            If either of the input is not a vector
+        DimensionsError
+            If the two inputs dimensions are not the same
+        ValueError
+            If ord is not 1, 2 or infinity
+        """
+        v1, v2 = _evaluated(v1), _evaluated(v2)
+        if not isinstance(v1, Vector) or not isinstance(v2, Vector):
+            raise TypeError("Distance only accept two vectors as arguements")
+        if v1.dimensions != v2.dimensions:
+            raise DimensionsError("Distance required 2 Vectors with the same dimensions")
+        return Vector._from_trusted(utilities.array_sub(v1.__components, v2.__components)).norm(ord)
+
     @staticmethod
     def get_angle(v1, v2, rad: bool=True) -> float:
         """
@@ -375,9 +865,9 @@ Mathematical vectors
         
         Parameters
         ----------
-        v1: Vector
+        v1: Vector | Expression
             The first vector 
-        v2: Vector 
+        v2: Vector | Expression
             The second vectir
         rad: bool (default True)
             Output in radian form or not 
@@ -386,6 +876,7 @@ Mathematical vectors
         ------
         The angle between the two vectors. If rad = True, return the angle in radian, otherwise return the angle in degree.
         IMPORTANT: This method only return angles in the range of the arccos function, specifically [0, pi] radian or [0, 180] degrees, if the angle is larger, the smaller angle will be taken, or you can also say the absolute value of the smallest co-terminal to that angle will be taken
+        For complex vectors, the cosine is the real part of the Hermitian inner product over the magnitudes, the angle between the vectors seen as real vectors of twice the dimensions
 
         Raises
         ------
@@ -396,19 +887,24 @@ Mathematical vectors
         ZeroDivisionError
             If any of the vectors magnitude is 0
         """
-        if v1.dimensions != v2.dimensions:
-            raise DimensionsError("Not supported angle between two vectors with different dimensions")
+        v1, v2 = _evaluated(v1), _evaluated(v2)
         if not isinstance(v1, Vector) or not isinstance(v2, Vector):
             raise TypeError("get_angle() accept two vectors only")
-        if v1.magnitude == 0 or v2.magnitude == 0:
+        if v1.dimensions != v2.dimensions:
+            raise DimensionsError("Not supported angle between two vectors with different dimensions")
+        m1, m2 = v1.norm(2), v2.norm(2)
+        if m1 == 0 or m2 == 0:
             raise ZeroDivisionError("Cannot get angle between two vectors if one of them have 0 magnitude")
-        angle_as_rad = np.arccos(Vector.dot(v1,v2)/(v1.magnitude*v2.magnitude))
+        if np.iscomplexobj(v1.__components) or np.iscomplexobj(v2.__components):
+            angle_as_rad = np.arccos(np.clip(np.vdot(v1.__components, v2.__components).real/(m1*m2), -1, 1))
+        else:
+            angle_as_rad = np.arccos(Vector.dot(v1,v2)/(m1*m2))
         if rad is True:
            return angle_as_rad
         return angle_as_rad*(180/np.pi)
 
     @staticmethod
-    def cross(v1, v2):
+    def cross(v1, v2, out=None):
         """
         Cross product 
 
@@ -416,29 +912,127 @@ Mathematical vectors
 
         Parameters
         ----------
-        v1: Vector
+        v1: Vector | Expression
             The first vector 
-        v2: Vector
+        v2: Vector | Expression
             The second vector
+        out: Vector | None (default None)
+            A 3D vector to write the result into instead of creating a new one, it may be `v1` or `v2` themselves
 
         Return
         ------
-        The two vectors cross product. The direction of the resulting vector is depends on the order, so be careful
+        The two vectors cross product, in the promoted type of the two vectors. The direction of the resulting vector is depends on the order, so be careful. If `out` is given, `out` is returned
 
         Raises
         ------
         TypeError
-            If the two inputs are not vectors
+            If the two inputs or `out` are not vectors
         DimensionsError
             Cross product only support 3D vectors for now, so dimensions other than 3 will raise DimensionsError
         """
+        v1, v2 = _evaluated(v1), _evaluated(v2)
         if not isinstance(v1, Vector) or not isinstance(v2, Vector):
             raise TypeError("Cross product only accept two vectors as arguements")
         if v1.dimensions != 3 or v2.dimensions != 3:
             raise DimensionsError("Only supported dot product for 3-dimensional vectors")
-        x1, y1, z1 = v1.components
-        x2, y2, z2 = v2.components
-        return Vector(y1*z2 - z1*y2, z1*x2 - x1*z2, x1*y2 - y1*x2)
+        if config._backend is not None:
+            result = config._backend.cross(v1.__components, v2.__components)
+        elif _typed(v1.__components) or _typed(v2.__components):
+            result = np.cross(np.asarray(v1.__components), np.asarray(v2.__components))
+        else:
+            x1, y1, z1 = v1.__components
+            x2, y2, z2 = v2.__components
+            result = [y1*z2 - z1*y2, z1*x2 - x1*z2, x1*y2 - y1*x2]
+        if out is None:
+            return Vector._from_trusted(result)
+        if not isinstance(out, Vector):
+            raise TypeError("Cross product `out` should be a vector")
+        if out.dimensions != 3:
+            raise DimensionsError("Cross product `out` should be a 3-dimensional vector")
+        out._assign(result)
+        return out
+
+    def to_bytes(self) -> bytes:
+        """
+        Serialize the vector
+
+        A 32-byte header (dimensions, element type, byte order) followed by the raw components, see `lalgpy.serialization`. Integer components are stored as 64-bit integers, and a vector mixing integers and floats is stored as floats
+
+        Raises
+        ------
+        TypeError
+            If a component is an integer too large for 64 bits
+        """
+        return serialization.to_bytes(np.asarray(self.__components))
+
+    @classmethod
+    def from_bytes(cls, buffer):
+        """
+        Build a vector from the bytes of `to_bytes()`
+
+        The vector views the components inside the buffer without copying them, like a vector built with `from_numpy()`
+
+        Parameters
+        ----------
+        buffer: bytes | bytearray | memoryview | mmap.mmap
+            Any object exposing the serialized bytes
+
+        Raises
+        ------
+        ValueError
+            If the buffer does not hold a serialized vector
+        DimensionsError
+            If the buffer holds a matrix
+        """
+        return cls._from_trusted(serialization.from_buffer(buffer, 1))
+
+    def save(self, path) -> None:
+        """
+        Write the vector to a file in the `to_bytes()` format
+        """
+        serialization.write(np.asarray(self.__components), path)
+
+    @classmethod
+    def load(cls, path, mmap_mode: str | None = None):
+        """
+        Read a vector written by `save()`
+
+        Parameters
+        ----------
+        path: str | os.PathLike
+            The file
+        mmap_mode: str | None (default None)
+            None to read the file, "r", "r+" or "c" to memory-map it instead
+
+        Raises
+        ------
+        ValueError
+            If the file does not hold a serialized vector
+        DimensionsError
+            If the file holds a matrix
+        """
+        return cls._from_trusted(serialization.read(path, 1, mmap_mode))
+
+    def _storage(self) -> list[int | float] | np.ndarray:
+        """
+        The components storage itself, the list or the numpy array, without copying
+        """
+        return self.__components
+
+    def _assign(self, components) -> None:
+        """
+        Overwrite the components in place with trusted values of the same dimensions
+        """
+        data = self.__components
+        if isinstance(data, np.ndarray):
+            values = np.asarray(components)
+            if data.flags.writeable and np.can_cast(values.dtype, data.dtype, "same_kind"):
+                data[:] = values
+            else:
+                self.__components = np.array(values)
+            return
+        data[:] = components.tolist() if isinstance(components, np.ndarray) else components
+        self.__norms = None
 
     def resize(self, dimensions: int) -> None:
         """
@@ -448,8 +1042,459 @@ Mathematical vectors
         """
         if not isinstance(dimensions, int):
             raise TypeError("Dimensions should be of type `int`")
-        if self.dimensions > dimensions:
-            self.__components = self.__components[:dimensions]
+        data = self.__components
+        if isinstance(data, np.ndarray):
+            self.__components = np.concatenate((data[:dimensions], np.zeros(max(0, dimensions - len(data)), dtype=data.dtype)))
+        elif self.dimensions > dimensions:
+            self.__components = self.components[:dimensions]
         else:
             complement = dimensions - self.dimensions
-            self.__components = self.__components + [0]*complement
+            self.__components = self.components + [0]*complement
+        self.__norms = None
+
+class VectorArray:
+    """
+Batches of vectors
+
+    `VectorArray` holds N vectors of the same dimensions as a single N×d numpy array, every operation runs as one numpy kernel over the whole batch instead of one `Vector` per call.
+    Supported operations: addition, subtraction, multiplication, true division, floor division
+        Addition and subtraction work row by row with another `VectorArray` of the same shape, or with a single `Vector` which is applied to every row
+        IMPORTANT: For multiplication and division, those are for scalar and the array should be the first operand, the same as `Vector`
+    Supported statements:
+        Equality(==): True if the two arrays hold the same vectors otherwise False
+        Non-Equality(!=): True if the two arrays do not hold the same vectors otherwise False
+    Representation:
+        Formatted as `VectorArray(*vectors)`
+    Indexing and iteration give `Vector` objects, `len()` gives the number of vectors
+
+    Attributes
+    ----------
+    __data: numpy.ndarray
+        The N×d array of components, one row per vector. Held in a slot, arrays have no per-instance `__dict__`
+
+    Properties
+    ----------
+    components(self) -> list[list[int | float]]
+        Get the components of every vector as a list of lists
+    dimensions(self) -> int
+        Get the dimensions of the vectors
+    magnitude(self) -> numpy.ndarray
+        Get the magnitude of every vector
+
+    Methods
+    -------
+    to_vectors(self) -> list[Vector]
+        Convert back into a list of `Vector`
+    normalize(self) -> VectorArray
+        Return the unit vectors
+
+    Static methods
+    --------------
+    from_vectors(vectors)
+        Build an array from a sequence of `Vector`
+    dot(a1, a2)
+        Row by row dot products
+    cross(a1, a2)
+        Row by row cross products
+    get_angle(a1, a2, rad=True)
+        Row by row angles, in the same range as `Vector.get_angle()`
+    """
+
+    __slots__ = ("__data",)
+
+    def __init__(self, data) -> None:
+        """
+        Initialize the array
+
+        Parameters
+        ----------
+        data: array-like
+            An N×d array-like of numbers, such as a list of rows or a numpy array. Numpy arrays are used without copying when they already have a numeric type
+
+        Raises
+        ------
+        TypeError
+            If the elements are not numbers
+        DimensionsError
+            If the data is not two-dimensional
+        """
+        data = np.asarray(data)
+        if data.dtype == np.bool_:
+            data = data.astype(np.int64)
+        if data.dtype.kind not in "iufc":
+            raise TypeError("VectorArray components must be of type int, float or complex")
+        if data.ndim != 2:
+            raise DimensionsError("VectorArray expects a two-dimensional N×d array")
+        self.__data = data
+
+    @staticmethod
+    def from_vectors(vectors):
+        """
+        Build an array from vectors
+
+        Parameters
+        ----------
+        vectors: Sequence[Vector]
+            The vectors, all with the same dimensions
+
+        Raises
+        ------
+        TypeError
+            If any element is not a vector
+        DimensionsError
+            If the vectors are not all in the same dimensions
+        """
+        vectors = [_evaluated(v) for v in vectors]
+        if not all(isinstance(v, Vector) for v in vectors):
+            raise TypeError("VectorArray.from_vectors() accept vectors only")
+        if any(v.dimensions != vectors[0].dimensions for v in vectors):
+            raise DimensionsError("VectorArray required vectors with the same dimensions")
+        if not vectors:
+            return VectorArray(np.empty((0, 0)))
+        return VectorArray([v.components for v in vectors])
+
+    def to_vectors(self) -> list:
+        """
+        Convert into a list of `Vector`
+        """
+        if np.iscomplexobj(self.__data):
+            return [Vector._from_trusted(row) for row in self.__data.copy()]
+        return [Vector._from_trusted(row) for row in self.__data.tolist()]
+
+    @property
+    def components(self) -> list[list[int | float]]:
+        """
+        The components of every vector
+        """
+        return self.__data.tolist()
+
+    @property
+    def dimensions(self) -> int:
+        """
+        The dimensions shared by all the vectors
+        """
+        return self.__data.shape[1]
+
+    def __len__(self) -> int:
+        """
+        The number of vectors
+        """
+        return self.__data.shape[0]
+
+    def __getitem__(self, index):
+        """
+        Indexing
+
+        An integer index gives the `Vector` at that position, a slice gives a new `VectorArray`
+        """
+        if isinstance(index, slice):
+            return VectorArray(self.__data[index])
+        row = self.__data[index]
+        return Vector._from_trusted(row.copy() if np.iscomplexobj(row) else row.tolist())
+
+    def __iter__(self):
+        """
+        Iterate over the vectors as `Vector` objects
+        """
+        return iter(self.to_vectors())
+
+    def __repr__(self) -> str:
+        """
+        Representation
+
+        Return the string of the form `VectorArray(*vectors)`
+        """
+        return f"VectorArray{tuple(self.to_vectors())}"
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        """
+        The N×d numpy array, without copying unless a copy or another dtype is asked for
+        """
+        data = self.__data if dtype is None else self.__data.astype(dtype, copy=False)
+        return data.copy() if copy else data
+
+    def __other_rows(self, other, symbol: str) -> np.ndarray:
+        """
+        The right-hand operand of `+` and `-` as something that broadcasts against the array
+        """
+        if isinstance(other, Vector):
+            if other.dimensions != self.dimensions:
+                raise DimensionsError(f"Operator `{symbol}` required vectors with the same dimensions")
+            return np.asarray(other)
+        if self.__data.shape != other.__data.shape:
+            raise DimensionsError(f"Operator `{symbol}` required two arrays with the same shape")
+        return other.__data
+
+    def __add__(self, other):
+        """
+        Addition
+
+        Add every vector of `other` to the corresponding vector of `self`, or add a single `Vector` to every vector
+
+        Raises
+        ------
+        DimensionsError
+            If the shapes do not match
+        """
+        if not isinstance(other, (VectorArray, Vector)):
+            return NotImplemented
+        return VectorArray(self.__data + self.__other_rows(other, "+"))
+
+    def __sub__(self, other):
+        """
+        Subtraction
+
+        Subtract every vector of `other` from the corresponding vector of `self`, or subtract a single `Vector` from every vector
+
+        Raises
+        ------
+        DimensionsError
+            If the shapes do not match
+        """
+        if not isinstance(other, (VectorArray, Vector)):
+            return NotImplemented
+        return VectorArray(self.__data - self.__other_rows(other, "-"))
+
+    def __mul__(self, other: int | float | complex):
+        """
+        Scalar multiplication
+
+        Raises
+        ------
+        TypeError
+            If the other is not a scalar
+        """
+        if not isinstance(other, (int, float, complex)):
+            raise TypeError("VectorArray multiplication using `*` is for scalar only, if you want vectors multiplication, use VectorArray.dot(a1, a2) or VectorArray.cross(a1, a2)")
+        return VectorArray(self.__data*other)
+
+    def __truediv__(self, other: int | float | complex):
+        """
+        Scalar true division
+
+        Raises
+        ------
+        TypeError
+            If the other is not a scalar
+        """
+        if not isinstance(other, (int, float, complex)):
+            raise TypeError("VectorArray true division using `/` is for scalar only")
+        return VectorArray(self.__data/other)
+
+    def __floordiv__(self, other: int | float):
+        """
+        Scalar floor division
+
+        Raises
+        ------
+        TypeError
+            If the other is not a scalar
+        """
+        if not isinstance(other, (int, float)):
+            raise TypeError("VectorArray floor division using `//` is for scalar only")
+        return VectorArray(self.__data//other)
+
+    def __eq__(self, other) -> bool:
+        """
+        Equal statement
+
+        True if both arrays hold the same vectors in the same order. If the other is not `VectorArray` type, automatically return False
+        """
+        if not isinstance(other, VectorArray):
+            return False
+        return self.__data.shape == other.__data.shape and bool((self.__data == other.__data).all())
+
+    def __ne__(self, other) -> bool:
+        """
+        Not equal statement
+
+        If the other is not `VectorArray` type, automatically return True
+        """
+        return not self == other
+
+    @property
+    def magnitude(self) -> np.ndarray:
+        """
+        The magnitude of every vector
+        """
+        return np.sqrt(_squared_norms(self.__data))
+
+    def normalize(self):
+        """
+        Unit vectors
+
+        Return a new array where every vector is divided by its magnitude
+
+        Raises
+        ------
+        ZeroDivisionError
+            If any of the vectors magnitude is 0
+        """
+        magnitude = self.magnitude
+        if not magnitude.all():
+            raise ZeroDivisionError("Cannot normalize a vector with 0 magnitude")
+        return VectorArray(self.__data/magnitude[:, None])
+
+    @staticmethod
+    def __pair(a1, a2, name: str) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Check the operands of the row by row products, a single `Vector` is accepted on either side and paired with every row
+        """
+        if not isinstance(a1, (VectorArray, Vector)) or not isinstance(a2, (VectorArray, Vector)):
+            raise TypeError(f"{name} only accept vector arrays or vectors as arguements")
+        x1 = a1.__data if isinstance(a1, VectorArray) else np.asarray(a1)
+        x2 = a2.__data if isinstance(a2, VectorArray) else np.asarray(a2)
+        if x1.shape[-1] != x2.shape[-1]:
+            raise DimensionsError(f"{name} required vectors with the same dimensions")
+        if x1.ndim == x2.ndim == 2 and x1.shape[0] != x2.shape[0]:
+            raise DimensionsError(f"{name} required two arrays with the same number of vectors")
+        return x1, x2
+
+    @staticmethod
+    def dot(a1, a2) -> np.ndarray:
+        """
+        Row by row dot products
+
+        Parameters
+        ----------
+        a1: VectorArray | Vector
+            The first operand
+        a2: VectorArray | Vector
+            The second operand, a single `Vector` is dotted with every row
+
+        Return
+        ------
+        The dot products as a one-dimensional numpy array
+
+        Raises
+        ------
+        TypeError
+            If the inputs are not vector arrays or vectors
+        DimensionsError
+            If the shapes do not match
+        """
+        x1, x2 = VectorArray.__pair(a1, a2, "Dot product")
+        return np.einsum("...i,...i->...", x1, x2)
+
+    @staticmethod
+    def cross(a1, a2):
+        """
+        Row by row cross products
+
+        Parameters
+        ----------
+        a1: VectorArray | Vector
+            The first operand
+        a2: VectorArray | Vector
+            The second operand, a single `Vector` is crossed with every row
+
+        Raises
+        ------
+        TypeError
+            If the inputs are not vector arrays or vectors
+        DimensionsError
+            Only 3-dimensional vectors are supported, the same as `Vector.cross()`
+        """
+        x1, x2 = VectorArray.__pair(a1, a2, "Cross product")
+        if x1.shape[-1] != 3:
+            raise DimensionsError("Only supported cross product for 3-dimensional vectors")
+        return VectorArray(np.atleast_2d(np.cross(x1, x2)))
+
+    @staticmethod
+    def get_angle(a1, a2, rad: bool=True) -> np.ndarray:
+        """
+        Row by row angles
+
+        Parameters
+        ----------
+        a1: VectorArray | Vector
+            The first operand
+        a2: VectorArray | Vector
+            The second operand, a single `Vector` is compared with every row
+        rad: bool (default True)
+            Output in radian form or not
+
+        Return
+        ------
+        The angles as a one-dimensional numpy array, in the range [0, pi] radian or [0, 180] degrees. Complex vectors are compared the same way as in `Vector.get_angle()`
+
+        Raises
+        ------
+        TypeError
+            If the inputs are not vector arrays or vectors
+        DimensionsError
+            If the shapes do not match
+        ZeroDivisionError
+            If any of the vectors magnitude is 0
+        """
+        x1, x2 = VectorArray.__pair(a1, a2, "get_angle()")
+        norms = np.sqrt(_squared_norms(x1)*_squared_norms(x2))
+        if not np.all(norms):
+            raise ZeroDivisionError("Cannot get angle between two vectors if one of them have 0 magnitude")
+        cosine = np.clip(np.einsum("...i,...i->...", x1.conj() if x1.dtype.kind == "c" else x1, x2).real/norms, -1, 1)
+        angle_as_rad = np.arccos(cosine)
+        if rad is True:
+            return angle_as_rad
+        return np.degrees(angle_as_rad)
+
+
+def nearest(query, candidates, k: int = 1) -> tuple[np.ndarray, np.ndarray]:
+    """
+    k nearest neighbours
+
+    Brute-force Euclidean k-nearest-neighbour search in one vectorized pass: every candidate is scored against every query with a single matrix product, `|c|² - 2 q·c`, which is the squared distance minus the `|q|²` all candidates share, with queries and candidates first centred on the candidates mean so the scores keep their precision away from the origin, then the k smallest are selected per query without sorting the rest, and only those k distances are recomputed exactly. Queries are processed in blocks, so memory stays bounded for any number of candidates. Convert hundreds of thousands of `Vector` into a `VectorArray` once and reuse it, converting the candidates is the only per-vector Python work left
+
+    Parameters
+    ----------
+    query: Vector | VectorArray | Expression
+        One query vector, or a batch of queries
+    candidates: VectorArray | Sequence[Vector]
+        The vectors searched, with the same dimensions as the queries
+    k: int (default 1)
+        The number of neighbours, at most the number of candidates
+
+    Return
+    ------
+    (indices, distances), numpy arrays of the candidates positions and their distances, closest first. One-dimensional of length k for a single `Vector` query, of shape (number of queries, k) for a `VectorArray`
+
+    Raises
+    ------
+    TypeError
+        If the query or the candidates are not vectors
+    DimensionsError
+        If the queries and the candidates dimensions are not the same
+    ValueError
+        If k is not between 1 and the number of candidates
+    """
+    query = _evaluated(query)
+    if not isinstance(query, (Vector, VectorArray)):
+        raise TypeError("nearest() query should be a `Vector` or a `VectorArray`")
+    if not isinstance(candidates, VectorArray):
+        candidates = VectorArray.from_vectors(candidates)
+    points = np.asarray(candidates, dtype=float)
+    queries = np.atleast_2d(np.asarray(query, dtype=float))
+    if len(points) and queries.shape[1] != points.shape[1]:
+        raise DimensionsError("nearest() required queries and candidates with the same dimensions")
+    if not isinstance(k, int) or not 1 <= k <= len(points):
+        raise ValueError("k should be between 1 and the number of candidates")
+    # Centred on the candidates mean: the expanded form cancels |c|² against 2q·c, which keeps no digits for points far from the origin
+    centre = points.mean(axis=0) if len(points) else 0.0
+    shifted = points - centre
+    squared = np.einsum("ij,ij->i", shifted, shifted)
+    indices = np.empty((len(queries), k), dtype=np.intp)
+    distances = np.empty((len(queries), k))
+    step = max(1, _NEAREST_BLOCK//len(points))
+    for start in range(0, len(queries), step):
+        block = queries[start:start + step]
+        scores = squared - 2*((block - centre) @ shifted.T)
+        if k < len(points):
+            chosen = np.argpartition(scores, k - 1, axis=1)[:, :k]
+        else:
+            chosen = np.broadcast_to(np.arange(k), (len(block), k))
+        exact = np.sqrt(((points[chosen] - block[:, None, :])**2).sum(axis=2))
+        order = np.argsort(exact, axis=1, kind="stable")
+        indices[start:start + step] = np.take_along_axis(chosen, order, axis=1)
+        distances[start:start + step] = np.take_along_axis(exact, order, axis=1)
+    if isinstance(query, Vector):
+        return indices[0], distances[0]
+    return indices, distances
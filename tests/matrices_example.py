@@ -1,4 +1,4 @@
-import linepy as lp 
+import lalgpy as lp 
 
 m1 = lp.Matrix([2,3,2], [1,2,5])
 m2 = lp.Matrix([1,0], [2,5])
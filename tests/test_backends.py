@@ -0,0 +1,161 @@
+"""
+Every registered backend against the pure Python reference
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+import lalgpy as lp
+from lalgpy import backends
+
+BACKENDS = [name for name in lp.available_backends() if name != "python"]
+
+VECTORS = {
+    "int": (lambda: lp.Vector(1, -2, 3), lambda: lp.Vector(4, 5, -6)),
+    "float": (lambda: lp.Vector(1.5, -2.25, 3.0), lambda: lp.Vector(0.5, 4.0, -1.75)),
+    "float32": (lambda: lp.Vector(1.5, -2.25, 3.0, dtype="float32"), lambda: lp.Vector(0.5, 4.0, -1.75, dtype="float32")),
+    "complex": (lambda: lp.Vector(1 + 2j, -2, 3j, dtype=complex), lambda: lp.Vector(4, 1 - 1j, -6, dtype=complex)),
+    "numpy": (lambda: lp.Vector.from_numpy(np.array([1.0, 2.0, 3.0])), lambda: lp.Vector.from_numpy(np.array([-3.0, 0.5, 2.0]))),
+}
+
+MATRICES = {
+    "int": (lambda: lp.Matrix([1, 2, 3], [4, 5, 6], [7, 8, 10]), lambda: lp.Matrix([2, 0, 1], [1, 3, -1], [0, 1, 4])),
+    "float": (lambda: lp.Matrix([1.5, 2, 3], [4, 5.25, 6], [7, 8, 10]), lambda: lp.Matrix([2, 0.5, 1], [1, 3, -1], [0, 1, 4])),
+    "float32": (lambda: lp.Matrix([1.5, 2, 3], [4, 5.25, 6], [7, 8, 10], dtype="float32"),
+                lambda: lp.Matrix([2, 0.5, 1], [1, 3, -1], [0, 1, 4], dtype="float32")),
+    "complex": (lambda: lp.Matrix([1j, 2, 3], [4, 5, 6j], [7, 8, 10], dtype=complex),
+                lambda: lp.Matrix([2, 0, 1 + 1j], [1, 3, -1], [0, 1j, 4], dtype=complex)),
+    "large": (lambda: lp.Matrix.from_numpy(np.arange(100.0).reshape(10, 10)), lambda: lp.Matrix.from_numpy(np.eye(10) - 0.5)),
+}
+
+
+def on(name, function):
+    with lp.backend(name):
+        return function()
+
+
+def assert_same(result, reference):
+    assert type(result) is type(reference) or isinstance(reference, (int, float, complex))
+    np.testing.assert_allclose(np.asarray(result), np.asarray(reference), rtol=1e-6)
+
+
+@pytest.mark.parametrize("name", BACKENDS)
+@pytest.mark.parametrize("kind", VECTORS)
+@pytest.mark.parametrize("operation", [
+    lambda a, b: a + b,
+    lambda a, b: a - b,
+    lambda a, b: a*3,
+    lambda a, b: a/4,
+    lambda a, b: lp.Vector.dot(a, b),
+    lambda a, b: lp.Vector.cross(a, b),
+    lambda a, b: a.norm(1),
+    lambda a, b: a.norm(2),
+    lambda a, b: a.norm(math.inf),
+    lambda a, b: lp.Vector.get_angle(a, b),
+], ids=["add", "sub", "mul", "truediv", "dot", "cross", "norm1", "norm2", "norminf", "angle"])
+def test_vector_kernels(name, kind, operation):
+    first, second = VECTORS[kind]
+    reference = on("python", lambda: operation(first(), second()))
+    assert_same(on(name, lambda: operation(first(), second())), reference)
+
+
+@pytest.mark.parametrize("name", BACKENDS)
+@pytest.mark.parametrize("kind", ["int", "float", "float32", "numpy"])
+def test_vector_floor_division(name, kind):
+    first, _ = VECTORS[kind]
+    assert_same(on(name, lambda: first()//2), on("python", lambda: first()//2))
+
+
+@pytest.mark.parametrize("name", BACKENDS)
+@pytest.mark.parametrize("kind", MATRICES)
+@pytest.mark.parametrize("operation", [
+    lambda A, B: A + B,
+    lambda A, B: A - B,
+    lambda A, B: A*B,
+    lambda A, B: A*2,
+    lambda A, B: A/2,
+    lambda A, B: A*A.row(0),
+], ids=["add", "sub", "matmul", "mul", "truediv", "matvec"])
+def test_matrix_kernels(name, kind, operation):
+    first, second = MATRICES[kind]
+    reference = on("python", lambda: operation(first(), second()))
+    assert_same(on(name, lambda: operation(first(), second())), reference)
+
+
+@pytest.mark.parametrize("name", BACKENDS)
+def test_big_integers(name):
+    A = lp.Matrix([2**70, 1], [3, 2**65])
+    reference = on("python", lambda: (A*A).components)
+    assert on(name, lambda: (A*A).components) == reference
+    assert on(name, lambda: (A + A).components) == on("python", lambda: (A + A).components)
+
+
+@pytest.mark.parametrize("name", BACKENDS)
+def test_utilities(name):
+    out = [0]*3
+    assert on(name, lambda: list(lp.array_add([1, 2, 3, 4], (10, 20, 30), out=out))) == [11, 22, 33]
+    np.testing.assert_allclose(on(name, lambda: lp.array_scalar_truediv([1, 2, 3], 2)), [0.5, 1, 1.5])
+
+
+def test_auto_matches_reference():
+    first, second = VECTORS["float"]
+    assert_same(first() + second(), on("python", lambda: first() + second()))
+    A, B = MATRICES["int"]
+    assert (A()*B()).components == on("python", lambda: (A()*B()).components)
+
+
+def test_selection():
+    assert lp.get_backend() == "auto"
+    with lp.backend("numpy"):
+        assert lp.get_backend() == "numpy"
+        with lp.backend("python"):
+            assert lp.get_backend() == "python"
+        assert lp.get_backend() == "numpy"
+    assert lp.get_backend() == "auto"
+    with pytest.raises(ValueError):
+        lp.set_backend("fortran")
+    assert lp.get_backend() == "auto"
+
+
+def test_register_backend():
+    calls = []
+
+    class Counting(backends._NumpyBackend):
+        def dot(self, a, b):
+            calls.append("dot")
+            return super().dot(a, b)
+
+    lp.register_backend("counting", Counting())
+    try:
+        assert "counting" in lp.available_backends()
+        assert on("counting", lambda: lp.Vector.dot(lp.Vector(1, 2), lp.Vector(3, 4))) == 11
+        assert calls == ["dot"]
+    finally:
+        del backends._registry["counting"]
+    with pytest.raises(TypeError):
+        lp.register_backend("broken", object())
+    with pytest.raises(ValueError):
+        lp.register_backend("auto", Counting())
+
+
+def test_incomplete_backend_is_rejected():
+    class Partial(backends.Backend):
+        def dot(self, a, b):
+            return 0
+
+    with pytest.raises(TypeError):
+        lp.register_backend("partial", Partial())
+    assert "partial" not in lp.available_backends()
+
+
+@pytest.mark.parametrize("name", ["python", *BACKENDS])
+@pytest.mark.parametrize("scale", [1e200, 1e-200])
+def test_norm_does_not_overflow(name, scale):
+    for v in (lp.Vector(scale, scale), lp.Vector(scale, -scale, dtype="float64"), lp.Vector(scale, scale, dtype=complex)):
+        assert on(name, lambda: v.norm(2)) == pytest.approx(math.hypot(scale, scale), rel=1e-15)
+        assert on(name, lambda: v.norm(1)) == pytest.approx(2*scale)
+        assert on(name, lambda: v.norm(math.inf)) == pytest.approx(scale)
+    assert on(name, lambda: lp.Vector(0.0, 0.0, dtype="float64").norm()) == 0.0
+    assert on(name, lambda: lp.Vector(math.inf, 1.0, dtype="float64").norm()) == math.inf
@@ -0,0 +1,125 @@
+"""
+Typed storage: the `dtype` of `Vector`, `Matrix`, `SparseMatrix` and `VectorArray`, its propagation and the complex factorizations
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+import lalgpy as lp
+from lalgpy import serialization
+
+DTYPES = ["float32", "float64", "int64", "complex64", "complex128"]
+
+rng = np.random.default_rng(23)
+GENERAL = rng.random((6, 6)) + np.eye(6)
+COMPLEX = GENERAL + 1j*rng.random((6, 6))
+
+
+def dense(matrix):
+    return np.array(matrix.components)
+
+
+@pytest.mark.parametrize("dtype", DTYPES)
+def test_vector_storage(dtype):
+    v = lp.Vector(1, 2, 3, dtype=dtype)
+    assert v.dtype == np.dtype(dtype)
+    assert np.asarray(v).dtype == np.dtype(dtype) and np.asarray(v).nbytes == 3*np.dtype(dtype).itemsize
+    assert v.components == [1, 2, 3]
+    assert (v + v).dtype == (v - v).dtype == (v*2).dtype == np.dtype(dtype)
+    assert lp.Vector.dot(v, v) == 14
+    assert lp.Vector.cross(v, lp.Vector(0, 0, 1, dtype=dtype)).components == [2, -1, 0]
+    assert lp.Vector.get_angle(v, v*2) == pytest.approx(0, abs=1e-3)
+
+
+@pytest.mark.parametrize("dtype", DTYPES)
+def test_matrix_storage(dtype):
+    M = lp.Matrix([1, 2], [3, 4], dtype=dtype)
+    assert M.dtype == np.dtype(dtype)
+    assert np.asarray(M).nbytes == 4*np.dtype(dtype).itemsize
+    assert M.components == [[1, 2], [3, 4]]
+    assert (M + M).dtype == (M*M).dtype == (M*2).dtype == np.dtype(dtype)
+    assert (M*lp.Vector(1, 1, dtype=dtype)).components == [3, 7]
+
+
+def test_promotion():
+    assert (lp.Vector(1, 2, dtype="float32") + lp.Vector(1, 2, dtype="float64")).dtype == np.float64
+    assert (lp.Vector(1, 2, dtype="int64") + lp.Vector(1.5, 2, dtype="float32")).dtype == np.float64
+    assert (lp.Vector(1, 2, dtype="float32") + lp.Vector(1, 2)).dtype == np.float64
+    product = lp.Matrix([1, 2], dtype="float64")*lp.Vector(1j, 1, dtype="complex64")
+    assert product.dtype == np.complex128 and product.components == [2 + 1j]
+    assert (lp.Matrix([1, 2], dtype="float32")*lp.Matrix([1], [2], dtype="complex64")).dtype == np.complex64
+    assert lp.Vector(1, 2, dtype="float32").astype("complex128").dtype == np.complex128
+
+
+def test_complex_values():
+    v = lp.Vector(3j, 4, dtype="complex128")
+    assert v.norm() == 5.0
+    assert (v*1j).components == [-3, 4j]
+    assert lp.Vector.dot(v, v) == -9 + 16
+    assert lp.Vector.get_angle(v, v*1j) == pytest.approx(math.pi/2)
+    with pytest.raises(TypeError):
+        lp.Vector(1j, 2)
+    with pytest.raises(TypeError):
+        lp.Vector(1j, 2, dtype="float64")
+    with pytest.raises(TypeError):
+        lp.Matrix([1.5, 2], dtype="int64")
+    with pytest.raises(TypeError):
+        lp.Vector(1, 2, dtype="float16")
+
+
+def test_complex_sparse_matrices():
+    S = lp.SparseMatrix([0, 1], [1, 0], [1j, 2], (2, 2))
+    assert S.to_matrix().dtype == np.complex128
+    assert lp.SparseMatrix.from_matrix(S.to_matrix()).to_matrix() == S.to_matrix()
+    assert (S*lp.Vector(1, 1j, dtype="complex128")).components == [-1, 2]
+    assert (S*2j).to_matrix() == lp.Matrix([0, -2], [4j, 0], dtype="complex128")
+    assert (S + S.transpose()).to_matrix() == lp.Matrix([0, 2 + 1j], [2 + 1j, 0], dtype="complex128")
+
+
+def test_complex_vector_arrays():
+    data = np.array([[1 + 1j, 2, 0], [0, 1j, 3]])
+    array = lp.VectorArray(data)
+    np.testing.assert_allclose(array.magnitude, np.linalg.norm(data, axis=1))
+    np.testing.assert_allclose(array.normalize().magnitude, 1)
+    np.testing.assert_allclose(lp.VectorArray.dot(array, array), [lp.Vector.dot(v, v) for v in array])
+    other = lp.VectorArray(np.array([[1, 0, 0], [0, 1, 1j]]))
+    np.testing.assert_allclose(lp.VectorArray.get_angle(array, other), [lp.Vector.get_angle(v, w) for v, w in zip(array, other)])
+    vectors = array.to_vectors()
+    assert vectors[1] == lp.Vector(0, 1j, 3, dtype="complex128")
+    vectors[0] *= 2
+    assert array[0] == lp.Vector(1 + 1j, 2, 0, dtype="complex128")
+    assert (array*1j)[1] == lp.Vector(0, -1, 3j, dtype="complex128")
+
+
+@pytest.mark.parametrize("method", ["lu", "qr"])
+def test_complex_solve(method):
+    A = lp.Matrix.from_numpy(COMPLEX, copy=True)
+    b = rng.random(6) + 1j*rng.random(6)
+    x = A.solve(lp.Vector.from_numpy(b), method=method)
+    np.testing.assert_allclose(np.asarray(x), np.linalg.solve(COMPLEX, b), rtol=1e-9)
+
+
+def test_complex_factorizations():
+    A = lp.Matrix.from_numpy(COMPLEX, copy=True)
+    P, L, U = A.lu()
+    np.testing.assert_allclose(dense(P) @ COMPLEX, dense(L) @ dense(U), atol=1e-12)
+    Q, R = A.qr()
+    np.testing.assert_allclose(dense(Q) @ dense(R), COMPLEX, atol=1e-12)
+    np.testing.assert_allclose(dense(Q).conj().T @ dense(Q), np.eye(6), atol=1e-12)
+    assert A.det() == pytest.approx(np.linalg.det(COMPLEX))
+    np.testing.assert_allclose(dense(A.inverse()), np.linalg.inv(COMPLEX), rtol=1e-9)
+
+
+@pytest.mark.parametrize("dtype", ["float32", "complex64", "complex128"])
+def test_serialization_keeps_the_dtype(tmp_path, dtype):
+    v = lp.Vector(1.5, -2, 3, dtype=dtype)
+    M = lp.Matrix([1.5, -2], [3, 0.25], dtype=dtype)
+    assert len(v.to_bytes()) == serialization.HEADER_SIZE + 3*np.dtype(dtype).itemsize
+    assert lp.Vector.from_bytes(v.to_bytes()).dtype == np.dtype(dtype)
+    assert lp.Vector.from_bytes(v.to_bytes()) == v
+    M.save(tmp_path/"m.lalg")
+    for mode in (None, "r"):
+        loaded = lp.Matrix.load(tmp_path/"m.lalg", mmap_mode=mode)
+        assert loaded.dtype == np.dtype(dtype) and loaded == M
@@ -0,0 +1,83 @@
+"""
+Eigen decompositions against `numpy.linalg`
+"""
+
+import numpy as np
+import pytest
+
+import lalgpy as lp
+
+rng = np.random.default_rng(12)
+N = 40
+_base = rng.standard_normal((N, N))
+SYMMETRIC = _base + _base.T
+# Nonsymmetric with well separated real eigenvalues, so block power iteration converges quickly
+_basis = rng.standard_normal((N, N)) + N*np.eye(N)
+GENERAL = _basis @ np.diag(2.0**-np.arange(N)*100) @ np.linalg.inv(_basis)
+
+
+def matrix(data):
+    return lp.Matrix(*data.tolist())
+
+
+def by_magnitude(values):
+    return values[np.argsort(-np.abs(values), kind="stable")]
+
+
+def check_pairs(A, values, vectors):
+    for value, vector in zip(values, vectors):
+        v = np.array(vector.components)
+        assert np.linalg.norm(v) == pytest.approx(1)
+        np.testing.assert_allclose(A @ v, value*v, atol=1e-6*np.abs(values).max())
+
+
+def test_eigvals_and_eig_symmetric():
+    A = matrix(SYMMETRIC)
+    expected = by_magnitude(np.linalg.eigh(SYMMETRIC)[0])
+    np.testing.assert_allclose(A.eigvals(), expected, rtol=1e-10)
+    values, vectors = A.eig()
+    assert all(isinstance(value, float) for value in values)
+    check_pairs(SYMMETRIC, values, vectors)
+
+
+def test_eig_general_complex_values():
+    rotation = lp.Matrix([0, -1], [1, 0])
+    values = rotation.eigvals()
+    assert sorted(values, key=lambda value: value.imag) == pytest.approx([-1j, 1j])
+    values, vectors = rotation.eig()
+    check_pairs(np.array([[0, -1], [1, 0]]), values, vectors)
+
+
+@pytest.mark.parametrize("k", [1, 3, 8])
+def test_top_k_eig_matches_eigh(k):
+    values, vectors = matrix(SYMMETRIC).top_k_eig(k)
+    expected = by_magnitude(np.linalg.eigh(SYMMETRIC)[0])[:k]
+    np.testing.assert_allclose(values, expected, rtol=1e-8)
+    assert len(vectors) == k
+    check_pairs(SYMMETRIC, values, vectors)
+
+
+def test_top_k_eig_sparse_matches_eigh():
+    dense = 2*np.eye(N) - np.eye(N, k=1) - np.eye(N, k=-1)
+    values, vectors = lp.SparseMatrix.from_matrix(matrix(dense)).top_k_eig(4)
+    np.testing.assert_allclose(values, by_magnitude(np.linalg.eigh(dense)[0])[:4], rtol=1e-8)
+    check_pairs(dense, values, vectors)
+
+
+def test_top_k_eig_general():
+    values, vectors = matrix(GENERAL).top_k_eig(3)
+    np.testing.assert_allclose(np.real(values), [100, 50, 25], rtol=1e-6)
+    check_pairs(GENERAL, values, vectors)
+
+
+def test_errors():
+    with pytest.raises(lp.DimensionsError):
+        lp.Matrix([1, 2, 3], [4, 5, 6]).eigvals()
+    with pytest.raises(lp.DimensionsError):
+        lp.Matrix([1, 2, 3], [4, 5, 6]).top_k_eig(1)
+    with pytest.raises(ValueError):
+        matrix(SYMMETRIC).top_k_eig(0)
+    with pytest.raises(ValueError):
+        matrix(SYMMETRIC).top_k_eig(N + 1)
+    with pytest.raises(lp.ConvergenceError):
+        matrix(GENERAL).top_k_eig(1, maxiter=1)
@@ -0,0 +1,95 @@
+"""
+Lazy expressions against eager evaluation
+"""
+
+import math
+
+import pytest
+
+import lalgpy as lp
+
+
+@pytest.fixture
+def vectors():
+    return lp.Vector(1, 2, 3), lp.Vector(4, 5, 6), lp.Vector(1, 0, 0)
+
+
+@pytest.mark.parametrize("operation", [
+    lp.Vector.dot,
+    lp.Vector.cross,
+    lp.Vector.get_angle,
+    lp.Vector.distance,
+], ids=["dot", "cross", "angle", "distance"])
+def test_static_methods_evaluate_expressions(vectors, operation):
+    a, b, c = vectors
+    expected, reflected = operation(a + b, c), operation(c, a + b)
+    with lp.lazy():
+        assert operation(a + b, c) == expected
+        assert operation(c, a + b) == reflected
+
+
+def test_expression_arguments_after_lazy_mode(vectors):
+    a, b, c = vectors
+    with lp.lazy():
+        expression = a*2 - b
+    assert isinstance(expression, lp.Expression)
+    assert lp.Vector.dot(expression, c) == -2
+    assert math.isclose(lp.Vector.distance(expression, c), math.hypot(-3, -1, 0))
+
+
+def test_comparisons_are_symmetric(vectors):
+    a, b, _ = vectors
+    A = lp.Matrix([1, 2], [3, 4])
+    with lp.lazy():
+        vector, matrix = a + b, A + A
+    assert lp.Vector(5, 7, 9) == vector and vector == lp.Vector(5, 7, 9)
+    assert not lp.Vector(5, 7, 9) != vector and not vector != lp.Vector(5, 7, 9)
+    assert lp.Matrix([2, 4], [6, 8]) == matrix and matrix == lp.Matrix([2, 4], [6, 8])
+    assert lp.Matrix([2, 4], [6, 8]) != matrix*2 and matrix*2 != lp.Matrix([2, 4], [6, 8])
+
+
+@pytest.mark.parametrize("value", [
+    lp.Vector(1, 2, 3),
+    lp.Matrix([1, 2], [3, 4]),
+    lp.Matrix3([1, 2, 3], [4, 5, 6], [7, 8, 9]),
+], ids=["vector", "matrix", "matrix3"])
+def test_other_types_compare_unequal(value):
+    for other in (None, 1, "text", [1, 2, 3], (1, 2, 3)):
+        assert not value == other and not other == value
+        assert value != other and other != value
+
+
+def test_solvers_evaluate_expressions():
+    A, x0 = lp.Matrix([4.0, 1.0], [1.0, 3.0]), lp.Vector(0.0, 0.0)
+    expected = A.solve(lp.Vector(1.0, 2.0))
+    with lp.lazy():
+        b, twice = lp.Vector(1.0, 0.0) + lp.Vector(0.0, 2.0), A + A
+        assert A.solve(b) == expected
+        assert A.solve(twice) == lp.Matrix([2.0, 0.0], [0.0, 2.0])
+        for solver in (lp.cg, lp.gmres, lp.jacobi, lp.gauss_seidel):
+            x = solver(twice, b, x0=x0 + x0)
+            assert x.components == pytest.approx((expected/2).components)
+
+
+def test_products_evaluate_expressions():
+    A = lp.Matrix([1.0, 2.0], [3.0, 4.0])
+    R = lp.Matrix3([1, 0, 0], [0, 2, 0], [0, 0, 3])
+    S = lp.SparseMatrix([0, 1], [0, 1], [4.0, 3.0], (2, 2))
+    with lp.lazy():
+        v, w, B = lp.Vector(1.0, 0.0) + lp.Vector(0.0, 1.0), lp.Vector(1, 2, 3)*1, A + A
+        assert lp.multi_dot([B, A, v]) == lp.Vector(34.0, 74.0)
+        assert R*w == lp.Vector(1, 4, 9)
+        assert S*v == lp.Vector(4.0, 3.0)
+        assert S*B == lp.Matrix([8.0, 16.0], [18.0, 24.0])
+
+
+def test_searches_evaluate_expressions():
+    points = [lp.Vector(0.0, 0.0), lp.Vector(1.0, 1.0), lp.Vector(5.0, 5.0)]
+    tree = lp.KDTree(points)
+    with lp.lazy():
+        query = points[1] + lp.Vector(0.1, 0.0)
+        assert lp.nearest(query, points)[0].tolist() == [1]
+        assert tree.query(query)[0].tolist() == [1]
+        assert lp.VectorArray.from_vectors([query, points[0]]).to_vectors()[0] == lp.Vector(1.1, 1.0)
+        tree.insert(query*2)
+        assert tree.query(lp.Vector(2.2, 2.0))[0].tolist() == [3]
@@ -0,0 +1,144 @@
+"""
+LU, QR and Cholesky factorizations and the solves built on them
+"""
+
+import numpy as np
+import pytest
+
+import lalgpy as lp
+
+rng = np.random.default_rng(9)
+GENERAL = rng.random((6, 6)) + np.eye(6)
+TALL = rng.random((7, 4))
+SPD = GENERAL @ GENERAL.T + 6*np.eye(6)
+
+
+def matrix(data):
+    return lp.Matrix(*data.tolist())
+
+
+def dense(matrix):
+    return np.array(matrix.components)
+
+
+@pytest.mark.parametrize("data", [GENERAL, [[0, 2, 1], [1, 1, 0], [3, 0, 4]]], ids=["float", "int"])
+def test_lu_reconstructs(data):
+    A = matrix(np.array(data))
+    P, L, U = A.lu()
+    np.testing.assert_allclose(dense(P) @ dense(A), dense(L) @ dense(U), atol=1e-12)
+    np.testing.assert_allclose(np.diag(dense(L)), 1)
+    assert np.allclose(np.triu(dense(L), 1), 0) and np.allclose(np.tril(dense(U), -1), 0)
+
+
+@pytest.mark.parametrize("data", [GENERAL, TALL], ids=["square", "tall"])
+def test_qr_reconstructs(data):
+    Q, R = matrix(data).qr()
+    q = dense(Q)
+    np.testing.assert_allclose(q @ dense(R), data, atol=1e-12)
+    np.testing.assert_allclose(q.conj().T @ q, np.eye(q.shape[1]), atol=1e-12)
+    assert np.allclose(np.tril(dense(R), -1), 0)
+
+
+def test_cholesky_reconstructs():
+    L = dense(matrix(SPD).cholesky())
+    np.testing.assert_allclose(L @ L.T, SPD, atol=1e-10)
+    assert np.allclose(np.triu(L, 1), 0)
+
+
+def test_cholesky_errors():
+    with pytest.raises(ValueError):
+        lp.Matrix([1, 2], [3, 4]).cholesky()
+    with pytest.raises(ValueError):
+        lp.Matrix([1, 2], [2, 1]).cholesky()
+    with pytest.raises(lp.DimensionsError):
+        matrix(TALL).cholesky()
+
+
+@pytest.mark.parametrize("method, data", [("lu", GENERAL), ("qr", GENERAL), ("cholesky", SPD)],
+                         ids=["lu", "qr", "cholesky"])
+def test_solve(method, data):
+    A = matrix(data)
+    b = rng.random(6)
+    x = A.solve(lp.Vector(*b.tolist()), method=method)
+    assert isinstance(x, lp.Vector)
+    np.testing.assert_allclose(np.array(x.components), np.linalg.solve(data, b), rtol=1e-9)
+    B = rng.random((6, 2))
+    X = A.solve(matrix(B), method=method)
+    assert isinstance(X, lp.Matrix)
+    np.testing.assert_allclose(dense(X), np.linalg.solve(data, B), rtol=1e-9)
+
+
+def test_least_squares():
+    b = rng.random(7)
+    x = matrix(TALL).solve(lp.Vector(*b.tolist()), method="qr")
+    np.testing.assert_allclose(np.array(x.components), np.linalg.lstsq(TALL, b, rcond=None)[0], rtol=1e-9)
+
+
+def test_det_and_inverse():
+    A = matrix(GENERAL)
+    assert A.det() == pytest.approx(np.linalg.det(GENERAL))
+    np.testing.assert_allclose(dense(A.inverse()), np.linalg.inv(GENERAL), rtol=1e-9)
+    assert lp.Matrix([2, 1], [1, 3]).det() == pytest.approx(5)
+
+
+def test_factorization_follows_updates():
+    A = lp.Matrix([2, 1], [1, 3])
+    assert A.det() == pytest.approx(5)
+    A *= 2
+    assert A.det() == pytest.approx(20)
+
+
+def test_factorization_follows_outside_writes():
+    A = lp.Matrix([2.0, 1.0], [1.0, 3.0])
+    assert A.det() == pytest.approx(5)
+    np.asarray(A)[0, 0] = 10
+    assert A.det() == pytest.approx(29)
+    assert A.eigvals() == pytest.approx(sorted(np.linalg.eigvalsh([[10, 1], [1, 3]]), key=abs, reverse=True))
+    np.asarray(A)[1, 1] = 1
+    np.testing.assert_allclose(dense(A.inverse()), np.linalg.inv([[10, 1], [1, 1]]))
+
+
+def test_factorization_follows_the_numpy_source():
+    source = np.array([[2.0, 1.0], [1.0, 3.0]])
+    A = lp.Matrix.from_numpy(source)
+    assert A.det() == pytest.approx(5)
+    x = A.solve(lp.Vector(1.0, 1.0))
+    source[0, 0] = 10
+    assert A.det() == pytest.approx(29)
+    np.testing.assert_allclose(A.solve(lp.Vector(1.0, 1.0)).components, np.linalg.solve(source, [1, 1]))
+    assert x.components != A.solve(lp.Vector(1.0, 1.0)).components
+    for method in ("qr", "cholesky"):
+        source[0, 0] = 2
+        A.solve(lp.Vector(1.0, 1.0), method=method)
+        source[0, 0] = 10
+        np.testing.assert_allclose(A.solve(lp.Vector(1.0, 1.0), method=method).components, np.linalg.solve(source, [1, 1]))
+    copy = lp.Matrix.from_numpy(source, copy=True)
+    assert copy.det() == pytest.approx(29)
+    source[0, 0] = 2
+    assert copy.det() == pytest.approx(29)
+
+
+@pytest.mark.parametrize("method", ["lu", "qr"])
+@pytest.mark.parametrize("rows", [
+    ([1, 2, 3], [2, 4, 6], [1, 0, 1]),
+    ([0.1, 0.2, 0.3], [0.4, 0.5, 0.6], [0.7, 0.8, 0.9]),
+], ids=["exact", "rounded"])
+def test_singular(method, rows):
+    A = lp.Matrix(*rows)
+    with pytest.raises(lp.SingularMatrixError):
+        A.solve(lp.Vector(1, 2, 3), method=method)
+    with pytest.raises(lp.SingularMatrixError):
+        A.inverse()
+    assert A.det() == pytest.approx(0, abs=1e-12)
+
+
+def test_solve_errors():
+    A = matrix(GENERAL)
+    with pytest.raises(TypeError):
+        A.solve([1, 2, 3, 4, 5, 6])
+    with pytest.raises(ValueError):
+        A.solve(lp.Vector(*range(6)), method="svd")
+    with pytest.raises(lp.DimensionsError):
+        A.solve(lp.Vector(1, 2))
+    with pytest.raises(lp.DimensionsError):
+        matrix(TALL).lu()
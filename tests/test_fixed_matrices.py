@@ -0,0 +1,122 @@
+"""
+`Matrix3` and `Matrix4` against numpy and the general `Matrix`
+"""
+
+import numpy as np
+import pytest
+
+import lalgpy as lp
+
+rng = np.random.default_rng(20)
+FIXED = {3: lp.Matrix3, 4: lp.Matrix4}
+
+
+def fixed(data):
+    return FIXED[len(data)](*data.tolist())
+
+
+def values(matrix):
+    return np.array(matrix.components, dtype=float)
+
+
+@pytest.mark.parametrize("n", [3, 4])
+def test_det_and_inverse(n):
+    for _ in range(20):
+        data = rng.standard_normal((n, n))
+        M = fixed(data)
+        assert np.isclose(M.det(), np.linalg.det(data), rtol=1e-10)
+        inverse = M.inverse()
+        assert type(inverse) is type(M)
+        np.testing.assert_allclose(values(inverse), np.linalg.inv(data), rtol=1e-9, atol=1e-12)
+        np.testing.assert_allclose(values(M*inverse), np.eye(n), atol=1e-10)
+
+
+@pytest.mark.parametrize("n", [3, 4])
+def test_integer_determinant_is_exact(n):
+    data = rng.integers(-9, 9, (n, n))
+    assert fixed(data).det() == round(np.linalg.det(data))
+    assert isinstance(fixed(data).det(), int)
+
+
+@pytest.mark.parametrize("n", [3, 4])
+def test_singular(n):
+    singular = fixed(np.arange(n*n).reshape(n, n))
+    assert singular.det() == 0
+    with pytest.raises(lp.SingularMatrixError):
+        singular.inverse()
+
+
+@pytest.mark.parametrize("n", [3, 4])
+def test_products_and_arithmetic(n):
+    a, b = rng.standard_normal((n, n)), rng.standard_normal((n, n))
+    A, B = fixed(a), fixed(b)
+    product = A*B
+    assert type(product) is type(A)
+    np.testing.assert_allclose(values(product), a @ b, rtol=1e-12)
+    np.testing.assert_allclose(values(A + B), a + b)
+    np.testing.assert_allclose(values(A - B), a - b)
+    np.testing.assert_allclose(values(A*2.5), a*2.5)
+    np.testing.assert_allclose(values(A/4), a/4)
+    np.testing.assert_allclose(values(A.T), a.T)
+    x = rng.standard_normal(n)
+    np.testing.assert_allclose((A*lp.Vector(*x.tolist())).components, a @ x, rtol=1e-12)
+    assert type(A).identity()*A == A
+
+
+def test_matrix3_transform():
+    a, x = rng.standard_normal((3, 3)), rng.standard_normal(3)
+    A, v = lp.Matrix3(*a.tolist()), lp.Vector(*x.tolist())
+    assert A.transform(v) == A*v
+    np.testing.assert_allclose(A.transform(v).components, a @ x, rtol=1e-12)
+
+
+def test_matrix4_transforms():
+    # A rotation about z by 90°, a scaling and a translation
+    T = lp.Matrix4([0, -2, 0, 1], [2, 0, 0, 2], [0, 0, 2, 3], [0, 0, 0, 1])
+    assert T.transform_point(lp.Vector(1, 0, 0)) == lp.Vector(1, 4, 3)
+    assert T.transform_direction(lp.Vector(1, 0, 0)) == lp.Vector(0, 2, 0)
+    a, x = rng.standard_normal((4, 4)), rng.standard_normal(3)
+    A, v = lp.Matrix4(*a.tolist()), lp.Vector(*x.tolist())
+    homogeneous = a @ np.append(x, 1)
+    np.testing.assert_allclose(A.transform_point(v).components, homogeneous[:3]/homogeneous[3], rtol=1e-10)
+    np.testing.assert_allclose(A.transform_direction(v).components, a[:3, :3] @ x, rtol=1e-12)
+    projection = lp.Matrix4([1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0], [0, 0, 1, 0])
+    with pytest.raises(ZeroDivisionError):
+        projection.transform_point(lp.Vector(1, 1, 0))
+
+
+@pytest.mark.parametrize("n", [3, 4])
+def test_interop_with_matrix(n):
+    a, b = rng.standard_normal((n, n)), rng.standard_normal((n, 2))
+    A, general = fixed(a), lp.Matrix(*a.tolist())
+    assert A.to_matrix() == general
+    assert A == general and general == A
+    assert type(A).from_matrix(general) == A
+    for result, expected in ((A*lp.Matrix(*b.tolist()), a @ b), (general*A, a @ a),
+                             (A + general, 2*a), (general - A, 0*a)):
+        assert type(result) is lp.Matrix
+        np.testing.assert_allclose(values(result), expected, rtol=1e-12)
+    np.testing.assert_array_equal(np.asarray(A), a)
+    np.testing.assert_allclose(values(A.to_matrix().inverse()), values(A.inverse()), rtol=1e-9)
+
+
+def test_errors():
+    with pytest.raises(lp.DimensionsError):
+        lp.Matrix3([1, 2, 3], [4, 5, 6])
+    with pytest.raises(lp.DimensionsError):
+        lp.Matrix4([1, 2, 3], [4, 5, 6], [7, 8, 9])
+    with pytest.raises(TypeError):
+        lp.Matrix3([1, 2, 3], [4, 5, 6], [7, 8, "9"])
+    with pytest.raises(lp.DimensionsError):
+        lp.Matrix3.from_matrix(lp.Matrix([1, 2], [3, 4]))
+    with pytest.raises(TypeError):
+        lp.Matrix3.from_matrix([[1, 2, 3], [4, 5, 6], [7, 8, 9]])
+    with pytest.raises(lp.DimensionsError):
+        lp.Matrix3.identity()*lp.Vector(1, 2)
+    with pytest.raises(lp.DimensionsError):
+        lp.Matrix4.identity().transform_point(lp.Vector(1, 2, 3, 1))
+    with pytest.raises(TypeError):
+        lp.Matrix3.identity()/lp.Vector(1, 2, 3)
+    with pytest.raises(TypeError):
+        lp.Matrix3.identity()*lp.Matrix4.identity()
+    assert lp.Matrix3.identity() != lp.Matrix4.identity()
@@ -0,0 +1,105 @@
+"""
+Sharing buffers with numpy: `from_numpy()`, `__array__`, `__array_interface__` and the buffer protocol
+"""
+
+import numpy as np
+import pytest
+
+import lalgpy as lp
+from lalgpy import serialization
+
+
+def test_matrix_from_numpy_shares_both_ways():
+    source = np.array([[1.0, 2.0], [3.0, 4.0]])
+    M = lp.Matrix.from_numpy(source)
+    assert np.shares_memory(np.asarray(M), source)
+    source[0, 1] = 20
+    assert M[0, 1] == 20
+    M += lp.Matrix([1, 1], [1, 1])
+    np.testing.assert_array_equal(source, [[2.0, 21.0], [4.0, 5.0]])
+    copy = lp.Matrix.from_numpy(source, copy=True)
+    source[0, 0] = 0
+    assert copy[0, 0] == 2.0
+    assert not np.shares_memory(np.asarray(copy), source)
+
+
+def test_vector_from_numpy_shares_both_ways():
+    source = np.array([3.0, 4.0])
+    v = lp.Vector.from_numpy(source)
+    assert np.shares_memory(np.asarray(v), source)
+    assert v.norm() == 5.0
+    source[:] = [6.0, 8.0]
+    assert v.components == [6.0, 8.0]
+    assert v.norm() == 10.0
+    v *= 2
+    np.testing.assert_array_equal(source, [12.0, 16.0])
+    copy = lp.Vector.from_numpy(source, copy=True)
+    source[0] = 0
+    assert copy.components == [12.0, 16.0]
+
+
+def test_matrix_array_is_zero_copy():
+    M = lp.Matrix([2.0, 1.0], [1.0, 3.0])
+    assert M.det() == pytest.approx(5)
+    view = np.asarray(M)
+    assert view.flags.writeable
+    view[1, 1] = 8
+    assert M.components == [[2.0, 1.0], [1.0, 8.0]]
+    assert M.det() == pytest.approx(15)
+    view[1, 1] = 3
+    assert M.det() == pytest.approx(5)
+    copy = np.array(M)
+    converted = np.asarray(M, dtype=np.float32)
+    copy[0, 0] = converted[0, 0] = 100
+    assert M[0, 0] == 2.0
+
+
+def test_vector_array_of_a_list_is_a_copy():
+    v = lp.Vector(3, 4)
+    assert v.norm() == 5.0
+    array = np.asarray(v)
+    array[0] = 0
+    assert v.components == [3, 4]
+    assert v.norm() == 5.0
+    with pytest.raises(AttributeError):
+        v.__array_interface__
+
+
+def test_array_interface_is_zero_copy():
+    M = lp.Matrix([2.0, 1.0], [1.0, 3.0])
+    assert M.det() == pytest.approx(5)
+    interface = M.__array_interface__
+    assert interface["shape"] == (2, 2)
+    assert interface["data"][0] == np.asarray(M).__array_interface__["data"][0]
+    alias = np.asarray(type("Alias", (), {"__array_interface__": interface})())
+    alias[0, 0] = 10
+    assert M[0, 0] == 10
+    assert M.det() == pytest.approx(29)
+    source = np.arange(3.0)
+    v = lp.Vector.from_numpy(source)
+    assert v.__array_interface__["data"][0] == source.__array_interface__["data"][0]
+
+
+def test_buffer_protocol_is_zero_copy():
+    M = lp.Matrix([2.0, 1.0], [1.0, 3.0])
+    assert M.det() == pytest.approx(5)
+    view = M.__buffer__(0)
+    assert view.shape == (2, 2) and not view.readonly
+    view[0, 0] = 10.0
+    assert M.det() == pytest.approx(29)
+
+
+def test_serialized_vectors_view_their_buffer(tmp_path):
+    buffer = bytearray(lp.Vector(1.0, 2.0, 3.0).to_bytes())
+    v = lp.Vector.from_bytes(buffer)
+    np.frombuffer(buffer, dtype=np.float64, offset=serialization.HEADER_SIZE)[0] = 10
+    assert v.components == [10.0, 2.0, 3.0]
+    path = tmp_path/"v.lalg"
+    lp.Vector(1.0, 2.0).save(path)
+    v = lp.Vector.load(path, mmap_mode="r+")
+    v += lp.Vector(1.0, 1.0)
+    del v
+    assert lp.Vector.load(path) == lp.Vector(2.0, 3.0)
+    copy = lp.Vector.load(path, mmap_mode="c")
+    copy += lp.Vector(1.0, 1.0)
+    assert lp.Vector.load(path) == lp.Vector(2.0, 3.0)
@@ -0,0 +1,96 @@
+"""
+Memory-mapped matrices against numpy
+"""
+
+import numpy as np
+import pytest
+
+import lalgpy as lp
+from lalgpy import matrices
+
+rng = np.random.default_rng(14)
+A = rng.standard_normal((40, 30))
+B = rng.standard_normal((30, 20))
+
+
+@pytest.fixture(autouse=True)
+def small_blocks(monkeypatch):
+    # A few rows per block, so the streamed paths run over several blocks
+    monkeypatch.setattr(matrices, "_MEMMAP_BLOCK_BYTES", 8*30*7)
+
+
+def values(matrix):
+    return np.array(matrix.components)
+
+
+def npy(tmp_path, name, data):
+    path = tmp_path/name
+    np.save(path, data)
+    return str(path)
+
+
+def test_npy_and_raw_files(tmp_path):
+    M = lp.Matrix.open_memmap(npy(tmp_path, "a.npy", A), mode="r")
+    assert M.dimensions == (40, 30)
+    np.testing.assert_array_equal(values(M), A)
+    raw = tmp_path/"a.bin"
+    A.astype(np.float32).tofile(raw)
+    R = lp.Matrix.open_memmap(raw, shape=(40, 30), dtype="float32", mode="r")
+    np.testing.assert_array_equal(values(R), A.astype(np.float32))
+    I = lp.Matrix.open_memmap(npy(tmp_path, "i.npy", np.arange(12).reshape(3, 4)))
+    assert I.components == np.arange(12).reshape(3, 4).tolist()
+    Z = lp.Matrix.open_memmap(npy(tmp_path, "z.npy", A + 1j*A), mode="r")
+    assert Z.dtype == np.complex128
+    np.testing.assert_array_equal(values(Z), A + 1j*A)
+
+
+def test_streamed_products(tmp_path):
+    MA = lp.Matrix.open_memmap(npy(tmp_path, "a.npy", A), mode="r")
+    MB = lp.Matrix.open_memmap(npy(tmp_path, "b.npy", B), mode="r")
+    dense_A, dense_B = lp.Matrix(*A.tolist()), lp.Matrix(*B.tolist())
+    for product in (MA*dense_B, dense_A*MB, MA*MB):
+        np.testing.assert_allclose(values(product), A @ B, rtol=1e-12)
+    x = rng.standard_normal(30)
+    np.testing.assert_allclose((MA*lp.Vector(*x.tolist())).components, A @ x, rtol=1e-12)
+    np.testing.assert_allclose(values(MA + dense_A), 2*A)
+    np.testing.assert_allclose(values(MA - dense_A), 0)
+    np.testing.assert_allclose(values(MA*2.5), A*2.5)
+
+
+def test_create_and_write_through(tmp_path):
+    path = str(tmp_path/"c.npy")
+    C = lp.Matrix.open_memmap(path, shape=(40, 20), mode="w+")
+    assert C.components == np.zeros((40, 20)).tolist()
+    lp.Matrix.open_memmap(npy(tmp_path, "a.npy", A), mode="r").matmul(lp.Matrix(*B.tolist()), out=C)
+    C.flush()
+    np.testing.assert_allclose(np.load(path), A @ B, rtol=1e-12)
+    C += lp.Matrix(*np.ones((40, 20)).tolist())
+    C *= 2
+    C.flush()
+    np.testing.assert_allclose(np.load(path), 2*(A @ B + 1), rtol=1e-12)
+    raw = tmp_path/"c.bin"
+    D = lp.Matrix.open_memmap(raw, shape=(4, 5), dtype="int64", mode="w+")
+    D += lp.Matrix(*np.arange(20).reshape(4, 5).tolist())
+    D.flush()
+    np.testing.assert_array_equal(np.fromfile(raw, dtype=np.int64).reshape(4, 5), np.arange(20).reshape(4, 5))
+
+
+@pytest.mark.parametrize("mode", ["r", "c"])
+def test_modes_leave_the_file_unchanged(tmp_path, mode):
+    path = npy(tmp_path, "a.npy", A)
+    M = lp.Matrix.open_memmap(path, mode=mode)
+    M += lp.Matrix(*np.ones((40, 30)).tolist())
+    M.flush()
+    np.testing.assert_allclose(values(M), A + 1)
+    np.testing.assert_array_equal(np.load(path), A)
+
+
+def test_errors(tmp_path):
+    with pytest.raises(ValueError):
+        lp.Matrix.open_memmap(tmp_path/"raw.bin")
+    with pytest.raises(ValueError):
+        lp.Matrix.open_memmap(str(tmp_path/"new.npy"), mode="w+")
+    with pytest.raises(lp.DimensionsError):
+        lp.Matrix.open_memmap(npy(tmp_path, "v.npy", np.arange(5.0)))
+    with pytest.raises(TypeError):
+        lp.Matrix.open_memmap(tmp_path/"text.bin", shape=(2, 2), dtype="U3", mode="w+")
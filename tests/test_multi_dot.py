@@ -0,0 +1,84 @@
+"""
+`multi_dot` and its parenthesization against numpy
+"""
+
+import numpy as np
+import pytest
+
+import lalgpy as lp
+from lalgpy import matrices
+
+rng = np.random.default_rng(18)
+
+
+def matrix(data):
+    return lp.Matrix(*data.tolist())
+
+
+def brute_force_cost(shapes):
+    """
+    The cheapest order, trying every split
+    """
+    if len(shapes) == 1:
+        return 0
+    return min(brute_force_cost(shapes[:k]) + brute_force_cost(shapes[k:]) + shapes[0][0]*shapes[k][0]*shapes[-1][1]
+               for k in range(1, len(shapes)))
+
+
+@pytest.mark.parametrize("dims", [[10, 30, 5, 60], [40, 20, 30, 10, 30], [2, 50, 3, 40, 1, 25, 4], [7, 7]])
+def test_chain_order_is_optimal(dims):
+    shapes = list(zip(dims, dims[1:]))
+    cost, split = matrices._chain_order(shapes)
+    assert cost == brute_force_cost(shapes)
+    assert len(split) == len(shapes)
+
+
+def test_chain_order_known_cost():
+    # The textbook example, ((A1(A2A3))((A4A5)A6)) costs 15125
+    dims = [30, 35, 15, 5, 10, 20, 25]
+    cost, split = matrices._chain_order(list(zip(dims, dims[1:])))
+    assert cost == 15125
+    assert split[0][5] == 2
+
+
+@pytest.mark.parametrize("dims", [[10, 30, 5, 60], [3, 40, 2, 50, 6], [1, 20, 20, 1]])
+def test_matches_numpy(dims):
+    arrays = [rng.standard_normal(shape) for shape in zip(dims, dims[1:])]
+    product = lp.multi_dot([matrix(a) for a in arrays])
+    assert isinstance(product, lp.Matrix)
+    np.testing.assert_allclose(np.array(product.components), np.linalg.multi_dot(arrays), rtol=1e-10)
+
+
+def test_integers_are_exact():
+    arrays = [rng.integers(-9, 9, shape) for shape in [(4, 6), (6, 3), (3, 5)]]
+    product = lp.multi_dot(matrix(a) for a in arrays)
+    assert product.components == np.linalg.multi_dot(arrays).tolist()
+
+
+def test_trailing_vector():
+    arrays = [rng.standard_normal(shape) for shape in [(20, 30), (30, 40)]]
+    x = rng.standard_normal(40)
+    product = lp.multi_dot([matrix(a) for a in arrays] + [lp.Vector(*x.tolist())])
+    assert isinstance(product, lp.Vector)
+    np.testing.assert_allclose(product.components, np.linalg.multi_dot(arrays + [x]), rtol=1e-10)
+
+
+def test_single_operand():
+    A = matrix(rng.standard_normal((3, 4)))
+    assert lp.multi_dot([A]) == A
+
+
+def test_errors():
+    A, B = matrix(rng.standard_normal((3, 4))), matrix(rng.standard_normal((4, 2)))
+    with pytest.raises(ValueError):
+        lp.multi_dot([])
+    with pytest.raises(TypeError):
+        lp.multi_dot([lp.Vector(1, 2, 3)])
+    with pytest.raises(TypeError):
+        lp.multi_dot([A, lp.Vector(1, 2, 3, 4), B])
+    with pytest.raises(TypeError):
+        lp.multi_dot([A, [[1], [2], [3], [4]]])
+    with pytest.raises(lp.DimensionsError):
+        lp.multi_dot([A, A])
+    with pytest.raises(lp.DimensionsError):
+        lp.multi_dot([A, B, lp.Vector(1, 2, 3)])
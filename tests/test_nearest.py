@@ -0,0 +1,53 @@
+"""
+`nearest()` against a brute-force search
+"""
+
+import numpy as np
+import pytest
+
+import lalgpy as lp
+
+
+def brute_force(queries, points, k):
+    distances = np.sqrt(((queries[:, None, :] - points[None, :, :])**2).sum(axis=2))
+    order = np.argsort(distances, axis=1, kind="stable")[:, :k]
+    return order, np.take_along_axis(distances, order, axis=1)
+
+
+@pytest.mark.parametrize("k", [1, 5, 200])
+@pytest.mark.parametrize("offset", [0.0, 1e8], ids=["origin", "far"])
+def test_matches_brute_force(k, offset):
+    rng = np.random.default_rng(k)
+    points = offset + rng.random((200, 3))*10
+    queries = offset + rng.random((20, 3))*10
+    indices, distances = lp.nearest(lp.VectorArray(queries), lp.VectorArray(points), k)
+    expected_indices, expected_distances = brute_force(queries, points, k)
+    assert indices.shape == distances.shape == (20, k)
+    np.testing.assert_allclose(distances, expected_distances, rtol=1e-9, atol=1e-6)
+    np.testing.assert_array_equal(indices[:, 0], expected_indices[:, 0])
+
+
+def test_far_from_origin():
+    rng = np.random.default_rng(0)
+    points = 1e8 + rng.random((1000, 3))*10
+    query = lp.Vector(*(points[0] + 0.01))
+    indices, distances = lp.nearest(query, lp.VectorArray(points))
+    assert indices.tolist() == [0]
+    assert distances[0] == pytest.approx(0.01*np.sqrt(3), rel=1e-6)
+
+
+def test_single_query_and_vectors():
+    candidates = [lp.Vector(0, 0), lp.Vector(3, 4), lp.Vector(1, 1)]
+    indices, distances = lp.nearest(lp.Vector(2.5, 3.5), candidates, k=2)
+    assert indices.tolist() == [1, 2]
+    np.testing.assert_allclose(distances, [np.hypot(0.5, 0.5), np.hypot(1.5, 2.5)])
+
+
+def test_errors():
+    candidates = lp.VectorArray(np.zeros((3, 2)))
+    with pytest.raises(TypeError):
+        lp.nearest([0, 0], candidates)
+    with pytest.raises(lp.DimensionsError):
+        lp.nearest(lp.Vector(1, 2, 3), candidates)
+    with pytest.raises(ValueError):
+        lp.nearest(lp.Vector(1, 2), candidates, k=4)
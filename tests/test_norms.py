@@ -0,0 +1,59 @@
+"""
+Vector norms, cached for list storage, against numpy and `math.hypot`
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+import lalgpy as lp
+
+STORAGES = [None, "float64"]
+
+
+@pytest.mark.parametrize("dtype", STORAGES, ids=["list", "numpy"])
+def test_norms_match_numpy(dtype):
+    x = np.random.default_rng(21).standard_normal(50)
+    v = lp.Vector(*x.tolist(), dtype=dtype)
+    for ord in (1, 2, math.inf):
+        assert v.norm(ord) == pytest.approx(np.linalg.norm(x, ord), rel=1e-12)
+    assert v.magnitude == v.norm(2)
+    assert lp.Vector(dtype=dtype).norm() == 0.0
+
+
+def test_components_cannot_make_the_cache_stale():
+    v = lp.Vector(3, 4)
+    assert v.norm() == 5.0
+    v.components[0] = 0
+    assert v.components == [3, 4]
+    assert v.norm() == 5.0
+    assert v.components is not v.components
+
+
+def test_cache_follows_updates():
+    v = lp.Vector(3, 4)
+    assert v.norm() == 5.0 and v.norm(1) == 7.0
+    v *= 2
+    assert v.norm() == 10.0 and v.norm(1) == 14.0
+    v.set_components(6, 8, 0)
+    assert v.norm() == 10.0
+    v.resize(1)
+    assert v.norm() == 6.0
+
+
+@pytest.mark.parametrize("scale", [1e200, 1e-200, 1e-160])
+def test_storages_agree_far_from_one(scale):
+    expected = math.hypot(scale, scale)
+    for dtype in STORAGES:
+        assert lp.Vector(scale, scale, dtype=dtype).norm() == pytest.approx(expected, rel=1e-15)
+        assert lp.Vector(scale, scale, dtype=dtype).normalize().norm() == pytest.approx(1)
+
+
+def test_scaled_norm_of_other_types():
+    assert lp.Vector(3e30, 4e30, dtype="float32").norm() == pytest.approx(5e30, rel=1e-6)
+    assert lp.Vector(3e200j, 4e200, dtype="complex128").norm() == pytest.approx(5e200)
+    assert lp.Vector(3, 4, dtype="int64").norm() == 5.0
+    assert lp.Vector(math.inf, 1.0, dtype="float64").norm() == math.inf
+    assert math.isnan(lp.Vector(math.nan, 1.0, dtype="float64").norm())
+    assert lp.Vector(0.0, 0.0, dtype="float64").norm() == 0.0
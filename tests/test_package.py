@@ -0,0 +1,20 @@
+"""
+The names `lalgpy` exports
+"""
+
+import types
+
+import lalgpy as lp
+
+
+def test_no_leaked_imports():
+    modules = {name for name in dir(lp) if isinstance(getattr(lp, name), types.ModuleType)}
+    assert modules == set(lp.__all__)
+    for name in ("np", "math", "pickle", "mmap", "operator", "contextmanager", "ProcessPoolExecutor", "shared_memory"):
+        assert not hasattr(lp, name)
+
+
+def test_public_names():
+    for name in ("Vector", "VectorArray", "nearest", "Matrix", "SparseMatrix", "Matrix3", "Matrix4", "multi_dot",
+                 "set_backend", "lazy", "cg", "KDTree", "Expression", "array_add", "DimensionsError"):
+        assert hasattr(lp, name)
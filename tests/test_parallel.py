@@ -0,0 +1,77 @@
+"""
+Matrix products split over thread and process pools, against numpy
+"""
+
+import numpy as np
+import pytest
+
+import lalgpy as lp
+from lalgpy import matrices
+
+rng = np.random.default_rng(13)
+# Large enough for the 64×64×64 threshold above which products are split
+M, N, P = 70, 66, 68
+
+
+def matrix(data):
+    return lp.Matrix(*data.tolist())
+
+
+def spy(monkeypatch, name):
+    calls = []
+    original = getattr(matrices, name)
+    def wrapper(*args):
+        calls.append(args[-1])
+        return original(*args)
+    monkeypatch.setattr(matrices, name, wrapper)
+    return calls
+
+
+@pytest.mark.parametrize("kind", ["int", "float"])
+@pytest.mark.parametrize("workers", [1, 2, 3])
+def test_threaded_matmul(monkeypatch, kind, workers):
+    calls = spy(monkeypatch, "_threaded_matmul")
+    if kind == "int":
+        A, B = rng.integers(-50, 50, (M, N)), rng.integers(-50, 50, (N, P))
+    else:
+        A, B = rng.standard_normal((M, N)), rng.standard_normal((N, P))
+    product = matrix(A).matmul(matrix(B), workers=workers)
+    expected = A @ B
+    if kind == "int":
+        assert product.components == expected.tolist()
+    else:
+        np.testing.assert_allclose(np.array(product.components), expected, rtol=1e-12)
+    assert calls == ([] if workers == 1 else [workers])
+
+
+def test_threaded_matmul_into_out():
+    A, B = rng.standard_normal((M, N)), rng.standard_normal((N, P))
+    out = matrix(np.zeros((M, P)))
+    assert matrix(A).matmul(matrix(B), out=out, workers=4) is out
+    np.testing.assert_allclose(np.array(out.components), A @ B, rtol=1e-12)
+
+
+def test_process_matmul_big_integers(monkeypatch):
+    calls = spy(monkeypatch, "_process_matmul")
+    A = [[2**70 + i - j for j in range(N)] for i in range(M)]
+    B = [[(i*j) % 7 - 3 for j in range(P)] for i in range(N)]
+    expected = [[sum(a*b for a, b in zip(row, column)) for column in zip(*B)] for row in A]
+    assert lp.Matrix(*A).matmul(lp.Matrix(*B), workers=2).components == expected
+    assert calls == [2]
+
+
+def test_global_thread_count():
+    A, B = rng.standard_normal((M, N)), rng.standard_normal((N, P))
+    with lp.num_threads(2):
+        assert lp.get_num_threads() == 2
+        product = matrix(A)*matrix(B)
+    np.testing.assert_allclose(np.array(product.components), A @ B, rtol=1e-12)
+
+
+@pytest.mark.parametrize("workers", [0, -1, 1.5, True])
+def test_invalid_workers(workers):
+    A = matrix(rng.standard_normal((M, N)))
+    with pytest.raises(ValueError):
+        A.matmul(matrix(rng.standard_normal((N, P))), workers=workers)
+    with pytest.raises(ValueError):
+        lp.set_num_threads(0)
@@ -0,0 +1,109 @@
+"""
+The binary format of `Vector` and `Matrix`, in memory and in files
+"""
+
+import numpy as np
+import pytest
+
+import lalgpy as lp
+from lalgpy import serialization
+
+VECTORS = {
+    "int": lambda: lp.Vector(1, -2, 3, 2**40),
+    "float": lambda: lp.Vector(1.5, -2.25, 3.0),
+    "mixed": lambda: lp.Vector(1, 2.5, -3),
+    "empty": lambda: lp.Vector(),
+}
+
+MATRICES = {
+    "int": lambda: lp.Matrix([1, -2, 3], [4, 5, 2**40]),
+    "float": lambda: lp.Matrix([1.5, -2.25], [3.0, 0.125], [7.0, -1e300]),
+}
+
+
+@pytest.mark.parametrize("kind", VECTORS)
+def test_vector_round_trip(tmp_path, kind):
+    v = VECTORS[kind]()
+    data = v.to_bytes()
+    assert len(data) == serialization.HEADER_SIZE + 8*v.dimensions
+    for buffer in (data, bytearray(data), memoryview(data)):
+        assert lp.Vector.from_bytes(buffer) == v
+    path = tmp_path/"v.lalg"
+    v.save(path)
+    assert path.read_bytes() == data
+    for mode in (None, "r", "r+", "c"):
+        assert lp.Vector.load(path, mmap_mode=mode) == v
+
+
+@pytest.mark.parametrize("kind", MATRICES)
+def test_matrix_round_trip(tmp_path, kind):
+    M = MATRICES[kind]()
+    data = M.to_bytes()
+    rows, cols = M.dimensions
+    assert len(data) == serialization.HEADER_SIZE + 8*rows*cols
+    assert lp.Matrix.from_bytes(data) == M
+    path = tmp_path/"m.lalg"
+    M.save(path)
+    for mode in (None, "r", "r+", "c"):
+        assert lp.Matrix.load(path, mmap_mode=mode) == M
+
+
+def test_mmap_modes(tmp_path):
+    path = tmp_path/"m.lalg"
+    original = lp.Matrix([1.0, 2.0], [3.0, 4.0])
+    original.save(path)
+    copy = lp.Matrix.load(path, mmap_mode="c")
+    copy += lp.Matrix([1, 1], [1, 1])
+    assert copy == lp.Matrix([2.0, 3.0], [4.0, 5.0])
+    assert lp.Matrix.load(path) == original
+    read_only = lp.Matrix.load(path, mmap_mode="r")
+    read_only += lp.Matrix([1, 1], [1, 1])
+    assert read_only == lp.Matrix([2.0, 3.0], [4.0, 5.0])
+    assert lp.Matrix.load(path) == original
+    shared = lp.Matrix.load(path, mmap_mode="r+")
+    shared *= 10
+    del shared
+    assert lp.Matrix.load(path) == original*10
+
+
+def test_big_endian_elements():
+    data = np.array([[1.5, 2.0], [-3.0, 4.25]], dtype=">f8")
+    buffer = serialization.header(data) + data.tobytes()
+    M = lp.Matrix.from_bytes(buffer)
+    assert M.components == [[1.5, 2.0], [-3.0, 4.25]]
+
+
+def test_wrong_rank(tmp_path):
+    with pytest.raises(lp.DimensionsError):
+        lp.Vector.from_bytes(lp.Matrix([1, 2], [3, 4]).to_bytes())
+    with pytest.raises(lp.DimensionsError):
+        lp.Matrix.from_bytes(lp.Vector(1, 2).to_bytes())
+    path = tmp_path/"v.lalg"
+    lp.Vector(1, 2).save(path)
+    with pytest.raises(lp.DimensionsError):
+        lp.Matrix.load(path)
+    with pytest.raises(lp.DimensionsError):
+        lp.Matrix.load(path, mmap_mode="r")
+
+
+def test_bad_headers(tmp_path):
+    data = lp.Vector(1.0, 2.0).to_bytes()
+    corrupted = {
+        "short": data[:10],
+        "magic": b"NOPE" + data[4:],
+        "version": data[:4] + bytes([99]) + data[5:],
+        "truncated": data[:-1],
+    }
+    for buffer in corrupted.values():
+        with pytest.raises(ValueError):
+            lp.Vector.from_bytes(buffer)
+    path = tmp_path/"bad.lalg"
+    path.write_bytes(corrupted["magic"])
+    with pytest.raises(ValueError):
+        lp.Vector.load(path)
+    with pytest.raises(ValueError):
+        lp.Vector.load(path, mmap_mode="r")
+    with pytest.raises(ValueError):
+        lp.Vector.load(path, mmap_mode="w")
+    with pytest.raises(TypeError):
+        lp.Vector(2**70).to_bytes()
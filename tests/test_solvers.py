@@ -0,0 +1,123 @@
+"""
+Iterative solvers against `numpy.linalg.solve`
+"""
+
+import numpy as np
+import pytest
+
+import lalgpy as lp
+
+N = 30
+
+
+def matrix(data):
+    return lp.Matrix(*data.tolist())
+
+
+def values(x):
+    return np.array(x.components)
+
+
+def poisson(n):
+    """
+    The 1-D Poisson matrix, tridiagonal (-1, 2, -1), symmetric positive definite
+    """
+    dense = 2*np.eye(n) - np.eye(n, k=1) - np.eye(n, k=-1)
+    return lp.SparseMatrix.from_matrix(matrix(dense))
+
+
+rng = np.random.default_rng(11)
+DOMINANT = rng.random((N, N)) + N*np.eye(N)
+SPD = DOMINANT @ DOMINANT.T
+B = rng.random(N)
+
+
+def operators(data):
+    A = matrix(data)
+    return {
+        "matrix": A,
+        "sparse": lp.SparseMatrix.from_matrix(A),
+        "callable": lambda v: (data @ values(v)).tolist(),
+    }
+
+
+def check(x, data):
+    assert isinstance(x, lp.Vector)
+    np.testing.assert_allclose(values(x), np.linalg.solve(data, B), rtol=1e-6, atol=1e-9)
+
+
+@pytest.mark.parametrize("kind", ["matrix", "sparse", "callable"])
+def test_cg(kind):
+    check(lp.cg(operators(SPD)[kind], lp.Vector(*B.tolist())), SPD)
+
+
+@pytest.mark.parametrize("kind", ["matrix", "sparse", "callable"])
+def test_gmres(kind):
+    nonsymmetric = DOMINANT + np.triu(rng.random((N, N)))
+    check(lp.gmres(operators(nonsymmetric)[kind], lp.Vector(*B.tolist()), restart=10), nonsymmetric)
+
+
+@pytest.mark.parametrize("kind", ["matrix", "sparse"])
+def test_jacobi_and_gauss_seidel(kind):
+    A = operators(DOMINANT)[kind]
+    b = lp.Vector(*B.tolist())
+    check(lp.jacobi(A, b), DOMINANT)
+    check(lp.gauss_seidel(A, b), DOMINANT)
+    check(lp.gauss_seidel(A, b, omega=1.2), DOMINANT)
+    check(lp.jacobi(operators(DOMINANT)["callable"], b, diagonal=np.diag(DOMINANT).tolist()), DOMINANT)
+
+
+def test_preconditioners_and_callback():
+    A = poisson(N)
+    b = lp.Vector(*B.tolist())
+    expected = np.linalg.solve(values(A.to_matrix()), B)
+    residuals = []
+    x = lp.cg(A, b, M=lambda v: (values(v)/2).tolist(), callback=lambda i, r: residuals.append((i, r)))
+    np.testing.assert_allclose(values(x), expected, rtol=1e-6)
+    assert [i for i, _ in residuals] == list(range(1, len(residuals) + 1))
+    assert residuals[-1][1] <= 1e-8*np.linalg.norm(B)
+    x = lp.gmres(A, b, M=lp.SparseMatrix(range(N), range(N), [0.5]*N, (N, N)))
+    np.testing.assert_allclose(values(x), expected, rtol=1e-6)
+
+
+def test_initial_guess():
+    exact = lp.Vector(*np.linalg.solve(SPD, B).tolist())
+    calls = []
+    x = lp.cg(matrix(SPD), lp.Vector(*B.tolist()), x0=exact, callback=lambda i, r: calls.append(i))
+    assert calls == [] and np.allclose(values(x), values(exact))
+
+
+@pytest.mark.parametrize("solver", [lp.cg, lp.gmres, lp.jacobi, lp.gauss_seidel],
+                         ids=["cg", "gmres", "jacobi", "gauss_seidel"])
+def test_convergence_error_keeps_the_solution(solver):
+    A = poisson(N)
+    b = lp.Vector(*B.tolist())
+    residuals = []
+    with pytest.raises(lp.ConvergenceError) as error:
+        solver(A, b, maxiter=2, callback=lambda i, r: residuals.append(r))
+    solution = error.value.solution
+    assert isinstance(solution, lp.Vector) and solution.dimensions == N
+    assert np.linalg.norm(B - values(A*solution)) == pytest.approx(residuals[-1], rel=1e-6)
+
+
+def test_fixed_sweeps_never_raise():
+    A = poisson(N)
+    b = lp.Vector(*B.tolist())
+    assert lp.jacobi(A, b, tol=None, maxiter=3, omega=2/3).dimensions == N
+    assert lp.gauss_seidel(A, b, tol=None, maxiter=3).dimensions == N
+
+
+def test_errors():
+    A = matrix(DOMINANT)
+    with pytest.raises(TypeError):
+        lp.cg(A, B.tolist())
+    with pytest.raises(lp.DimensionsError):
+        lp.cg(A, lp.Vector(1, 2))
+    with pytest.raises(lp.DimensionsError):
+        lp.gmres(A, lp.Vector(*B.tolist()), x0=lp.Vector(1, 2))
+    with pytest.raises(TypeError):
+        lp.jacobi(lambda v: v, lp.Vector(1, 2))
+    with pytest.raises(TypeError):
+        lp.gauss_seidel(lambda v: v, lp.Vector(1, 2))
+    with pytest.raises(lp.SingularMatrixError):
+        lp.jacobi(lp.Matrix([0, 1], [1, 0]), lp.Vector(1, 2))
@@ -0,0 +1,117 @@
+"""
+`SparseMatrix` against the same operations on dense arrays
+"""
+
+import numpy as np
+import pytest
+
+import lalgpy as lp
+
+
+def random_sparse(rng, shape, density=0.3, integer=False):
+    dense = rng.random(shape)
+    dense[rng.random(shape) > density] = 0
+    if integer:
+        dense = np.round(dense*10).astype(np.int64)
+    rows, cols = np.nonzero(dense)
+    return lp.SparseMatrix(rows, cols, dense[rows, cols], shape), dense
+
+
+def matrix(data):
+    return lp.Matrix(*data.tolist())
+
+
+def values(x):
+    return np.array(x.components)
+
+
+@pytest.fixture(params=[False, True], ids=["float", "int"])
+def operands(request):
+    rng = np.random.default_rng(10)
+    A, a = random_sparse(rng, (5, 4), integer=request.param)
+    B, b = random_sparse(rng, (5, 4), integer=request.param)
+    return A, a, B, b, rng
+
+
+def test_construction():
+    A = lp.SparseMatrix([0, 2, 2, 0], [1, 0, 0, 1], [1.5, 2, 3, -1.5], (3, 2))
+    assert A.dimensions == (3, 2)
+    assert A.nnz == 1
+    assert A.components == [[0, 0], [0, 0], [5, 0]]
+    assert A.diagonal() == [0, 0]
+    np.testing.assert_array_equal(values(A.to_matrix()), [[0, 0], [0, 0], [5, 0]])
+    dense = lp.Matrix([0, 1, 0], [2, 0, 3])
+    B = lp.SparseMatrix.from_matrix(dense)
+    assert B.nnz == 3 and B.to_matrix() == dense
+    assert B == lp.SparseMatrix([1, 0, 1], [2, 1, 0], [3, 1, 2], (2, 3))
+
+
+def test_equality_with_dense():
+    A = lp.SparseMatrix([0], [0], [1.0], (2, 2))
+    assert A == lp.Matrix([1.0, 0], [0, 0]) and lp.Matrix([1, 0], [0, 0]) == A
+    assert not A != lp.Matrix([1.0, 0], [0, 0]) and not lp.Matrix([1.0, 0], [0, 0]) != A
+    assert A != lp.Matrix([2.0, 0], [0, 0]) and lp.Matrix([1.0, 0], [0, 3]) != A
+    assert A != lp.Matrix([1.0, 0, 0], [0, 0, 0])
+    assert A != lp.SparseMatrix([1], [1], [1.0], (2, 2))
+    with lp.lazy():
+        doubled = lp.Matrix([1.0, 0], [0, 0])*2
+    assert A*2 == doubled
+    for other in (None, 1, [[1.0, 0], [0, 0]]):
+        assert not A == other and A != other
+
+
+def test_add_sub(operands):
+    A, a, B, b, _ = operands
+    assert isinstance(A + B, lp.SparseMatrix)
+    np.testing.assert_allclose(values((A + B).to_matrix()), a + b)
+    np.testing.assert_allclose(values((A - B).to_matrix()), a - b)
+    np.testing.assert_allclose(values((A - A).to_matrix()), 0)
+    D = matrix(b)
+    for result, expected in ((A + D, a + b), (D + A, a + b), (A - D, a - b), (D - A, b - a)):
+        assert isinstance(result, lp.Matrix)
+        np.testing.assert_allclose(values(result), expected)
+
+
+def test_multiplication(operands):
+    A, a, _, b, rng = operands
+    np.testing.assert_allclose(values((A*3).to_matrix()), a*3)
+    x = rng.random(4)
+    product = A*lp.Vector(*x.tolist())
+    assert isinstance(product, lp.Vector)
+    np.testing.assert_allclose(values(product), a @ x)
+    right = rng.random((4, 3))
+    np.testing.assert_allclose(values(A*matrix(right)), a @ right)
+    left = rng.random((2, 5))
+    np.testing.assert_allclose(values(matrix(left)*A), left @ a)
+
+
+def test_transpose(operands):
+    A, a, *_ = operands
+    T = A.transpose()
+    assert T.dimensions == (4, 5)
+    np.testing.assert_array_equal(values(T.to_matrix()), a.T)
+    assert T.transpose() == A
+
+
+def test_empty_rows_and_matrix():
+    A = lp.SparseMatrix([], [], [], (3, 3))
+    assert A.nnz == 0
+    assert (A*lp.Vector(1, 2, 3)).components == [0, 0, 0]
+    B = lp.SparseMatrix([2], [2], [4.0], (3, 3))
+    assert (B*lp.Vector(1, 2, 3)).components == [0, 0, 12.0]
+
+
+def test_errors():
+    A = lp.SparseMatrix([0], [0], [1.0], (2, 2))
+    with pytest.raises(lp.DimensionsError):
+        lp.SparseMatrix([0, 2], [0, 0], [1, 1], (2, 2))
+    with pytest.raises(lp.DimensionsError):
+        lp.SparseMatrix([0, 1], [0], [1, 1], (2, 2))
+    with pytest.raises(TypeError):
+        lp.SparseMatrix([0], [0], ["a"], (2, 2))
+    with pytest.raises(TypeError):
+        lp.SparseMatrix.from_matrix([[1, 0], [0, 1]])
+    with pytest.raises(lp.DimensionsError):
+        A + lp.SparseMatrix([0], [0], [1.0], (3, 3))
+    with pytest.raises(lp.DimensionsError):
+        A*lp.Vector(1, 2, 3)
@@ -0,0 +1,96 @@
+"""
+`KDTree` against a brute-force search
+"""
+
+import numpy as np
+import pytest
+
+import lalgpy as lp
+
+
+def distances_to(points, q):
+    return np.sqrt(((points - q)**2).sum(axis=1))
+
+
+def check_query(tree, points, q, k):
+    indices, distances = tree.query(lp.Vector(*q.tolist()), k)
+    expected = np.sort(distances_to(points, q))[:k]
+    np.testing.assert_allclose(distances, expected, rtol=1e-12)
+    np.testing.assert_allclose(distances_to(points[indices], q), distances, rtol=1e-12)
+    assert len(set(indices.tolist())) == k
+
+
+def check_radius(tree, points, q, r):
+    indices, distances = tree.query_radius(lp.Vector(*q.tolist()), r)
+    all_distances = distances_to(points, q)
+    assert sorted(indices.tolist()) == np.nonzero(all_distances <= r)[0].tolist()
+    np.testing.assert_allclose(distances, np.sort(all_distances[all_distances <= r]), rtol=1e-12)
+
+
+@pytest.mark.parametrize("dimensions", [1, 2, 5])
+@pytest.mark.parametrize("offset", [0.0, 1e8], ids=["origin", "far"])
+def test_query_matches_brute_force(dimensions, offset):
+    rng = np.random.default_rng(dimensions)
+    points = offset + rng.random((500, dimensions))*10
+    tree = lp.KDTree(lp.VectorArray(points), leaf_size=8)
+    assert len(tree) == 500 and tree.dimensions == dimensions
+    for q in offset + rng.random((20, dimensions))*10:
+        for k in (1, 7, 500):
+            check_query(tree, points, q, k)
+        check_radius(tree, points, q, 2.5)
+
+
+def test_batched_query_matches_nearest():
+    rng = np.random.default_rng(0)
+    points, queries = lp.VectorArray(rng.random((300, 3))), lp.VectorArray(rng.random((10, 3)))
+    indices, distances = lp.KDTree(points).query(queries, 4)
+    expected_indices, expected_distances = lp.nearest(queries, points, 4)
+    assert indices.shape == (10, 4)
+    np.testing.assert_array_equal(indices, expected_indices)
+    np.testing.assert_allclose(distances, expected_distances, rtol=1e-12)
+
+
+def test_duplicates_and_clusters():
+    points = np.vstack([np.zeros((100, 2)), np.ones((100, 2)), [[0.5, 0.5]]])
+    tree = lp.KDTree(lp.VectorArray(points), leaf_size=4)
+    check_query(tree, points, np.array([0.4, 0.4]), 3)
+    check_query(tree, points, np.array([0.1, 0.0]), 150)
+    check_radius(tree, points, np.array([0.5, 0.5]), 0.8)
+
+
+def test_insert_matches_brute_force():
+    rng = np.random.default_rng(22)
+    points = rng.random((50, 3))
+    tree = lp.KDTree([lp.Vector(*p) for p in points.tolist()], leaf_size=4)
+    for batch in range(6):
+        new = rng.random((40, 3)) + batch*0.2
+        if batch % 2:
+            tree.insert(lp.VectorArray(new))
+        else:
+            for p in new.tolist():
+                tree.insert(lp.Vector(*p))
+        points = np.vstack([points, new])
+        assert len(tree) == len(points)
+        for q in rng.random((5, 3))*2:
+            check_query(tree, points, q, 5)
+            check_radius(tree, points, q, 0.3)
+    indices, distances = tree.query(lp.Vector(*points[-1].tolist()))
+    assert indices.tolist() == [len(points) - 1] and distances.tolist() == [0.0]
+
+
+def test_errors():
+    tree = lp.KDTree(lp.VectorArray(np.random.default_rng(0).random((10, 2))))
+    with pytest.raises(ValueError):
+        lp.KDTree(lp.VectorArray(np.zeros((3, 2))), leaf_size=0)
+    with pytest.raises(ValueError):
+        tree.query(lp.Vector(0, 0), k=11)
+    with pytest.raises(ValueError):
+        tree.query_radius(lp.Vector(0, 0), -1)
+    with pytest.raises(lp.DimensionsError):
+        tree.query(lp.Vector(0, 0, 0))
+    with pytest.raises(lp.DimensionsError):
+        tree.insert(lp.Vector(0, 0, 0))
+    with pytest.raises(TypeError):
+        tree.query([0, 0])
+    with pytest.raises(TypeError):
+        tree.insert([0, 0])
@@ -0,0 +1,93 @@
+"""
+`VectorArray` against the same operations on `Vector` and numpy
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+import lalgpy as lp
+
+rng = np.random.default_rng(3)
+FIRST = rng.standard_normal((20, 3))
+SECOND = rng.standard_normal((20, 3))
+
+
+def vectors(rows):
+    return [lp.Vector(*row) for row in rows.tolist()]
+
+
+def test_from_and_to_vectors():
+    array = lp.VectorArray.from_vectors(vectors(FIRST))
+    assert len(array) == 20 and array.dimensions == 3
+    np.testing.assert_array_equal(np.array(array.components), FIRST)
+    back = array.to_vectors()
+    assert all(isinstance(v, lp.Vector) for v in back)
+    assert [v.components for v in back] == FIRST.tolist()
+    assert [v.components for v in array] == FIRST.tolist()
+    assert array[3].components == FIRST[3].tolist()
+    assert array[2:5] == lp.VectorArray(FIRST[2:5])
+    assert lp.VectorArray.from_vectors(vectors(FIRST)) == array
+    assert len(lp.VectorArray.from_vectors([])) == 0
+
+
+def test_dot_matches_vector():
+    a1, a2 = lp.VectorArray(FIRST), lp.VectorArray(SECOND)
+    expected = [lp.Vector.dot(v1, v2) for v1, v2 in zip(vectors(FIRST), vectors(SECOND))]
+    np.testing.assert_allclose(lp.VectorArray.dot(a1, a2), expected, rtol=1e-12)
+    single = lp.Vector(1, 2, 3)
+    np.testing.assert_allclose(lp.VectorArray.dot(a1, single), FIRST @ [1, 2, 3])
+    np.testing.assert_allclose(lp.VectorArray.dot(single, a1), FIRST @ [1, 2, 3])
+
+
+def test_cross_matches_vector():
+    result = lp.VectorArray.cross(lp.VectorArray(FIRST), lp.VectorArray(SECOND))
+    assert isinstance(result, lp.VectorArray)
+    expected = [lp.Vector.cross(v1, v2).components for v1, v2 in zip(vectors(FIRST), vectors(SECOND))]
+    np.testing.assert_allclose(np.array(result.components), expected, rtol=1e-12, atol=1e-15)
+    single = lp.VectorArray.cross(lp.Vector(1, 0, 0), lp.VectorArray(FIRST))
+    np.testing.assert_allclose(np.array(single.components), np.cross([1, 0, 0], FIRST))
+
+
+@pytest.mark.parametrize("rad", [True, False])
+def test_get_angle_matches_vector(rad):
+    angles = lp.VectorArray.get_angle(lp.VectorArray(FIRST), lp.VectorArray(SECOND), rad=rad)
+    expected = [lp.Vector.get_angle(v1, v2, rad=rad) for v1, v2 in zip(vectors(FIRST), vectors(SECOND))]
+    np.testing.assert_allclose(angles, expected, rtol=1e-9)
+    same = lp.VectorArray.get_angle(lp.VectorArray(FIRST), lp.VectorArray(FIRST*2), rad=rad)
+    np.testing.assert_allclose(same, 0, atol=1e-6)
+
+
+def test_arithmetic_and_magnitude():
+    a1, a2 = lp.VectorArray(FIRST), lp.VectorArray(SECOND)
+    np.testing.assert_allclose(np.array((a1 + a2).components), FIRST + SECOND)
+    np.testing.assert_allclose(np.array((a1 - lp.Vector(1, 2, 3)).components), FIRST - [1, 2, 3])
+    np.testing.assert_allclose(np.array((a1*2).components), FIRST*2)
+    np.testing.assert_allclose(np.array((a1/4).components), FIRST/4)
+    np.testing.assert_allclose(np.array((a1//0.5).components), FIRST//0.5)
+    np.testing.assert_allclose(a1.magnitude, np.linalg.norm(FIRST, axis=1))
+    np.testing.assert_allclose(a1.normalize().magnitude, 1)
+
+
+def test_errors():
+    a1 = lp.VectorArray(FIRST)
+    with pytest.raises(TypeError):
+        lp.VectorArray([["a", "b"]])
+    with pytest.raises(lp.DimensionsError):
+        lp.VectorArray([1, 2, 3])
+    with pytest.raises(TypeError):
+        lp.VectorArray.from_vectors([lp.Vector(1, 2), (1, 2)])
+    with pytest.raises(lp.DimensionsError):
+        lp.VectorArray.from_vectors([lp.Vector(1, 2), lp.Vector(1, 2, 3)])
+    with pytest.raises(lp.DimensionsError):
+        lp.VectorArray.dot(a1, lp.VectorArray(SECOND[:5]))
+    with pytest.raises(lp.DimensionsError):
+        lp.VectorArray.cross(lp.VectorArray(FIRST[:, :2]), lp.VectorArray(SECOND[:, :2]))
+    with pytest.raises(TypeError):
+        lp.VectorArray.dot(a1, FIRST)
+    with pytest.raises(ZeroDivisionError):
+        lp.VectorArray.get_angle(a1, lp.VectorArray(np.zeros((20, 3))))
+    with pytest.raises(TypeError):
+        a1*lp.Vector(1, 2, 3)
+    assert math.isclose(lp.VectorArray.get_angle(lp.Vector(1, 0), lp.Vector(0, 1)), math.pi/2)
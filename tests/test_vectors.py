@@ -0,0 +1,58 @@
+"""
+In-place operators of `Vector`
+"""
+
+import tracemalloc
+
+import numpy as np
+import pytest
+
+import lalgpy as lp
+
+
+def test_in_place_writes_into_the_buffer():
+    data = np.arange(5.0)
+    v = lp.Vector.from_numpy(data)
+    v += lp.Vector(1, 1, 1, 1, 1)
+    v -= lp.Vector.from_numpy(np.full(5, 0.5))
+    v *= 2
+    assert np.shares_memory(np.asarray(v), data)
+    np.testing.assert_array_equal(data, [1, 3, 5, 7, 9])
+
+
+def test_in_place_does_not_allocate():
+    v, other = lp.Vector.from_numpy(np.zeros(10**6)), lp.Vector.from_numpy(np.ones(10**6))
+    tracemalloc.start()
+    try:
+        v += other
+        v -= other
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    assert peak < 10**5
+
+
+@pytest.mark.parametrize("update, expected", [
+    (lambda v: v.__itruediv__(2), [0.0, 0.5, 1.0]),
+    (lambda v: v.__imul__(2.5), [0.0, 2.5, 5.0]),
+    (lambda v: v.__iadd__(lp.Vector(0.5, 0, 0)), [0.5, 1.0, 2.0]),
+], ids=["truediv", "mul", "add"])
+def test_in_place_promotes(update, expected):
+    data = np.arange(3)
+    v = lp.Vector.from_numpy(data)
+    assert update(v) is v
+    assert v.components == expected
+    np.testing.assert_array_equal(data, [0, 1, 2])
+
+
+def test_in_place_read_only_and_lists():
+    data = np.arange(3.0)
+    data.flags.writeable = False
+    v = lp.Vector.from_numpy(data)
+    v += lp.Vector(1, 1, 1)
+    assert v.components == [1.0, 2.0, 3.0]
+    np.testing.assert_array_equal(data, [0, 1, 2])
+    w = lp.Vector(1, 2, 3)
+    w += lp.Vector.from_numpy(np.ones(3))
+    w -= lp.Vector(1, 0, 0)
+    assert w.components == [1.0, 3.0, 4.0]
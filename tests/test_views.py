@@ -0,0 +1,90 @@
+"""
+`Matrix.T`, `row()`, `col()` and indexing views, copy-on-write
+"""
+
+import numpy as np
+import pytest
+
+import lalgpy as lp
+
+
+def values(x):
+    return np.array(x.components)
+
+
+def test_views_match_numpy():
+    data = np.arange(12.0).reshape(3, 4)
+    M = lp.Matrix.from_numpy(data, copy=True)
+    np.testing.assert_array_equal(values(M.T), data.T)
+    assert M.row(1).components == data[1].tolist()
+    assert M.col(2).components == data[:, 2].tolist()
+    assert M[2].components == data[2].tolist()
+    assert M[:, 3].components == data[:, 3].tolist()
+    np.testing.assert_array_equal(values(M[1:, ::2]), data[1:, ::2])
+    assert M[1, 2] == data[1, 2]
+    assert M.T.T == M
+
+
+def test_parent_stays_writable():
+    M = lp.Matrix([1.0, 2.0], [3.0, 4.0])
+    buffer = np.asarray(M)
+    views = [M.T, M.row(0), M.col(1), M[0], M[:, :1]]
+    assert np.asarray(M).flags.writeable
+    M += lp.Matrix([1, 1], [1, 1])
+    M *= 2
+    assert np.shares_memory(np.asarray(M), buffer)
+    assert M == lp.Matrix([4.0, 6.0], [8.0, 10.0])
+    assert views[0] == lp.Matrix([4.0, 8.0], [6.0, 10.0])
+
+
+def test_views_see_the_parent():
+    M = lp.Matrix([1.0, 2.0], [3.0, 4.0])
+    T, row, col = M.T, M.row(0), M.col(1)
+    M += lp.Matrix([10, 10], [10, 10])
+    assert T == lp.Matrix([11.0, 13.0], [12.0, 14.0])
+    assert row.components == [11.0, 12.0]
+    assert col.components == [12.0, 14.0]
+
+
+def test_writing_to_a_view_copies():
+    M = lp.Matrix([1.0, 2.0], [3.0, 4.0])
+    T, row, block = M.T, M.row(0), M[:1, :]
+    T *= 10
+    row += lp.Vector(1.0, 1.0)
+    block -= lp.Matrix([1, 1])
+    assert M == lp.Matrix([1.0, 2.0], [3.0, 4.0])
+    assert T == lp.Matrix([10.0, 30.0], [20.0, 40.0])
+    assert row.components == [2.0, 3.0]
+    assert block == lp.Matrix([0.0, 1.0])
+    with pytest.raises(ValueError):
+        np.asarray(M.T)[0, 0] = 0
+
+
+def test_shared_numpy_source_stays_attached():
+    source = np.array([[1.0, 2.0], [3.0, 4.0]])
+    M = lp.Matrix.from_numpy(source)
+    row = M.row(0)
+    M *= 2
+    np.testing.assert_array_equal(source, [[2.0, 4.0], [6.0, 8.0]])
+    source[0, 0] = 0
+    assert M[0, 0] == 0
+    assert row.components == [0.0, 4.0]
+
+
+def test_view_factorizations_follow_the_parent():
+    M = lp.Matrix([2.0, 1.0], [1.0, 3.0])
+    T = M.T
+    assert T.det() == pytest.approx(5)
+    M += lp.Matrix([8, 0], [0, 0])
+    assert T.det() == pytest.approx(29)
+    assert M.det() == pytest.approx(29)
+
+
+def test_memmap_views_write_through(tmp_path):
+    path = str(tmp_path/"m.npy")
+    np.save(path, np.zeros((2, 3)))
+    M = lp.Matrix.open_memmap(path)
+    row = M.row(1)
+    row += lp.Vector(1.0, 2.0, 3.0)
+    M.flush()
+    np.testing.assert_array_equal(np.load(path), [[0, 0, 0], [1, 2, 3]])
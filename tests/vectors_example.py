@@ -1,4 +1,4 @@
-import linepy as lp
+import lalgpy as lp
 
 v1 = lp.Vector(1, 2, 3)
 # Initiallize a vector named v1 with component 1, 2, 3
@@ -118,7 +118,7 @@ print("The angle between v1 and v2 is: ", lp.Vector.get_angle(v1, v2))
 # To get on degrees, do this
 print("deg: ", lp.Vector.get_angle(v1, v2, rad=False))
 
-print("The direction of v1 is: ", lp.Vector.get_angle(v1, lp.Vector(1, 0)))
+print("The direction of v1 is: ", lp.Vector.get_angle(v1, lp.Vector(1, 0, 0)))
 # You can get the direction by getting the angle between a vector 
 # and a basis vector of your choice 
 